@@ -0,0 +1,108 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare careBT variables with blackboard variables on deep trees.
+
+Builds a chain of nested sequences where each sequence forwards a list of
+variables to its child and the innermost action updates them for some ticks.
+With careBT variables the values are copied across every parent/child
+boundary on each tick, with blackboard variables all nodes share the same
+slots.
+
+Usage: python benchmarks/bench_blackboard.py [depth] [variables] [ticks] [runs]
+"""
+
+import sys
+from time import perf_counter
+
+from carebt.abstractLogger import LogLevel
+from carebt.actionNode import ActionNode
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.nodeStatus import NodeStatus
+from carebt.sequenceNode import SequenceNode
+
+
+def make_tree(depth: int, variables: int, ticks: int, prefix: str) -> type:
+    names = [f'v{i}' for i in range(variables)]
+    in_params = ' '.join(f'?{name}' for name in names)
+    call_params = ' '.join(f'{prefix}{name}' for name in names)
+    signature = f'{in_params} => {in_params}'
+    call_signature = f'{call_params} => {call_params}'
+
+    class IncrementAction(ActionNode):
+
+        def __init__(self, bt_runner):
+            super().__init__(bt_runner, signature)
+
+        def on_init(self) -> None:
+            self._ticks = 0
+
+        def on_tick(self) -> None:
+            for name in names:
+                setattr(self, f'_{name}', getattr(self, f'_{name}') + 1)
+            self._ticks += 1
+            if(self._ticks == ticks):
+                self.set_status(NodeStatus.SUCCESS)
+
+    child = IncrementAction
+    for level in range(depth):
+        def on_init(self, child=child) -> None:
+            self.append_child(child, call_signature)
+
+        def init(self, bt_runner) -> None:
+            SequenceNode.__init__(self, bt_runner, signature)
+
+        child = type(f'Level{level}Sequence', (SequenceNode,),
+                     {'__init__': init, 'on_init': on_init})
+
+    class RootSequence(SequenceNode):
+
+        def __init__(self, bt_runner):
+            super().__init__(bt_runner)
+            for name in names:
+                setattr(self, f'_{name}', 0)
+
+        def on_init(self) -> None:
+            self.append_child(child, call_signature)
+
+    return RootSequence
+
+
+def run(tree: type, variables: int, runs: int) -> float:
+    bt_runner = BehaviorTreeRunner()
+    bt_runner.get_logger().set_log_level(LogLevel.OFF)
+    bt_runner.set_tick_rate_ms(0)
+    for i in range(variables):
+        bt_runner.get_blackboard().set(f'v{i}', 0)
+    start = perf_counter()
+    for _ in range(runs):
+        bt_runner.run(tree)
+    return perf_counter() - start
+
+
+def main() -> None:
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    variables = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    ticks = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    runs = int(sys.argv[4]) if len(sys.argv) > 4 else 100
+    copied = run(make_tree(depth, variables, ticks, '?'), variables, runs)
+    shared = run(make_tree(depth, variables, ticks, '@'), variables, runs)
+    print(f'depth = {depth}, variables = {variables}, ticks = {ticks}, runs = {runs}')
+    print(f'careBT variables:     {copied * 1000 / runs:8.3f} ms/run')
+    print(f'blackboard variables: {shared * 1000 / runs:8.3f} ms/run')
+    print(f'speedup:              {copied / shared:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the tick time of a tree whose log statements are discarded.
+
+Runs a `ParallelNode` with many `SequenceNodes` of single tick actions with
+the default log level `WARN`. Each tick creates, ticks and deletes nodes,
+thus it passes the `trace`, `debug` and `info` statements of the core nodes.
+Reports the mean time of a tick of the fastest run.
+
+Usage: python benchmarks/bench_logging.py [sequences] [length] [runs]
+"""
+
+import sys
+from time import perf_counter
+
+from carebt.actionNode import ActionNode
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.nodeStatus import NodeStatus
+from carebt.parallelNode import ParallelNode
+from carebt.sequenceNode import SequenceNode
+
+
+class IncrementAction(ActionNode):
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?x => ?x')
+
+    def on_tick(self) -> None:
+        self._x += 1
+        self.set_status(NodeStatus.SUCCESS)
+
+
+def make_parallel(sequences: int, length: int) -> type:
+
+    class IncrementSequence(SequenceNode):
+
+        def __init__(self, bt_runner):
+            super().__init__(bt_runner, '?x => ?x')
+
+        def on_init(self) -> None:
+            for _ in range(length):
+                self.append_child(IncrementAction, '?x => ?x')
+
+    class IncrementParallel(ParallelNode):
+
+        def __init__(self, bt_runner):
+            super().__init__(bt_runner, sequences)
+
+        def on_init(self) -> None:
+            for _ in range(sequences):
+                self.add_child(IncrementSequence, '0 => ?x')
+
+    return IncrementParallel
+
+
+def main() -> None:
+    sequences = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    length = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    durations = []
+    for _ in range(runs):
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.start(make_parallel(sequences, length))
+        start = perf_counter()
+        while(not bt_runner.is_done()):
+            bt_runner.tick_once()
+        durations.append((perf_counter() - start) / bt_runner.get_tick_count())
+    print(f'sequences = {sequences}, length = {length}, runs = {runs}')
+    print(f'tick: {min(durations) * 1e6:8.1f} us (best run)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the memory footprint of resident careBT nodes.
+
+Creates many instances of an action node, a running generator action node,
+a sequence node and their execution contexts and reports the allocated bytes per instance, measured
+with tracemalloc.
+
+Usage: python benchmarks/bench_memory.py [instances]
+"""
+
+import sys
+import tracemalloc
+from typing import Callable
+
+from carebt.actionNode import ActionNode
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.contingencyHistoryEntry import ContingencyHistoryEntry
+from carebt.executionContext import ExecutionContext
+from carebt.generatorActionNode import GeneratorActionNode
+from carebt.nodeStatus import NodeStatus
+from carebt.sequenceNode import SequenceNode
+
+
+class AddTwoNumbersAction(ActionNode):
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?x ?y => ?z')
+
+    def on_tick(self) -> None:
+        self._z = self._x + self._y
+        self.set_status(NodeStatus.SUCCESS)
+
+
+class AddTwoNumbersMultiTickAction(GeneratorActionNode):
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?ticks ?x ?y => ?z')
+
+    def on_tick(self):
+        for _ in range(self._ticks):
+            yield
+        self._z = self._x + self._y
+
+
+class AddTwoNumbersSequence(SequenceNode):
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?a ?b => ?c')
+
+    def on_init(self) -> None:
+        self.append_child(AddTwoNumbersAction, '?a ?b => ?c')
+
+
+def measure(create: Callable[[], object], instances: int) -> float:
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    objects = [create() for _ in range(instances)]
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in end.compare_to(start, 'filename'))
+    # exclude the list which keeps the objects alive
+    size -= sys.getsizeof(objects)
+    return size / instances
+
+
+def main() -> None:
+    instances = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    bt_runner = BehaviorTreeRunner()
+    parent = AddTwoNumbersSequence(bt_runner)
+    parent._a = 1
+    parent._b = 2
+
+    def create_sequence() -> SequenceNode:
+        node = AddTwoNumbersSequence(bt_runner)
+        node.on_init()
+        return node
+
+    def create_running_action() -> GeneratorActionNode:
+        node = AddTwoNumbersMultiTickAction(bt_runner)
+        node._ticks = 3
+        node._internal_on_tick()
+        return node
+
+    print(f'instances = {instances}')
+    print('AddTwoNumbersAction:     '
+          + f'{measure(lambda: AddTwoNumbersAction(bt_runner), instances):7.1f} bytes')
+    print('MultiTickAction:         '
+          + f'{measure(create_running_action, instances):7.1f} bytes (running generator)')
+    print('AddTwoNumbersSequence:   '
+          + f'{measure(create_sequence, instances):7.1f} bytes (incl. child context)')
+    print('ExecutionContext:        '
+          + f'{measure(lambda: ExecutionContext(parent, AddTwoNumbersAction, "?a ?b => ?c"), instances):7.1f} bytes')  # noqa: E501
+    print('ContingencyHistoryEntry: '
+          + f'{measure(lambda: ContingencyHistoryEntry("node", NodeStatus.FAILURE, "ERROR", "fix"), instances):7.1f} bytes')  # noqa: E501
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the tick time of a `ParallelNode` with many children.
+
+Most of the children complete with the first tick, a few children keep
+running. Reports the mean time of the following ticks.
+
+Usage: python benchmarks/bench_parallel.py [children] [running] [ticks]
+"""
+
+import sys
+from time import perf_counter
+
+from carebt.abstractLogger import LogLevel
+from carebt.actionNode import ActionNode
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.nodeStatus import NodeStatus
+from carebt.parallelNode import ParallelNode
+
+
+class CountAction(ActionNode):
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?ticks')
+
+    def on_init(self) -> None:
+        self._count = 0
+
+    def on_tick(self) -> None:
+        self._count += 1
+        if(self._count >= self._ticks):
+            self.set_status(NodeStatus.SUCCESS)
+
+
+def make_parallel(children: int, running: int, ticks: int) -> type:
+
+    class ManyChildrenParallel(ParallelNode):
+
+        def __init__(self, bt_runner):
+            super().__init__(bt_runner, children)
+
+        def on_init(self) -> None:
+            for i in range(children):
+                self.add_child(CountAction, str(ticks + 1 if i < running else 1))
+
+    return ManyChildrenParallel
+
+
+def main() -> None:
+    children = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    running = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    ticks = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    bt_runner = BehaviorTreeRunner()
+    bt_runner.get_logger().set_log_level(LogLevel.OFF)
+    bt_runner.start(make_parallel(children, running, ticks))
+    bt_runner.tick_once()
+    start = perf_counter()
+    for _ in range(ticks - 1):
+        bt_runner.tick_once()
+    duration = perf_counter() - start
+    print(f'children = {children}, running = {running}, ticks = {ticks}')
+    print(f'tick: {duration * 1e6 / (ticks - 1):8.1f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -14,33 +14,67 @@
 
 from carebt.abstractLogger import AbstractLogger
 from carebt.abstractLogger import LogLevel
+from carebt.abstractRunner import AbstractRunner
 from carebt.actionNode import ActionNode
+from carebt.asyncActionNode import AsyncActionNode
+from carebt.asyncBehaviorTreeRunner import AsyncBehaviorTreeRunner
 from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.blackboard import Blackboard
+from carebt.bufferedLogger import BufferedLogger
+from carebt.clock import AbstractClock
+from carebt.clock import RealTimeClock
+from carebt.clock import VirtualClock
 from carebt.contingencyHistoryEntry import ContingencyHistoryEntry
 from carebt.controlNode import ControlNode
 from carebt.executionContext import ExecutionContext
 from carebt.fallbackNode import FallbackNode
+from carebt.futureActionNode import FutureActionNode
+from carebt.generatorActionNode import GeneratorActionNode
+from carebt.multiTreeRunner import MultiTreeRunner
 from carebt.nodeStatus import NodeStatus
 from carebt.parallelNode import ParallelNode
+from carebt.processActionNode import ProcessActionNode
 from carebt.rateControlNode import RateControlNode
 from carebt.rootNode import RootNode
 from carebt.sequenceNode import SequenceNode
+from carebt.shardedTreeRunner import ShardedTreeHandle
+from carebt.shardedTreeRunner import ShardedTreeRunner
 from carebt.simplePrintLogger import SimplePrintLogger
+from carebt.tickPolicy import TickPolicy
+from carebt.timerService import TimerHandle
+from carebt.timerService import TimerService
 from carebt.treeNode import TreeNode
 
 __all__ = ['AbstractLogger',
            'LogLevel',
+           'AbstractRunner',
            'ActionNode',
+           'AsyncActionNode',
+           'AsyncBehaviorTreeRunner',
            'BehaviorTreeRunner',
+           'Blackboard',
+           'BufferedLogger',
+           'AbstractClock',
+           'RealTimeClock',
+           'VirtualClock',
            'ContingencyHistoryEntry',
            'ControlNode',
            'ExecutionContext',
            'FallbackNode',
+           'FutureActionNode',
+           'GeneratorActionNode',
+           'MultiTreeRunner',
            'NodeStatus',
            'ParallelNode',
+           'ProcessActionNode',
            'RateControlNode',
            'RootNode',
            'SequenceNode',
+           'ShardedTreeHandle',
+           'ShardedTreeRunner',
            'SimplePrintLogger',
+           'TickPolicy',
+           'TimerHandle',
+           'TimerService',
            'TreeNode',
            ]
@@ -42,6 +42,41 @@ class AbstractLogger(ABC):
     def set_log_level(self, log_level: LogLevel):
         self._log_level = log_level
 
+    def get_log_level(self) -> LogLevel:
+        """Return the log level.
+
+        Returns
+        -------
+        LogLevel
+            The log level
+
+        """
+        return self._log_level
+
+    def is_enabled(self, log_level: LogLevel) -> bool:
+        """Return whether statements with the provided log level are logged.
+
+        Allows to skip building the message of a statement which would be
+        discarded, e.g.:
+
+        ``if(logger.is_enabled(LogLevel.DEBUG)): logger.debug(f'...')``
+
+        A custom logger which filters the statements in a different way
+        should override this method.
+
+        Parameters
+        ----------
+        log_level: LogLevel
+            The log level of the statement
+
+        Returns
+        -------
+        bool
+            True, if statements with the provided log level are logged
+
+        """
+        return self._log_level <= log_level
+
     @abstractmethod
     def trace(self, msg: str):
         raise NotImplementedError
@@ -0,0 +1,403 @@
+# Copyright 2021 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC
+from abc import abstractmethod
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import get_context
+from threading import Condition
+from threading import Lock
+
+from carebt.abstractLogger import AbstractLogger
+from carebt.abstractLogger import LogLevel
+from carebt.clock import AbstractClock
+from carebt.clock import RealTimeClock
+from carebt.simplePrintLogger import SimplePrintLogger
+from carebt.tickPolicy import TickPolicy
+from carebt.timerService import TimerService
+
+
+class AbstractRunner(ABC):
+    """The careBT `AbstractRunner` class.
+
+    `AbstractRunner` is the basic class which provides the common implementation
+    of the careBT runners, like the tick rate, the tick scheduling, the wakeup
+    mechanism, the clock, the timer service and the logger.
+    """
+
+    def __init__(self):
+        """Init the `AbstractRunner`."""
+        self._tick_rate_ms = 50
+        self._tick_count = 0
+        self._tick_policy = TickPolicy.FIXED_DELAY
+        self._prebuild_next_child = False
+        self._overrun_count = 0
+        self._logger = SimplePrintLogger()
+        self._logger.set_log_level(LogLevel.WARN)
+        self._wakeup = Condition()
+        self._wakeup_requested = False
+        self._clock: AbstractClock = RealTimeClock()
+        self._timer_service = TimerService(self._internal_on_timer_scheduled, self._clock)
+        self._executor: Executor = None
+        self._owns_executor = False
+        self._process_executor: Executor = None
+        self._owns_process_executor = False
+        self._executor_lock = Lock()
+
+    # PROTECTED
+
+    def _internal_on_timer_scheduled(self) -> None:
+        # wake up the waiting run loop to recalculate its wait without a tick
+        with self._wakeup:
+            self._wakeup.notify_all()
+
+    def _internal_wait_until(self, deadline: float) -> None:
+        # sleep until the deadline is reached or until `notify` is called,
+        # timers which expire in the meantime are fired in this thread
+        while(True):
+            with self._wakeup:
+                if(self._wakeup_requested):
+                    self._wakeup_requested = False
+                    return
+                now = self.get_clock().now()
+                if(now >= deadline):
+                    return
+                timer_deadline = self.get_timer_service().get_next_deadline()
+                if(timer_deadline is None or timer_deadline > deadline):
+                    timer_deadline = deadline
+                if(timer_deadline > now):
+                    self.get_clock().wait(self._wakeup, timer_deadline - now)
+            self.get_timer_service().fire_due()
+
+    def _internal_next_deadline(self, deadline: float, now: float) -> float:
+        # calculate the deadline of the next scheduled tick, based on the
+        # deadline of the current tick and the time the current tick completed
+        period = self._tick_rate_ms / 1000
+        if(now > deadline + period):
+            self._overrun_count += 1
+            if(self.get_logger().is_enabled(LogLevel.DEBUG)):
+                self.get_logger().debug('tick overrun by '
+                                        + f'{int((now - deadline - period) * 1000)} ms')
+        # round to nanoseconds, so that adding up the period does not drift
+        return round(self._tick_policy.next_deadline(deadline, now, period), 9)
+
+    def _internal_reset_wakeup(self) -> None:
+        with self._wakeup:
+            self._wakeup_requested = False
+
+    def _internal_run_loop(self) -> None:
+        deadline = self.get_clock().now()
+        while(True):
+            self.tick_once()
+            # do not wait after the final tick
+            if(self.is_done()):
+                break
+            # a tick requested with `notify` does not shift the scheduled deadline
+            now = self.get_clock().now()
+            if(now >= deadline):
+                deadline = self._internal_next_deadline(deadline, now)
+            self._internal_wait_until(deadline)
+
+    # PUBLIC
+
+    def set_tick_rate_ms(self, tick_rate_ms: int) -> None:
+        """Set the tick rate in milliseconds.
+
+        Sets the rate in milliseconds in which the careBT execution engine runs.
+        It is the rate at which the nodes are ticked. Default is 50 ms.
+
+        Parameters
+        ----------
+        tick_rate_ms: int
+            The tick rate in milliseconds
+
+        """
+        self._tick_rate_ms = tick_rate_ms
+
+    def set_tick_policy(self, tick_policy: TickPolicy) -> None:
+        """Set the tick policy.
+
+        Sets how the careBT execution engine schedules the ticks. With
+        `TickPolicy.FIXED_DELAY` (default) the engine waits the full tick rate
+        after each tick, thus the real period is the execution time of the
+        tick plus the tick rate. With `TickPolicy.FIXED_RATE_SKIP` and
+        `TickPolicy.FIXED_RATE_CATCH_UP` the ticks are scheduled on fixed
+        deadlines, thus the engine only waits for the remainder of the tick rate.
+        In case a tick takes longer than the tick rate, the missed ticks are
+        either skipped or executed back-to-back.
+
+        Parameters
+        ----------
+        tick_policy: TickPolicy
+            The tick policy
+
+        """
+        self._tick_policy = tick_policy
+
+    def set_prebuild_next_child(self, prebuild_next_child: bool) -> None:
+        """Set whether the next child of a sequence is created one tick ahead.
+
+        By default, the children of a `SequenceNode` and a `FallbackNode` are
+        created when they are reached. If enabled, the next child is already
+        created at the end of a tick in which the current child is still
+        running. Thus, the constructor of the next child does not delay the
+        tick in which the sequence advances. `on_init` of the next child is
+        still called when it is reached. Default is False.
+
+        Parameters
+        ----------
+        prebuild_next_child: bool
+            True, to create the next child one tick ahead
+
+        """
+        self._prebuild_next_child = prebuild_next_child
+
+    def get_prebuild_next_child(self) -> bool:
+        """Return whether the next child of a sequence is created one tick ahead.
+
+        Returns
+        -------
+        bool
+            True, if the next child is created one tick ahead
+
+        """
+        return self._prebuild_next_child
+
+    def get_overrun_count(self) -> int:
+        """Return the current overrun count.
+
+        Returns how many ticks of the last execution of the `run` method took
+        longer than the tick rate, respectively missed the deadline of the
+        following tick.
+
+        Returns
+        -------
+        int
+            Ticks which overran the tick rate
+
+        """
+        return self._overrun_count
+
+    def get_tick_count(self) -> int:
+        """Return the current tick count.
+
+        Returns the current counter of the ticks the careBT execution engine
+        has taken for the last execution of the `run` method.
+
+        Returns
+        -------
+        int
+            Ticks taken for the behavior tree execution
+
+        """
+        return self._tick_count
+
+    def set_logger(self, logger: AbstractLogger):
+        """Set a custom logger.
+
+        Sets a custom logger which is then used by the careBT execution
+        engine.
+
+        Parameters
+        ----------
+        logger: AbstractLogger
+            A logger implementation
+
+        """
+        self._logger = logger
+
+    def get_logger(self) -> AbstractLogger:
+        """Return the current logger.
+
+        Returns
+        -------
+        `AbstractLogger`
+            The current logger
+
+        """
+        return self._logger
+
+    def set_clock(self, clock: AbstractClock) -> None:
+        """Set the clock.
+
+        Sets the clock which provides the time for the tick scheduling, the
+        timers and the throttling of the nodes. Default is the `RealTimeClock`.
+        With a `VirtualClock` the execution engine does not sleep, instead the
+        time is advanced instantly to the next tick or timer. The clock should
+        only be changed while no behavior tree is executed.
+
+        Parameters
+        ----------
+        clock: AbstractClock
+            The clock
+
+        """
+        self._clock = clock
+        self._timer_service.set_clock(clock)
+
+    def get_clock(self) -> AbstractClock:
+        """Return the clock.
+
+        Returns
+        -------
+        `AbstractClock`
+            The current clock
+
+        """
+        return self._clock
+
+    def get_timer_service(self) -> TimerService:
+        """Return the timer service.
+
+        Returns the timer service of the careBT execution engine. The
+        timers are fired in the thread which ticks the behavior tree.
+
+        Returns
+        -------
+        `TimerService`
+            The timer service
+
+        """
+        return self._timer_service
+
+    def set_executor(self, executor: Executor) -> None:
+        """Set the executor for blocking work.
+
+        Sets the executor, e.g. a `concurrent.futures.ThreadPoolExecutor`, to
+        which the `FutureActionNodes` submit their work. The executor is
+        shared by all nodes of the runner and is not shut down by the runner.
+
+        Parameters
+        ----------
+        executor: Executor
+            The executor
+
+        """
+        with self._executor_lock:
+            self._executor = executor
+            self._owns_executor = False
+
+    def get_executor(self) -> Executor:
+        """Return the executor for blocking work.
+
+        In case no executor was set, a `ThreadPoolExecutor` is created on
+        first use. The created executor is shut down by `shutdown`.
+
+        Returns
+        -------
+        Executor
+            The executor
+
+        """
+        if(self._executor is None):
+            with self._executor_lock:
+                if(self._executor is None):
+                    self._executor = ThreadPoolExecutor(thread_name_prefix='carebt')
+                    self._owns_executor = True
+        return self._executor
+
+    def set_process_executor(self, executor: Executor) -> None:
+        """Set the executor for CPU-bound work.
+
+        Sets the executor, e.g. a `concurrent.futures.ProcessPoolExecutor`, to
+        which the `ProcessActionNodes` submit their work. The executor is
+        shared by all nodes of the runner and is not shut down by the runner.
+
+        Parameters
+        ----------
+        executor: Executor
+            The executor
+
+        """
+        with self._executor_lock:
+            self._process_executor = executor
+            self._owns_process_executor = False
+
+    def get_process_executor(self) -> Executor:
+        """Return the executor for CPU-bound work.
+
+        In case no executor was set, a `ProcessPoolExecutor` is created on
+        first use. Its worker processes are started with the 'spawn' method,
+        as forking a process with running threads can deadlock. The created
+        executor is shut down by `shutdown`.
+
+        Returns
+        -------
+        Executor
+            The executor
+
+        """
+        if(self._process_executor is None):
+            with self._executor_lock:
+                if(self._process_executor is None):
+                    self._process_executor = ProcessPoolExecutor(
+                        mp_context=get_context('spawn'))
+                    self._owns_process_executor = True
+        return self._process_executor
+
+    def notify(self) -> None:
+        """Wake up the careBT execution engine.
+
+        Requests the next tick to be executed right away instead of waiting until
+        the tick rate expires. `notify` can be called from any thread, e.g. from the
+        result callback of an asynchronous action, to let the behavior tree react
+        to the status change without delay. If `notify` is called while a tick is
+        executing, the following tick is executed immediately after it.
+
+        """
+        with self._wakeup:
+            self._wakeup_requested = True
+            self._wakeup.notify_all()
+
+    def shutdown(self) -> None:
+        """Shutdown the executors created by the runner.
+
+        Shuts down the executors which were created on first use and waits
+        until their workers are done. Executors which were set with
+        `set_executor` or `set_process_executor` are not shut down. In case the
+        runner is used afterwards, new executors are created.
+        """
+        with self._executor_lock:
+            executor = None
+            if(self._owns_executor):
+                executor = self._executor
+                self._executor = None
+                self._owns_executor = False
+            process_executor = None
+            if(self._owns_process_executor):
+                process_executor = self._process_executor
+                self._process_executor = None
+                self._owns_process_executor = False
+        if(executor is not None):
+            executor.shutdown()
+        if(process_executor is not None):
+            process_executor.shutdown()
+
+    def __enter__(self) -> 'AbstractRunner':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+    @abstractmethod
+    def tick_once(self) -> None:
+        """Execute one tick."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_done(self) -> bool:
+        """Return whether the execution is done."""
+        raise NotImplementedError
@@ -13,9 +13,9 @@
 # limitations under the License.
 
 from abc import ABC
-from datetime import datetime
 from typing import TYPE_CHECKING
 
+from carebt.abstractLogger import LogLevel
 from carebt.nodeStatus import NodeStatus
 from carebt.treeNode import TreeNode
 
@@ -40,26 +40,31 @@ class ActionNode(TreeNode, ABC):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
         """Init the `ActionNode` with bt_runner and params."""
         super().__init__(bt_runner, params)
-        self.get_logger().info(f'creating {self.__class__.__name__}')
+        if(self.get_logger().is_enabled(LogLevel.INFO)):
+            self.get_logger().info(f'creating {self.__class__.__name__}')
 
     # PROTECTED
 
     def _internal_on_tick(self) -> None:
-        current_ts = datetime.now()
+        current_ts = self.bt_runner.get_clock().now()
         if(self._throttle_ms is None or
-                int((current_ts - self._last_ts).total_seconds() * 1000) >= self._throttle_ms):
+                (current_ts - self._last_ts) * 1000 >= self._throttle_ms):
             if(self.get_status() == NodeStatus.IDLE or
                     self.get_status() == NodeStatus.RUNNING):
-                self.bt_runner.get_logger().trace(f'ticking {self.__class__.__name__} - '
-                                                  + f'{self.get_status()}')
+                if(self.bt_runner.get_logger().is_enabled(LogLevel.TRACE)):
+                    self.bt_runner.get_logger().trace(f'ticking {self.__class__.__name__} - '
+                                                      + f'{self.get_status()}')
                 self.on_tick()
                 self._last_ts = current_ts
 
     def _internal_on_abort(self) -> None:
         super()._internal_on_abort()
-        self.bt_runner.get_logger().info(f'aborting {self.__class__.__name__}')
+        if(self.bt_runner.get_logger().is_enabled(LogLevel.INFO)):
+            self.bt_runner.get_logger().info(f'aborting {self.__class__.__name__}')
         self.on_abort()
         self.set_status(NodeStatus.ABORTED)
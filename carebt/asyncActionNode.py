@@ -0,0 +1,117 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC
+import asyncio
+from typing import TYPE_CHECKING
+
+from carebt.abstractLogger import LogLevel
+from carebt.actionNode import ActionNode
+from carebt.nodeStatus import NodeStatus
+
+if TYPE_CHECKING:
+    from carebt.behaviorTreeRunner import BehaviorTreeRunner  # pragma: no cover
+
+
+class AsyncActionNode(ActionNode, ABC):
+    """The careBT `AsyncActionNode` class.
+
+    `AsyncActionNodes` are `ActionNodes` whose `on_tick` callback is a coroutine
+    (`async def on_tick`) which can await I/O. When the node is ticked, the
+    coroutine is scheduled on the asyncio event loop of the
+    `AsyncBehaviorTreeRunner` and the node is `SUSPENDED` until the coroutine
+    returns. If the coroutine did not set a final status, the node is set back
+    to `RUNNING` and `on_tick` is scheduled again with the next tick. If the
+    coroutine raises an exception, the node completes with `FAILURE` and the
+    name of the exception as contingency-message.
+
+    Parameters
+    ----------
+    bt_runner: 'BehaviorTreeRunner'
+        The behavior tree runner which started the tree.
+    params: str
+        The input/Output parameters of the node
+        e.g. '?x ?y => ?z'
+
+    """
+
+    __slots__ = ('__task',)
+
+    def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
+        """Init the `AsyncActionNode` with bt_runner and params."""
+        super().__init__(bt_runner, params)
+        self.__task: asyncio.Task = None
+
+    # PRIVATE
+
+    async def __run_on_tick(self) -> None:
+        try:
+            await self.on_tick()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.get_logger().error(f'{self.__class__.__name__}.on_tick raised '
+                                    + f'{e.__class__.__name__}: {e}')
+            self.set_status(NodeStatus.FAILURE)
+            self.set_contingency_message(e.__class__.__name__)
+        finally:
+            # release the task to make sure that the object gets destroyed by gc
+            self.__task = None
+        if(self.get_status() == NodeStatus.SUSPENDED):
+            self.set_status(NodeStatus.RUNNING)
+        self.request_tick()
+
+    def __cancel_task(self) -> None:
+        if(self.__task is not None):
+            # abort might be called from another thread, e.g. by a result callback
+            self.__task.get_loop().call_soon_threadsafe(self.__task.cancel)
+            self.__task = None
+
+    # PROTECTED
+
+    def _internal_on_tick(self) -> None:
+        current_ts = self.bt_runner.get_clock().now()
+        if(self._throttle_ms is None or
+                (current_ts - self._last_ts) * 1000 >= self._throttle_ms):
+            if(self.get_status() == NodeStatus.IDLE or
+                    self.get_status() == NodeStatus.RUNNING):
+                if(self.bt_runner.get_logger().is_enabled(LogLevel.TRACE)):
+                    self.bt_runner.get_logger().trace(f'ticking {self.__class__.__name__} - '
+                                                      + f'{self.get_status()}')
+                self.set_status(NodeStatus.SUSPENDED)
+                self.__task = asyncio.get_running_loop().create_task(self.__run_on_tick())
+                self._last_ts = current_ts
+
+    def _internal_on_abort(self) -> None:
+        self.__cancel_task()
+        super()._internal_on_abort()
+
+    def _internal_on_delete(self) -> None:
+        self.__cancel_task()
+        super()._internal_on_delete()
+
+    def _internal_reset(self) -> None:
+        self.__cancel_task()
+        super()._internal_reset()
+
+    # PUBLIC
+
+    async def on_tick(self) -> None:
+        """Is called on each tick.
+
+        The `on_tick` coroutine is scheduled every time the `Node` is ticked by
+        its parent node, considering the optional throttle rate. While the
+        coroutine is running, the node is `SUSPENDED`.
+        """
+        pass
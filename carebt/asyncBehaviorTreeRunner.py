@@ -0,0 +1,131 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.treeNode import TreeNode
+
+
+class AsyncBehaviorTreeRunner(BehaviorTreeRunner):
+    """The careBT `AsyncBehaviorTreeRunner` class.
+
+    The `AsyncBehaviorTreeRunner` executes a careBT behavior tree on an asyncio
+    event loop. Instead of blocking the thread between two ticks, it awaits
+    the next tick. Thus, `AsyncActionNodes` can await I/O concurrently within
+    the same thread and the tree reacts immediately when they complete.
+    """
+
+    def __init__(self):
+        """Init the `AsyncBehaviorTreeRunner`."""
+        super().__init__()
+        self.__loop: asyncio.AbstractEventLoop = None
+        self.__wakeup_event: asyncio.Event = None
+        self.__tick_requested = False
+
+    # PRIVATE
+
+    def __request_tick(self) -> None:
+        self.__tick_requested = True
+        self.__wakeup_event.set()
+
+    async def __wait_until(self, deadline: float) -> None:
+        # await until the deadline is reached or until `notify` is called,
+        # timers which expire in the meantime are fired on the event loop
+        while(not self.__tick_requested):
+            now = self.get_clock().now()
+            if(now >= deadline):
+                break
+            timer_deadline = self.get_timer_service().get_next_deadline()
+            if(timer_deadline is None or timer_deadline > deadline):
+                timer_deadline = deadline
+            if(timer_deadline > now):
+                await self.get_clock().wait_async(self.__wakeup_event, timer_deadline - now)
+                self.__wakeup_event.clear()
+            self.get_timer_service().fire_due()
+        self.__tick_requested = False
+
+    # PROTECTED
+
+    def _internal_on_timer_scheduled(self) -> None:
+        # wake up the waiting run loop to recalculate its wait without a tick
+        loop = self.__loop
+        if(loop is not None):
+            loop.call_soon_threadsafe(self.__wakeup_event.set)
+
+    # PUBLIC
+
+    def notify(self) -> None:
+        """Wake up the careBT execution engine.
+
+        Requests the next tick to be executed right away instead of waiting until
+        the tick rate expires. `notify` can be called from any thread.
+
+        """
+        loop = self.__loop
+        if(loop is not None):
+            loop.call_soon_threadsafe(self.__request_tick)
+
+    async def run_async(self, node: TreeNode, params: str = None) -> None:
+        """Execute the provided node, respectively the provided behavior tree.
+
+        Coroutine which executes the behavior tree on the running asyncio event
+        loop until it completes.
+
+        Parameters
+        ----------
+        node: TreeNode
+            The node which should be executed
+
+        params: str, optional
+            The parameters for the node which should be executed
+
+        """
+        self.start(node, params)
+        self.__loop = asyncio.get_running_loop()
+        self.__wakeup_event = asyncio.Event()
+        self.__tick_requested = False
+
+        # run tree
+        try:
+            deadline = self.get_clock().now()
+            while(True):
+                self.tick_once()
+                # do not wait after the final tick
+                if(self.is_done()):
+                    break
+                # a tick requested with `notify` does not shift the scheduled deadline
+                now = self.get_clock().now()
+                if(now >= deadline):
+                    deadline = self._internal_next_deadline(deadline, now)
+                await self.__wait_until(deadline)
+        finally:
+            self.__loop = None
+
+    def run(self, node: TreeNode, params: str = None) -> None:
+        """Execute the provided node, respectively the provided behavior tree.
+
+        Runs `run_async` on a new asyncio event loop and blocks until the
+        behavior tree completes.
+
+        Parameters
+        ----------
+        node: TreeNode
+            The node which should be executed
+
+        params: str, optional
+            The parameters for the node which should be executed
+
+        """
+        asyncio.run(self.run_async(node, params))
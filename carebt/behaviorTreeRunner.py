@@ -12,13 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from time import sleep
+from typing import Dict
+from typing import List
 
-from carebt.abstractLogger import AbstractLogger, LogLevel
+from carebt.abstractLogger import LogLevel
+from carebt.abstractRunner import AbstractRunner
+from carebt.blackboard import Blackboard
 from carebt.contingencyHistoryEntry import ContingencyHistoryEntry
 from carebt.nodeStatus import NodeStatus
 from carebt.rootNode import RootNode
-from carebt.simplePrintLogger import SimplePrintLogger
 from carebt.treeNode import TreeNode
 
 
@@ -28,7 +30,7 @@ class _RootNode(RootNode):
         super().__init__(bt_runner)
 
 
-class BehaviorTreeRunner:
+class BehaviorTreeRunner(AbstractRunner):
     """The careBT `BehaviorTreeRunner` class.
 
     The `BehaviorTreeRunner` is the interface to the careBT execution engine.
@@ -38,87 +40,219 @@ class BehaviorTreeRunner:
 
     def __init__(self):
         """Init the `BehaviorTreeRunner`."""
-        self._tick_rate_ms = 50
-        self._tick_count = 0
-        self._logger = SimplePrintLogger()
-        self.get_logger().set_log_level(LogLevel.WARN)
+        super().__init__()
+        self._instance: _RootNode = None
+        self._blackboard = Blackboard()
+        # the pooled instances of the node classes with `pool_instances` enabled
+        self._node_pool: Dict[type, List[TreeNode]] = {}
+
+    # PRIVATE
+
+    def __log_result(self) -> None:
+        # after tree execution
+        if(self._instance.get_status() == NodeStatus.SUCCESS):
+            self.get_logger().info('---------------------------------------------------')
+            self.get_logger().info('bt execution finished')
+            self.get_logger().info(f'status:  {self._instance.get_status()}')
+            self.get_logger().info('contingency-message: '
+                                   + f'{self._instance.get_contingency_message()}')
+            entry: ContingencyHistoryEntry
+            for idx, entry in enumerate(self._instance.get_contingency_history()):
+                if idx == 0:
+                    self.get_logger().info(f'contingency-history: [{idx}] {entry.node_name}')
+                    self.get_logger().info(f'                         {entry.status}')
+                    self.get_logger().info(f'                         {entry.contingency_message}')
+                    self.get_logger().info(f'                         {entry.function}')
+                else:
+                    self.get_logger().info(f'                     [{idx}] {entry.node_name}')
+                    self.get_logger().info(f'                         {entry.status}')
+                    self.get_logger().info(f'                         {entry.contingency_message}')
+                    self.get_logger().info(f'                         {entry.function}')
+            self.get_logger().info('---------------------------------------------------')
+        else:
+            self.get_logger().warn('---------------------------------------------------')
+            self.get_logger().warn('bt execution finished')
+            self.get_logger().warn(f'status:  {self._instance.get_status()}')
+            self.get_logger().warn('contingency-message: '
+                                   + f'{self._instance.get_contingency_message()}')
+            entry: ContingencyHistoryEntry
+            for idx, entry in enumerate(self._instance.get_contingency_history()):
+                if idx == 0:
+                    self.get_logger().warn(f'contingency-history: [{idx}] {entry.node_name}')
+                    self.get_logger().warn(f'                         {entry.status}')
+                    self.get_logger().warn(f'                         {entry.contingency_message}')
+                    self.get_logger().warn(f'                         {entry.function}')
+                else:
+                    self.get_logger().warn(f'                     [{idx}] {entry.node_name}')
+                    self.get_logger().warn(f'                         {entry.status}')
+                    self.get_logger().warn(f'                         {entry.contingency_message}')
+                    self.get_logger().warn(f'                         {entry.function}')
+            self.get_logger().warn('---------------------------------------------------')
+
+    # PROTECTED
+
+    def _internal_acquire_node(self, node: type) -> TreeNode:
+        # return a pooled instance of the node class, or create a new one,
+        # the children of a `ParallelNode` might acquire nodes concurrently,
+        # thus the pool might be emptied by another thread after the check
+        pool = self._node_pool.get(node)
+        if(pool):
+            try:
+                return pool.pop()
+            except IndexError:
+                pass
+        instance = node(self)
+        instance._internal_save_init_state()
+        return instance
+
+    def _internal_release_node(self, instance: TreeNode) -> None:
+        # reset the completed instance and put it into the pool
+        instance._internal_reset()
+        instance.reset()
+        self._node_pool.setdefault(instance.__class__, []).append(instance)
+
+    def _internal_tick_tree_only(self) -> NodeStatus:
+        # tick the behavior tree without firing the expired timers, e.g. if
+        # the timers are fired by the `MultiTreeRunner` for all its trees
+        if(self.is_done()):
+            return self._instance.get_status()
+        self._tick_count += 1
+        if(self.get_logger().is_enabled(LogLevel.TRACE)):
+            self.get_logger().trace('---------------------------------- '
+                                    + f'tick-count: {self._tick_count}')
+        self._instance._internal_on_tick()
+        if(self.is_done()):
+            self.__log_result()
+        return self._instance.get_status()
 
     # PUBLIC
 
-    def set_tick_rate_ms(self, tick_rate_ms: int) -> None:
-        """Set the tick rate in milliseconds.
+    def get_status(self) -> NodeStatus:
+        """Return the status of the last execution.
 
-        Sets the rate in milliseconds in which the careBT execution engine runs.
-        It is the rate at which the nodes are ticked. Default is 50 ms.
+        Returns
+        -------
+        `NodeStatus`
+            Current status of the node
 
-        Parameters
-        ----------
-        tick_rate_ms: int
-            The tick rate in milliseconds
+        """
+        return self._instance.get_status()
+
+    def get_contingency_message(self) -> str:
+        """Return the contincency message of the last execution.
+
+        Returns
+        -------
+        str
+            The contingency message
 
         """
-        self._tick_rate_ms = tick_rate_ms
+        return self._instance.get_contingency_message()
 
-    def get_tick_count(self) -> int:
-        """Return the current tick count.
+    def get_blackboard(self) -> Blackboard:
+        """Return the blackboard.
 
-        Returns the current counter of the ticks the careBT execution engine
-        has taken for the last execution of the `run` method.
+        Returns the root scope of the blackboard. It is kept between the
+        executions, thus it can be used to provide inputs to the behavior
+        tree and to read its results.
 
         Returns
         -------
-        int
-            Ticks taken for the behavior tree execution
+        `Blackboard`
+            The root scope of the blackboard
 
         """
-        return self._tick_count
-
-    def set_logger(self, logger: AbstractLogger):
-        """Set a custom logger.
+        return self._blackboard
 
-        Sets a custom logger which is then used by the careBT execution
-        engine.
+    def set_blackboard(self, blackboard: Blackboard) -> None:
+        """Set the blackboard.
 
         Parameters
         ----------
-        logger: AbstractLogger
-            A logger implementation
+        blackboard: Blackboard
+            The root scope of the blackboard
 
         """
-        self._logger = logger
+        self._blackboard = blackboard
 
-    def get_logger(self) -> AbstractLogger:
-        """Return the current logger.
+    def clear_node_pool(self) -> None:
+        """Clear the node pool.
 
-        Returns
-        -------
-        `AbstractLogger`
-            The current logger
+        Drops the pooled instances of the node classes which have
+        `pool_instances` enabled.
+        """
+        self._node_pool.clear()
+
+    def start(self, node: TreeNode, params: str = None) -> None:
+        """Prepare the execution of the provided node, respectively behavior tree.
+
+        Creates the internal root node for the provided node without ticking
+        it. Afterwards, the behavior tree can be executed step by step with
+        `tick_once`. This allows to embed careBT in an existing event loop or
+        control thread instead of calling the blocking `run` method.
+
+        Parameters
+        ----------
+        node: TreeNode
+            The node which should be executed
+
+        params: str, optional
+            The parameters for the node which should be executed
 
         """
-        return self._logger
+        self._instance = _RootNode(self)
+        self._instance.set_status(NodeStatus.IDLE)
+        self._instance.set_contingency_message('')
+        self._instance.set_child(node, params)
+        self._tick_count = 0
+        self._overrun_count = 0
+        self._internal_reset_wakeup()
 
-    def get_status(self) -> NodeStatus:
-        """Return the status of the last execution.
+    def tick_once(self) -> NodeStatus:
+        """Execute one tick of the behavior tree.
+
+        Ticks the behavior tree prepared with `start` exactly once and returns
+        the resulting status. Does nothing if the execution is already done.
+        Expired timers, e.g. timeouts, are fired before the tick.
+        The caller is responsible to call `tick_once` at the desired tick rate.
 
         Returns
         -------
         `NodeStatus`
-            Current status of the node
+            Status of the behavior tree after the tick
 
         """
-        return self._instance.get_status()
+        if(self.is_done()):
+            return self._instance.get_status()
+        self.get_timer_service().fire_due()
+        if(self.is_done()):
+            self.__log_result()
+            return self._instance.get_status()
+        return self._internal_tick_tree_only()
 
-    def get_contingency_message(self) -> str:
-        """Return the contincency message of the last execution.
+    def is_done(self) -> bool:
+        """Return whether the execution of the behavior tree is done.
 
         Returns
         -------
-        str
-            The contingency message
+        bool
+            True, if the behavior tree completed its execution
 
         """
-        return self._instance.get_contingency_message()
+        return (self._instance.get_status() != NodeStatus.IDLE
+                and self._instance.get_status() != NodeStatus.RUNNING)
+
+    def abort(self) -> None:
+        """Abort the execution of the behavior tree.
+
+        Aborts the behavior tree prepared with `start` in case it is not
+        done yet. The currently executing nodes are aborted and the status
+        of the execution is set to `ABORTED`.
+
+        """
+        if(not self.is_done()):
+            self._instance.abort()
+            self.__log_result()
 
     def run(self, node: TreeNode, params: str = None) -> None:
         """Execute the provided node, respectively the provided behavior tree.
@@ -132,57 +266,5 @@ class BehaviorTreeRunner:
             The parameters for the node which should be executed
 
         """
-        self._instance = _RootNode(self)
-        self._instance.set_status(NodeStatus.IDLE)
-        self._instance.set_contingency_message('')
-        self._instance.set_child(node, params)
-        self._tick_count = 0
-
-        # run tree
-        while(self._instance.get_status() == NodeStatus.IDLE
-                or self._instance.get_status() == NodeStatus.RUNNING):
-            self._tick_count += 1
-            self.get_logger().trace('---------------------------------- '
-                                    + f'tick-count: {self._tick_count}')
-            self._instance._internal_on_tick()
-            sleep(self._tick_rate_ms / 1000)
-
-        # after tree execution
-        if(self._instance.get_status() == NodeStatus.SUCCESS):
-            self.get_logger().info('---------------------------------------------------')
-            self.get_logger().info('bt execution finished')
-            self.get_logger().info(f'status:  {self._instance.get_status()}')
-            self.get_logger().info('contingency-message: '
-                                   + f'{self._instance.get_contingency_message()}')
-            entry: ContingencyHistoryEntry
-            for idx, entry in enumerate(self._instance.get_contingency_history()):
-                if idx == 0:
-                    self.get_logger().info(f'contingency-history: [{idx}] {entry.node_name}')
-                    self.get_logger().info(f'                         {entry.status}')
-                    self.get_logger().info(f'                         {entry.contingency_message}')
-                    self.get_logger().info(f'                         {entry.function}')
-                else:
-                    self.get_logger().info(f'                     [{idx}] {entry.node_name}')
-                    self.get_logger().info(f'                         {entry.status}')
-                    self.get_logger().info(f'                         {entry.contingency_message}')
-                    self.get_logger().info(f'                         {entry.function}')
-            self.get_logger().info('---------------------------------------------------')
-        else:
-            self.get_logger().warn('---------------------------------------------------')
-            self.get_logger().warn('bt execution finished')
-            self.get_logger().warn(f'status:  {self._instance.get_status()}')
-            self.get_logger().warn('contingency-message: '
-                                   + f'{self._instance.get_contingency_message()}')
-            entry: ContingencyHistoryEntry
-            for idx, entry in enumerate(self._instance.get_contingency_history()):
-                if idx == 0:
-                    self.get_logger().warn(f'contingency-history: [{idx}] {entry.node_name}')
-                    self.get_logger().warn(f'                         {entry.status}')
-                    self.get_logger().warn(f'                         {entry.contingency_message}')
-                    self.get_logger().warn(f'                         {entry.function}')
-                else:
-                    self.get_logger().warn(f'                     [{idx}] {entry.node_name}')
-                    self.get_logger().warn(f'                         {entry.status}')
-                    self.get_logger().warn(f'                         {entry.contingency_message}')
-                    self.get_logger().warn(f'                         {entry.function}')
-            self.get_logger().warn('---------------------------------------------------')
+        self.start(node, params)
+        self._internal_run_loop()
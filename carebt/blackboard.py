@@ -0,0 +1,189 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from threading import Lock
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+class Blackboard:
+    """The careBT `Blackboard` class.
+
+    The `Blackboard` is an optional alternative to the careBT variables which
+    are copied between the parent and the child nodes. The variables of a
+    `Blackboard` are stored in integer slots. A parameter of a node can be
+    remapped to a `Blackboard` variable with an '@' prefix at the call site,
+    e.g. ``append_child(AddTwoNumbersAction, '@a 3 => @sum')``. Thus, the child
+    node reads and writes the slot of the variable directly without copying.
+
+    The scopes of a `Blackboard` are hierarchical. A variable is looked up in
+    the scope itself and then in its parent scopes. In case the variable does
+    not exist, it is created in the scope itself. Variables can be declared
+    concurrently, e.g. by the children of a `ParallelNode` which are ticked
+    by a thread pool.
+
+    Parameters
+    ----------
+    parent: Blackboard, optional
+        The parent scope
+
+    """
+
+    def __init__(self, parent: 'Blackboard' = None):
+        """Init the `Blackboard`."""
+        self.__parent = parent
+        self.__lock = Lock()
+        self.__index: Dict[str, int] = {}
+        self._slots: List[Any] = []
+
+    # PRIVATE
+
+    def __declare(self, name: str, value: Any) -> int:
+        slot = len(self._slots)
+        self._slots.append(value)
+        self.__index[name] = slot
+        return slot
+
+    # PROTECTED
+
+    def _internal_find(self, name: str) -> Tuple['Blackboard', int]:
+        # return the scope and the slot of the variable, or None if not found
+        scope = self
+        while(scope is not None):
+            slot = scope.__index.get(name)
+            if(slot is not None):
+                return scope, slot
+            scope = scope.__parent
+        return None
+
+    def _internal_get_ref(self, name: str) -> Tuple['Blackboard', int]:
+        # return the scope and the slot of the variable, create it if not found
+        ref = self._internal_find(name)
+        if(ref is None):
+            with self.__lock:
+                # another thread might have created the variable meanwhile
+                slot = self.__index.get(name)
+                if(slot is None):
+                    slot = self.__declare(name, None)
+            ref = self, slot
+        return ref
+
+    # PUBLIC
+
+    def get_parent(self) -> 'Blackboard':
+        """Return the parent scope.
+
+        Returns
+        -------
+        `Blackboard`
+            The parent scope, or None if this is the root scope
+
+        """
+        return self.__parent
+
+    def create_scope(self) -> 'Blackboard':
+        """Create a new child scope of this scope.
+
+        Returns
+        -------
+        `Blackboard`
+            The new scope
+
+        """
+        return Blackboard(self)
+
+    def declare(self, name: str, value: Any = None) -> int:
+        """Declare a variable in this scope.
+
+        Declares the variable in this scope, even if a parent scope has a
+        variable with the same name. If the variable is already declared in
+        this scope, only its value is set.
+
+        Parameters
+        ----------
+        name: str
+            The name of the variable
+        value: Any, optional
+            The initial value of the variable
+
+        Returns
+        -------
+        int
+            The slot of the variable
+
+        """
+        with self.__lock:
+            slot = self.__index.get(name)
+            if(slot is None):
+                slot = self.__declare(name, value)
+            else:
+                self._slots[slot] = value
+        return slot
+
+    def contains(self, name: str) -> bool:
+        """Return whether the variable exists in this or a parent scope.
+
+        Parameters
+        ----------
+        name: str
+            The name of the variable
+
+        Returns
+        -------
+        bool
+            True, if the variable exists
+
+        """
+        return self._internal_find(name) is not None
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return the value of a variable.
+
+        Parameters
+        ----------
+        name: str
+            The name of the variable
+        default: Any, optional
+            The value returned if the variable does not exist
+
+        Returns
+        -------
+        Any
+            The value of the variable
+
+        """
+        ref = self._internal_find(name)
+        if(ref is None):
+            return default
+        scope, slot = ref
+        return scope._slots[slot]
+
+    def set(self, name: str, value: Any) -> None:
+        """Set the value of a variable.
+
+        Sets the variable in the scope it is found in, or creates it in
+        this scope.
+
+        Parameters
+        ----------
+        name: str
+            The name of the variable
+        value: Any
+            The value of the variable
+
+        """
+        scope, slot = self._internal_get_ref(name)
+        scope._slots[slot] = value
@@ -0,0 +1,190 @@
+# Copyright 2021 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+from datetime import datetime
+import os
+import sys
+from threading import Event
+from threading import Lock
+from threading import Thread
+import time
+from typing import Deque
+from typing import List
+from typing import TextIO
+from typing import Tuple
+
+from carebt.abstractLogger import AbstractLogger
+from carebt.abstractLogger import LogLevel
+
+
+class BufferedLogger(AbstractLogger):
+    """The careBT `BufferedLogger` class.
+
+    A logger implementation which does not write the statements in the
+    calling thread. The statements are put into a bounded queue which is
+    drained by a background thread. The background thread formats the
+    statements and writes them in batches to standard output, to a provided
+    stream or to a rotating file. Thus, logging a statement on the tick
+    thread costs appending it to the queue.
+
+    If the queue is full, new statements are dropped and counted, see
+    `get_dropped_count`. Thus, logging never waits for the output. The
+    logger should be closed with `close` when it is no longer used.
+
+    Parameters
+    ----------
+    stream: TextIO, optional
+        The stream to write to, by default standard output
+    file_name: str, optional
+        The file to write to instead of a stream
+    max_bytes: int, optional
+        The size in bytes after which the file is rotated, 0 disables rotation
+    backup_count: int, optional
+        The number of rotated files to keep, e.g. `<file_name>.1`. If 0,
+        the file is truncated when it is rotated
+    queue_size: int, optional
+        The maximum number of queued statements
+    flush_interval_ms: int, optional
+        The interval in which the background thread writes the queued
+        statements
+
+    """
+
+    def __init__(self, stream: TextIO = None, file_name: str = None,
+                 max_bytes: int = 0, backup_count: int = 0,
+                 queue_size: int = 10000, flush_interval_ms: int = 100):
+        """Init the `BufferedLogger` and start the background thread."""
+        super().__init__()
+        self.__stream = stream
+        self.__file_name = file_name
+        self.__max_bytes = max_bytes
+        self.__backup_count = backup_count
+        self.__file: TextIO = None
+        self.__file_size = 0
+        self.__queue_size = queue_size
+        self.__flush_interval = flush_interval_ms / 1000
+        # the queue lock is only held to check the size of the queue and to
+        # append a statement, popping from a deque is atomic
+        self.__queue: Deque[Tuple[float, str, str]] = deque()
+        self.__queue_lock = Lock()
+        self.__dropped_count = 0
+        self.__write_lock = Lock()
+        self.__stop = Event()
+        if(self.__file_name is not None):
+            self.__open_file()
+        self.__thread = Thread(target=self.__run, name='carebt-logger', daemon=True)
+        self.__thread.start()
+
+    # PRIVATE
+
+    def __open_file(self) -> None:
+        self.__file = open(self.__file_name, 'a', encoding='utf-8')
+        self.__file_size = self.__file.tell()
+
+    def __rotate_file(self) -> None:
+        self.__file.close()
+        for i in range(self.__backup_count - 1, 0, -1):
+            if(os.path.exists(f'{self.__file_name}.{i}')):
+                os.replace(f'{self.__file_name}.{i}', f'{self.__file_name}.{i + 1}')
+        if(self.__backup_count > 0):
+            os.replace(self.__file_name, f'{self.__file_name}.1')
+        else:
+            os.remove(self.__file_name)
+        self.__open_file()
+
+    def __enqueue(self, level: str, msg: str) -> None:
+        record = (time.time(), level, msg)
+        with self.__queue_lock:
+            if(len(self.__queue) >= self.__queue_size):
+                self.__dropped_count += 1
+            else:
+                self.__queue.append(record)
+
+    def __write_batch(self) -> None:
+        # is called with the write lock acquired
+        lines: List[str] = []
+        while(self.__queue):
+            ts, level, msg = self.__queue.popleft()
+            date_time = datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')
+            lines.append(f'{date_time} {level} {msg}\n')
+        if(not lines):
+            return
+        if(self.__file is None):
+            stream = self.__stream if self.__stream is not None else sys.stdout
+            stream.write(''.join(lines))
+            stream.flush()
+            return
+        for line in lines:
+            size = len(line.encode('utf-8'))
+            if(self.__max_bytes > 0 and self.__file_size > 0
+               and self.__file_size + size > self.__max_bytes):
+                self.__rotate_file()
+            self.__file.write(line)
+            self.__file_size += size
+        self.__file.flush()
+
+    def __run(self) -> None:
+        while(not self.__stop.wait(self.__flush_interval)):
+            with self.__write_lock:
+                self.__write_batch()
+
+    # PUBLIC
+
+    def get_dropped_count(self) -> int:
+        """Return the number of dropped statements.
+
+        Returns
+        -------
+        int
+            The number of statements which were dropped because the queue
+            was full
+
+        """
+        return self.__dropped_count
+
+    def flush(self) -> None:
+        """Write the queued statements in the calling thread."""
+        with self.__write_lock:
+            self.__write_batch()
+
+    def close(self) -> None:
+        """Stop the background thread, write the queued statements and close the file."""
+        self.__stop.set()
+        self.__thread.join()
+        with self.__write_lock:
+            self.__write_batch()
+            if(self.__file is not None):
+                self.__file.close()
+                self.__file = None
+
+    def trace(self, msg: str):
+        if(self._log_level <= LogLevel.TRACE):
+            self.__enqueue('TRACE', msg)
+
+    def debug(self, msg: str):
+        if(self._log_level <= LogLevel.DEBUG):
+            self.__enqueue('DEBUG', msg)
+
+    def info(self, msg: str):
+        if(self._log_level <= LogLevel.INFO):
+            self.__enqueue('INFO', msg)
+
+    def warn(self, msg: str):
+        if(self._log_level <= LogLevel.WARN):
+            self.__enqueue('WARN', msg)
+
+    def error(self, msg: str):
+        if(self._log_level <= LogLevel.ERROR):
+            self.__enqueue('ERROR', msg)
@@ -0,0 +1,146 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC
+from abc import abstractmethod
+import asyncio
+from threading import Condition
+from threading import Lock
+from time import monotonic
+
+
+class AbstractClock(ABC):
+    """The careBT `AbstractClock` class.
+
+    `AbstractClock` is the interface of the clocks which provide the time to
+    the careBT execution engine. The time is used to schedule the ticks, the
+    timers of the `TimerService` and the throttling of the nodes.
+    """
+
+    @abstractmethod
+    def now(self) -> float:
+        """Return the current time.
+
+        Returns
+        -------
+        float
+            The current monotonic time in seconds
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def wait(self, condition: Condition, timeout: float) -> None:
+        """Wait on a condition for the provided time.
+
+        Is called by the runner with the lock of the condition acquired.
+
+        Parameters
+        ----------
+        condition: Condition
+            The condition which is notified to wake up the runner
+        timeout: float
+            The time to wait in seconds
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def wait_async(self, event: asyncio.Event, timeout: float) -> None:
+        """Await an event for the provided time.
+
+        Parameters
+        ----------
+        event: asyncio.Event
+            The event which is set to wake up the runner
+        timeout: float
+            The time to wait in seconds
+
+        """
+        raise NotImplementedError
+
+
+class RealTimeClock(AbstractClock):
+    """The careBT `RealTimeClock` class.
+
+    The `RealTimeClock` provides the monotonic system time. It is the default
+    clock of the careBT execution engine.
+    """
+
+    def now(self) -> float:
+        """Return the monotonic system time in seconds."""
+        return monotonic()
+
+    def wait(self, condition: Condition, timeout: float) -> None:
+        """Wait on the condition until it is notified or the timeout expires."""
+        condition.wait(timeout)
+
+    async def wait_async(self, event: asyncio.Event, timeout: float) -> None:
+        """Await the event until it is set or the timeout expires."""
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+class VirtualClock(AbstractClock):
+    """The careBT `VirtualClock` class.
+
+    The `VirtualClock` provides a simulated time which only advances when the
+    careBT execution engine waits. Instead of sleeping, the time is advanced
+    instantly to the next tick or timer. Thus, a behavior tree which takes
+    minutes of real time completes in milliseconds, with the same tick counts
+    and timeouts. Actions which are executed by other threads or processes,
+    e.g. with Python timers, are not affected by the `VirtualClock`.
+
+    Parameters
+    ----------
+    start: float, optional
+        The time the clock starts with in seconds, default is 0
+
+    """
+
+    def __init__(self, start: float = 0.0):
+        """Init the `VirtualClock`."""
+        self.__lock = Lock()
+        self.__now = start
+
+    def now(self) -> float:
+        """Return the simulated time in seconds."""
+        return self.__now
+
+    def advance(self, seconds: float) -> None:
+        """Advance the simulated time.
+
+        Allows to advance the time manually, e.g. when the behavior tree is
+        executed step by step with `tick_once`.
+
+        Parameters
+        ----------
+        seconds: float
+            The time to advance in seconds
+
+        """
+        with self.__lock:
+            self.__now += max(0.0, seconds)
+
+    def wait(self, condition: Condition, timeout: float) -> None:
+        """Advance the simulated time by the timeout without waiting."""
+        self.advance(timeout)
+
+    async def wait_async(self, event: asyncio.Event, timeout: float) -> None:
+        """Advance the simulated time by the timeout without waiting."""
+        self.advance(timeout)
+        # give other coroutines the chance to run
+        await asyncio.sleep(0)
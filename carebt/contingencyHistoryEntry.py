@@ -34,6 +34,8 @@ class ContingencyHistoryEntry():
 
     """
 
+    __slots__ = ('node_name', 'status', 'contingency_message', 'function')
+
     def __init__(self, node_name: str, status: NodeStatus,
                  contingency_message: str, function: str):
         self.node_name = node_name
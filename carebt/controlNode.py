@@ -13,16 +13,23 @@
 # limitations under the License.
 
 from abc import ABC
-from datetime import datetime
+from inspect import getattr_static
 import re
 from typing import Callable
+from typing import Dict
 from typing import final
 from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Tuple
 from typing import TYPE_CHECKING
 
+from carebt.abstractLogger import LogLevel
 from carebt.contingencyHistoryEntry import ContingencyHistoryEntry
+from carebt.executionContext import _BlackboardVariable
 from carebt.executionContext import ExecutionContext
 from carebt.nodeStatus import NodeStatus
+from carebt.treeNode import _track_params
 from carebt.treeNode import TreeNode
 
 if TYPE_CHECKING:
@@ -37,6 +44,10 @@ class ControlNode(TreeNode, ABC):
 
     """
 
+    __slots__ = ('_child_ec_list', '_child_ptr',
+                 '_contingency_handler_list', '_contingency_dispatch',
+                 '_init_child_ec_list', '_init_contingency_handler_count')
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
         """Init the `ControlNode` with bt_runner and params."""
         super().__init__(bt_runner, params)
@@ -47,7 +58,14 @@ class ControlNode(TreeNode, ABC):
         # the current child pointer
         self._child_ptr = 0
 
-        self._contingency_handler_list = []
+        # the registered contingency-handlers with precompiled regex as
+        # (class name regex, status list, message regex, function name, function)
+        self._contingency_handler_list: List[Tuple[Pattern, List[NodeStatus],
+                                                   Pattern, str, Optional[Callable]]] = []
+
+        # the contingency-handlers which can match a (class name, status) pair,
+        # built on first use and cleared when a handler is registered
+        self._contingency_dispatch: Dict[Tuple[str, NodeStatus], list] = {}
 
         self.set_status(NodeStatus.IDLE)
 
@@ -66,11 +84,12 @@ class ControlNode(TreeNode, ABC):
 
         # _throttle_ms -> tick
         tick: bool = False
-        current_ts = datetime.now()
+        current_ts = self.bt_runner.get_clock().now()
         if(self._throttle_ms is None
-           or int((current_ts - self._last_ts).total_seconds() * 1000) >= self._throttle_ms):
-            self.bt_runner.get_logger().trace(f'ticking {self.__class__.__name__} '
-                                              + f'- {self.get_status()}')
+           or (current_ts - self._last_ts) * 1000 >= self._throttle_ms):
+            if(self.bt_runner.get_logger().is_enabled(LogLevel.TRACE)):
+                self.bt_runner.get_logger().trace(f'ticking {self.__class__.__name__} '
+                                                  + f'- {self.get_status()}')
             tick = True
             self._last_ts = current_ts
 
@@ -82,6 +101,78 @@ class ControlNode(TreeNode, ABC):
 
         self._internal_prepare_next_tick()
 
+    def _internal_save_init_state(self) -> None:
+        # the children and contingency-handlers added in __init__ are kept
+        # when the pooled instance is reset
+        self._init_child_ec_list = tuple(self._child_ec_list)
+        self._init_contingency_handler_count = len(self._contingency_handler_list)
+
+    def _internal_on_delete(self) -> None:
+        self._internal_discard_prebuilt_children()
+        super()._internal_on_delete()
+
+    def _internal_reset(self) -> None:
+        self._internal_discard_prebuilt_children()
+        super()._internal_reset()
+        self._child_ec_list = list(self._init_child_ec_list)
+        self._child_ptr = 0
+        del self._contingency_handler_list[self._init_contingency_handler_count:]
+        self._contingency_dispatch = {}
+
+    def _internal_set_current_child(self, child_ec: ExecutionContext) -> None:
+        # is called before a contingency-handler of the child is executed,
+        # in case the child is not the one `_child_ptr` points to
+        pass
+
+    @final
+    def _internal_create_child(self, child_ec: ExecutionContext) -> None:
+        # create the instance of the child, or reuse a prebuilt or pooled instance
+        if(child_ec.prebuilt_instance is not None):
+            child_ec.instance = child_ec.prebuilt_instance
+            child_ec.prebuilt_instance = None
+        elif(child_ec.node.pool_instances):
+            child_ec.instance = self.bt_runner._internal_acquire_node(child_ec.node)
+        else:
+            child_ec.instance = child_ec.node(self._internal_get_bt_runner())
+
+    @final
+    def _internal_prebuild_child(self, child_ec: ExecutionContext) -> None:
+        # create the instance of the child ahead, without binding its params
+        # and calling `on_init`
+        if(child_ec.instance is None and child_ec.prebuilt_instance is None):
+            self._internal_create_child(child_ec)
+            child_ec.prebuilt_instance = child_ec.instance
+            child_ec.instance = None
+
+    @final
+    def _internal_prebuild_next_child(self) -> None:
+        # create the next child ahead while the current child is running
+        if(self.get_status() == NodeStatus.RUNNING
+           and self._child_ptr + 1 < len(self._child_ec_list)
+           and self._child_ec_list[self._child_ptr].instance is not None
+           and self.bt_runner.get_prebuild_next_child()):
+            self._internal_prebuild_child(self._child_ec_list[self._child_ptr + 1])
+
+    @final
+    def _internal_discard_prebuilt_children(self) -> None:
+        # delete the children which were created ahead but are not reached,
+        # e.g. because this node completed, was aborted or its children removed
+        for child_ec in self._child_ec_list:
+            instance = child_ec.prebuilt_instance
+            if(instance is not None):
+                child_ec.prebuilt_instance = None
+                instance._internal_on_delete()
+                if(instance.pool_instances):
+                    self.bt_runner._internal_release_node(instance)
+
+    @final
+    def _internal_release_child(self, child_ec: ExecutionContext) -> None:
+        # drop the instance of the completed child, or return it to the pool
+        instance = child_ec.instance
+        child_ec.instance = None
+        if(instance is not None and instance.pool_instances):
+            self.bt_runner._internal_release_node(instance)
+
     # @abstractmethod
     def _internal_create_child_nodes(self) -> None:
         raise NotImplementedError
@@ -95,30 +186,114 @@ class ControlNode(TreeNode, ABC):
         raise NotImplementedError
 
     def _internal_bind_in_params(self, child_ec: ExecutionContext) -> None:
-        if(len(child_ec.call_in_params) != len(child_ec.instance._internal_get_in_params())):
-            self.get_logger().warn(f'{child_ec.node.__name__} takes '
-                                   + f'{len(child_ec.instance._internal_get_in_params())} '
-                                   + f'argument(s), but {len(child_ec.call_in_params)} '
-                                   + 'was/were provided')
-        for i, var in enumerate(child_ec.call_in_params):
-            if(isinstance(var, str) and len(var) > 0 and var[0] == '?'):
-                var = var.replace('?', '_', 1)
-                var = getattr(self, var)
-            if(i < len(child_ec.instance._internal_get_in_params())):
-                setattr(child_ec.instance,
-                        child_ec.instance._internal_get_in_params()[i].replace('?', '_', 1), var)
+        # create the binding plan on first use, as (child attribute, parent attribute,
+        # value) tuples, the parent attribute is None in case a value is provided
+        if(child_ec.in_bindings is None):
+            in_params = child_ec.instance._internal_get_in_params()
+            out_params = child_ec.instance._internal_get_out_params()
+            if(len(child_ec.call_in_params) != len(in_params)):
+                self.get_logger().warn(f'{child_ec.node.__name__} takes '
+                                       + f'{len(in_params)} '
+                                       + f'argument(s), but {len(child_ec.call_in_params)} '
+                                       + 'was/were provided')
+            child_ec.in_bindings = []
+            child_ec.blackboard_bindings = []
+            for i, var in enumerate(child_ec.call_in_params[:len(in_params)]):
+                if(isinstance(var, _BlackboardVariable)):
+                    child_ec.blackboard_bindings.append((in_params[i].replace('?', '_', 1),
+                                                         var.name))
+                elif(isinstance(var, str) and len(var) > 0 and var[0] == '?'):
+                    child_ec.in_bindings.append((in_params[i].replace('?', '_', 1),
+                                                 var.replace('?', '_', 1), None))
+                else:
+                    child_ec.in_bindings.append((in_params[i].replace('?', '_', 1), None, var))
+            for i, var in enumerate(child_ec.call_out_params[:len(out_params)]):
+                if(var[0] == '@'):
+                    child_ec.blackboard_bindings.append((out_params[i].replace('?', '_', 1),
+                                                         var[1:]))
+            if(self.track_param_changes):
+                _track_params(self.__class__, [parent_attr for _, parent_attr, _
+                                               in child_ec.in_bindings if parent_attr])
+
+        # remap the parameters of a new instance to the blackboard variables
+        if(child_ec.instance._parent_blackboard is None):
+            blackboard = self.get_blackboard()
+            child_ec.instance._parent_blackboard = blackboard
+            if(child_ec.blackboard_bindings):
+                # the variables are resolved once per scope
+                if(child_ec.blackboard_refs is None
+                   or child_ec.blackboard_refs[0] is not blackboard):
+                    child_ec.blackboard_refs = (blackboard,
+                                                {child_attr: blackboard._internal_get_ref(name)
+                                                 for child_attr, name
+                                                 in child_ec.blackboard_bindings})
+                child_ec.instance._internal_map_to_blackboard(child_ec.blackboard_refs[1])
+
+        parent_versions = self._internal_get_param_versions()
+        if(parent_versions is None):
+            for child_attr, parent_attr, var in child_ec.in_bindings:
+                if(parent_attr is not None):
+                    var = getattr(self, parent_attr)
+                setattr(child_ec.instance, child_attr, var)
+            return
+
+        # only bind the values which changed since they were bound to this instance,
+        # the write is not tracked as a change of the child
+        bound_versions = child_ec.instance._bound_in_versions
+        if(bound_versions is None):
+            bound_versions = [None] * len(child_ec.in_bindings)
+            child_ec.instance._bound_in_versions = bound_versions
+        child_tracked = child_ec.instance.track_param_changes
+        for idx, (child_attr, parent_attr, var) in enumerate(child_ec.in_bindings):
+            if(parent_attr is not None):
+                version = parent_versions.get(parent_attr)
+                if(version is not None and version == bound_versions[idx]):
+                    continue
+                bound_versions[idx] = version
+                var = getattr(self, parent_attr)
+            elif(bound_versions[idx] is not None):
+                continue
+            else:
+                bound_versions[idx] = 0
+            if(child_tracked):
+                child_ec.instance.__dict__[child_attr] = var
+            else:
+                setattr(child_ec.instance, child_attr, var)
 
     def _internal_bind_out_params(self, child_ec: ExecutionContext) -> None:
-        for i, var in enumerate(child_ec.instance._internal_get_out_params()):
-            var = var.replace('?', '_', 1)
-            if(len(child_ec.call_out_params) > i):
-                if(getattr(child_ec.instance, var) is None):
-                    if(getattr(self,
-                               child_ec.call_out_params[i].replace('?', '_', 1), None) is None):
-                        setattr(self, child_ec.call_out_params[i].replace('?', '_', 1), None)
-                else:
-                    setattr(self, child_ec.call_out_params[i].replace('?', '_', 1),
-                            getattr(child_ec.instance, var))
+        # create the binding plan on first use, as (child attribute, parent attribute) tuples
+        if(child_ec.out_bindings is None):
+            out_params = child_ec.instance._internal_get_out_params()
+            child_ec.out_bindings = [(var.replace('?', '_', 1),
+                                      child_ec.call_out_params[i].replace('?', '_', 1))
+                                     for i, var in enumerate(out_params)
+                                     if(len(child_ec.call_out_params) > i
+                                        and child_ec.call_out_params[i][0] != '@')]
+            if(self.track_param_changes):
+                _track_params(self.__class__, [parent_attr for _, parent_attr
+                                               in child_ec.out_bindings])
+
+        # only bind the values which the child changed since they were bound
+        child_versions = child_ec.instance._internal_get_param_versions()
+        bound_versions = None
+        if(child_versions is not None):
+            bound_versions = child_ec.instance._bound_out_versions
+            if(bound_versions is None):
+                bound_versions = [None] * len(child_ec.out_bindings)
+                child_ec.instance._bound_out_versions = bound_versions
+
+        for idx, (child_attr, parent_attr) in enumerate(child_ec.out_bindings):
+            if(bound_versions is not None):
+                version = child_versions.get(child_attr)
+                if(version is not None and version == bound_versions[idx]):
+                    continue
+                bound_versions[idx] = version
+            var = getattr(child_ec.instance, child_attr)
+            if(var is None):
+                if(getattr(self, parent_attr, None) is None):
+                    setattr(self, parent_attr, None)
+            else:
+                setattr(self, parent_attr, var)
 
     @final
     def _internal_tick_child(self, child_ec: ExecutionContext):
@@ -131,40 +306,54 @@ class ControlNode(TreeNode, ABC):
 
     @final
     def _internal_apply_contingencies(self, child_ec: ExecutionContext):
-        self.get_logger().debug('searching contingency-handler for: '
-                                + f'{child_ec.instance.__class__.__name__} - '
-                                + f'{child_ec.instance.get_status()} - '
-                                + f'{child_ec.instance.get_contingency_message()}')
-
-        # iterate over contingency_handler_list
-        for contingency_handler in self._contingency_handler_list:
+        class_name = child_ec.instance.__class__.__name__
+        status = child_ec.instance.get_status()
+
+        # lookup the contingency-handlers which match the class name and the status
+        key = (class_name, status)
+        contingency_handlers = self._contingency_dispatch.get(key)
+        if(contingency_handlers is None):
+            contingency_handlers = [contingency_handler
+                                    for contingency_handler in self._contingency_handler_list
+                                    if(status in contingency_handler[1]
+                                       and contingency_handler[0].match(class_name))]
+            self._contingency_dispatch[key] = contingency_handlers
+        if(len(contingency_handlers) == 0):
+            return
 
-            # handle regex
-            if(isinstance(contingency_handler[0], str)):
-                regexClassName = re.compile(contingency_handler[0])
-            else:
-                regexClassName = re.compile(contingency_handler[0].__name__)
-            regexMessage = re.compile(contingency_handler[2])
-
-            self.get_logger().debug(f'checking contingency_handler: {regexClassName.pattern} - '
-                                    + f'{contingency_handler[1]} - {regexMessage.pattern}')
-
-            # check if contingency-handler matches
-            if(bool(re.match(regexClassName,
-                             child_ec.instance.__class__.__name__))
-                    and child_ec.instance.get_status() in contingency_handler[1]
-                    and bool(re.match(regexMessage,
-                                      child_ec.instance.get_contingency_message()))):
-                self.get_logger().debug(f'{child_ec.instance.__class__.__name__} -> '
-                                        + f'run contingency_handler {contingency_handler[3]}')
+        debug = self.get_logger().is_enabled(LogLevel.DEBUG)
+        if(debug):
+            self.get_logger().debug('searching contingency-handler for: '
+                                    + f'{class_name} - '
+                                    + f'{status} - '
+                                    + f'{child_ec.instance.get_contingency_message()}')
+
+        # iterate over the matching contingency-handlers in the order they are registered
+        for contingency_handler in contingency_handlers:
+
+            if(debug):
+                self.get_logger().debug('checking contingency_handler: '
+                                        + f'{contingency_handler[0].pattern} - '
+                                        + f'{contingency_handler[1]} - '
+                                        + f'{contingency_handler[2].pattern}')
+
+            # check if contingency-message matches
+            if(contingency_handler[2].match(child_ec.instance.get_contingency_message())):
+                if(debug):
+                    self.get_logger().debug(f'{class_name} -> '
+                                            + f'run contingency_handler {contingency_handler[3]}')
                 # append ContingencyHistoryEntry to history
                 self._internal_append_to_contingency_history(
-                    ContingencyHistoryEntry(child_ec.instance.__class__.__name__,
-                                            child_ec.instance.get_status(),
+                    ContingencyHistoryEntry(class_name,
+                                            status,
                                             child_ec.instance.get_contingency_message(),
                                             contingency_handler[3]))
                 # execute function attached to the contingency-handler
-                exec(f'self.{contingency_handler[3]}()')
+                self._internal_set_current_child(child_ec)
+                if(contingency_handler[4] is None):
+                    getattr(self, contingency_handler[3])()
+                else:
+                    contingency_handler[4](self)
                 break
 
     # PUBLIC
@@ -197,12 +386,28 @@ class ControlNode(TreeNode, ABC):
             The function which is called to handle the contingency.
 
         """
-        # for the function only store the name, thus there is no 'bound method' to self
-        # which increases the ref count and prevents the gc to delete the object
-        self._contingency_handler_list.append((node,
+        # compile the regex once, a node class matches by its name
+        if(isinstance(node, str)):
+            regexClassName = re.compile(node)
+        else:
+            regexClassName = re.compile(node.__name__)
+        regexMessage = re.compile(contingency_message)
+
+        # for the function only store the name and the unbound function, thus there
+        # is no 'bound method' to self which increases the ref count and prevents
+        # the gc to delete the object
+        function_name = contingency_function.__name__
+        function = getattr(contingency_function, '__func__', contingency_function)
+        # the unbound function is only called directly if it is the method of this
+        # node, otherwise the method is looked up by its name on the node
+        if(getattr_static(type(self), function_name, None) is not function):
+            function = None
+        self._contingency_handler_list.append((regexClassName,
                                                node_status_list,
-                                               contingency_message,
-                                               contingency_function.__name__))
+                                               regexMessage,
+                                               function_name,
+                                               function))
+        self._contingency_dispatch.clear()
 
     @final
     def fix_current_child(self) -> None:
@@ -215,13 +420,15 @@ class ControlNode(TreeNode, ABC):
         that the node was 'fixed'.
 
         """
-        self.get_logger().trace(f'{self.__class__.__name__} -> fix_current_child called')
+        if(self.get_logger().is_enabled(LogLevel.TRACE)):
+            self.get_logger().trace(f'{self.__class__.__name__} -> fix_current_child called')
         self.set_current_child_status(NodeStatus.FIXED)
 
     @final
     def abort_current_child(self) -> None:
         """Abort the currently executing child."""
-        self.get_logger().trace(f'{self.__class__.__name__} -> abort_current_child called')
+        if(self.get_logger().is_enabled(LogLevel.TRACE)):
+            self.get_logger().trace(f'{self.__class__.__name__} -> abort_current_child called')
         if(self._child_ptr < len(self._child_ec_list)
            and self._child_ec_list[self._child_ptr].instance is not None):
             self._child_ec_list[self._child_ptr].instance.abort()
@@ -236,6 +443,7 @@ class ControlNode(TreeNode, ABC):
             Status of the node
 
         """
-        self.get_logger().trace(f'{self.__class__.__name__} -> set_current_child_status '
-                                + f'to {node_status}')
+        if(self.get_logger().is_enabled(LogLevel.TRACE)):
+            self.get_logger().trace(f'{self.__class__.__name__} -> set_current_child_status '
+                                    + f'to {node_status}')
         self._child_ec_list[self._child_ptr].instance.set_status(node_status)
@@ -158,3 +158,4 @@ class AddTwoNumbersLongRunningAction(ActionNode):
         self._z = self._x + self._y
         print(f'AddTwoNumbersLongRunningAction: DONE {self._x} + {self._y} = {self._z}')
         self.set_status(NodeStatus.SUCCESS)
+        self.request_tick()
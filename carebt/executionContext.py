@@ -12,43 +12,146 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from ast import literal_eval
+from copy import deepcopy
+from keyword import iskeyword
+from typing import Any
+from typing import Dict
 from typing import List
+from typing import Tuple
 
+from carebt.blackboard import Blackboard
 from carebt.treeNode import TreeNode
 
+# kinds of call input params
+_VARIABLE = 0  # a careBT variable, e.g. ?x
+_ATTRIBUTE = 1  # a member variable of the parent, e.g. value or pose.x
+_CONSTANT = 2  # an immutable value, e.g. 3, 'hello' or (1, 2)
+_MUTABLE = 3  # a mutable value, e.g. [1, 2], which is copied for each child
+_EXPRESSION = 4  # any other expression, which is evaluated with eval
+
+
+class _BlackboardVariable:
+    # marks a call input param which is remapped to a blackboard variable, e.g. @x
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _BlackboardVariable) and other.name == self.name
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    def __repr__(self) -> str:
+        return f'@{self.name}'
+
+
+def _is_immutable(value: Any) -> bool:
+    if(isinstance(value, (tuple, frozenset))):
+        return all(_is_immutable(v) for v in value)
+    return isinstance(value, (str, bytes, int, float, complex, bool, type(None)))
+
+
+class _BindingPlan:
+    # the parsed call params of a child, e.g. '?x 3 value => ?z'
+
+    def __init__(self, params: str):
+        self.in_params: List[Tuple[int, Any]] = []
+        self.out_params: List[str] = []
+
+        # extract call input params if available
+        for p in filter(None, params.split('=>')[0].split(' ')):
+            # param is a careBt variable (starts with ?)
+            if(p[0] == '?'):
+                self.in_params.append((_VARIABLE, p))
+                continue
+            # param is a blackboard variable (starts with @)
+            if(p[0] == '@'):
+                self.in_params.append((_CONSTANT, _BlackboardVariable(p[1:])))
+                continue
+            # param is a member variable of the parent
+            names = p.split('.')
+            if(all(name.isidentifier() and not iskeyword(name) for name in names)):
+                self.in_params.append((_ATTRIBUTE, names))
+                continue
+            # param is a value
+            try:
+                value = literal_eval(p)
+            except (ValueError, SyntaxError):
+                self.in_params.append((_EXPRESSION, p))
+                continue
+            if(_is_immutable(value)):
+                self.in_params.append((_CONSTANT, value))
+            else:
+                self.in_params.append((_MUTABLE, value))
+
+        # extract call output params if available
+        if(len(params.split('=>')) == 2):
+            for p in filter(None, params.split('=>')[1].split(' ')):
+                self.out_params.append(p)
+        self.out_params = tuple(self.out_params)
+
+    def bind_in_params(self, parent: TreeNode) -> tuple:
+        call_in_params = []
+        for kind, param in self.in_params:
+            if(kind == _VARIABLE or kind == _CONSTANT):
+                call_in_params.append(param)
+            elif(kind == _ATTRIBUTE):
+                value = parent
+                for name in param:
+                    value = getattr(value, name)
+                call_in_params.append(value)
+            elif(kind == _MUTABLE):
+                call_in_params.append(deepcopy(param))
+            else:
+                try:
+                    call_in_params.append(eval(f'parent.{param}'))
+                except SyntaxError:
+                    call_in_params.append(eval(param))
+        return tuple(call_in_params)
+
+
+# the binding plans, the call params are parsed only once for each params string
+_binding_plans: Dict[str, _BindingPlan] = {}
+
 
 class ExecutionContext():
 
+    __slots__ = ('call_in_params', 'call_out_params', 'node', 'instance', 'prebuilt_instance',
+                 'in_bindings', 'out_bindings', 'blackboard_bindings', 'blackboard_refs')
+
     def __init__(self, parent: TreeNode, node: TreeNode, params: str):
-        self.call_in_params: List[str] = []
-        self.call_out_params: List[str] = []
+        # the params are kept in tuples, the empty tuple is shared
+        self.call_in_params: Tuple[Any, ...] = ()
+        self.call_out_params: Tuple[str, ...] = ()
 
         if(params is not None):
-            params = params.replace('   ', ' ')
-            params = params.replace('  ',  ' ')
-
-            # extract call input params if available
-            for p in filter(None, params.split('=>')[0].split(' ')):
-                # param is a careBt variable (starts with ?)
-                if(p[0] == '?'):
-                    self.call_in_params.append(p)
-                else:
-                    try:
-                        # param is a member variable of the parent
-                        self.call_in_params.append(eval(f'parent.{p}'))
-                    except SyntaxError:
-                        # param is a value
-                        self.call_in_params.append(eval(p))
-            self.call_in_params = tuple(self.call_in_params)
-
-            # extract call output params if available
-            if(len(params.split('=>')) == 2):
-                for p in filter(None, params.split('=>')[1].split(' ')):
-                    self.call_out_params.append(p)
-                self.call_out_params = tuple(self.call_out_params)
+            plan = _binding_plans.get(params)
+            if(plan is None):
+                plan = _BindingPlan(params)
+                _binding_plans[params] = plan
+            self.call_in_params = plan.bind_in_params(parent)
+            if(len(plan.out_params) > 0):
+                self.call_out_params = plan.out_params
 
         # the node
         self.node = node
 
         # placeholder for the instance of the node
         self.instance = None
+
+        # the instance created ahead, it becomes the instance when the node
+        # is reached, see `AbstractRunner.set_prebuild_next_child`
+        self.prebuilt_instance = None
+
+        # the plans to bind the in and out params of the instance,
+        # created by the parent when the params are bound the first time
+        self.in_bindings: List[Tuple[str, str, Any]] = None
+        self.out_bindings: List[Tuple[str, str]] = None
+        # the (child attribute, variable name) tuples of the params
+        # which are remapped to blackboard variables
+        self.blackboard_bindings: List[Tuple[str, str]] = None
+        # the blackboard scope and the (scope, slot) references of the remapped
+        # child attributes, resolved when the child is created in a new scope
+        self.blackboard_refs: Tuple[Blackboard, Dict[str, Tuple[Blackboard, int]]] = None
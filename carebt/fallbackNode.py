@@ -16,6 +16,7 @@ from abc import ABC
 
 from typing import TYPE_CHECKING
 
+from carebt.abstractLogger import LogLevel
 from carebt.controlNode import ControlNode
 from carebt.executionContext import ExecutionContext
 from carebt.nodeStatus import NodeStatus
@@ -47,18 +48,20 @@ class FallbackNode(ControlNode, ABC):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
         """Init the `FallbackNode` with bt_runner and params."""
         super().__init__(bt_runner, params)
-        self.get_logger().info(f'creating {self.__class__.__name__}')
+        if(self.get_logger().is_enabled(LogLevel.INFO)):
+            self.get_logger().info(f'creating {self.__class__.__name__}')
 
     # PROTECTED
 
     def _internal_create_child_nodes(self) -> None:
         if(self._child_ec_list[self._child_ptr].instance is None):
             # create node instance
-            self._child_ec_list[self._child_ptr].instance = \
-                self._child_ec_list[self._child_ptr].node(self._internal_get_bt_runner())
+            self._internal_create_child(self._child_ec_list[self._child_ptr])
             self._internal_bind_in_params(self._child_ec_list[self._child_ptr])
             self._child_ec_list[self._child_ptr].instance.on_init()
 
@@ -89,7 +92,7 @@ class FallbackNode(ControlNode, ABC):
                         .instance.get_contingency_message()
                     if(self._child_ec_list[self._child_ptr].instance is not None):
                         self._child_ec_list[self._child_ptr].instance._internal_on_delete()
-                        self._child_ec_list[self._child_ptr].instance = None
+                        self._internal_release_child(self._child_ec_list[self._child_ptr])
                     # check if there is at least one more node to run
                     if(self._child_ptr + 1 < len(self._child_ec_list)):
                         self._child_ptr += 1
@@ -102,14 +105,18 @@ class FallbackNode(ControlNode, ABC):
            or self.get_status() == NodeStatus.FAILURE
            or self.get_status() == NodeStatus.ABORTED
            or self.get_status() == NodeStatus.FIXED):
-            self.get_logger().info(f'finished {self.__class__.__name__}')
+            if(self.get_logger().is_enabled(LogLevel.INFO)):
+                self.get_logger().info(f'finished {self.__class__.__name__}')
             if(self._child_ec_list[self._child_ptr].instance is not None):
                 self._child_ec_list[self._child_ptr].instance._internal_on_delete()
-                self._child_ec_list[self._child_ptr].instance = None
+                self._internal_release_child(self._child_ec_list[self._child_ptr])
+
+        self._internal_prebuild_next_child()
 
     def _internal_on_abort(self) -> None:
         super()._internal_on_abort()
-        self.get_logger().info(f'aborting {self.__class__.__name__}')
+        if(self.get_logger().is_enabled(LogLevel.INFO)):
+            self.get_logger().info(f'aborting {self.__class__.__name__}')
         if(self._child_ec_list[self._child_ptr].instance is not None):
             self.set_status(NodeStatus.ABORTED)
             self.set_contingency_message(self._child_ec_list[self._child_ptr]
@@ -121,7 +128,7 @@ class FallbackNode(ControlNode, ABC):
 
         if(self._child_ec_list[self._child_ptr].instance is not None):
             self._child_ec_list[self._child_ptr].instance._internal_on_delete()
-            self._child_ec_list[self._child_ptr].instance = None
+            self._internal_release_child(self._child_ec_list[self._child_ptr])
         self.on_abort()
 
     # PUBLIC
@@ -177,5 +184,7 @@ class FallbackNode(ControlNode, ABC):
         if(len(self._child_ec_list) != 0
            and self._child_ec_list[self._child_ptr].instance is not None):
             self._child_ec_list[self._child_ptr].instance._internal_on_delete()
+            self._internal_release_child(self._child_ec_list[self._child_ptr])
+        self._internal_discard_prebuilt_children()
         self._child_ec_list.clear()
         self._child_ptr = 0
@@ -0,0 +1,185 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC
+from abc import abstractmethod
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any
+from typing import TYPE_CHECKING
+
+from carebt.abstractLogger import LogLevel
+from carebt.actionNode import ActionNode
+from carebt.nodeStatus import NodeStatus
+
+if TYPE_CHECKING:
+    from carebt.behaviorTreeRunner import BehaviorTreeRunner  # pragma: no cover
+
+
+class FutureActionNode(ActionNode, ABC):
+    """The careBT `FutureActionNode` class.
+
+    `FutureActionNodes` are `ActionNodes` which offload blocking work, like
+    I/O or calls into libraries which release the GIL, to an executor. When
+    the node is ticked, `execute` is submitted to the executor of the
+    `BehaviorTreeRunner` and the node is `SUSPENDED` until the returned future
+    completes. Thus, the node is not ticked while the work is pending. Then,
+    `on_result` is called with the result in the tick thread, which completes
+    the node with `SUCCESS` by default. If `on_result` does not set a final
+    status, `execute` is submitted again with the next tick. If `execute`
+    raises an exception, the node completes with `FAILURE` and the name of the
+    exception as contingency-message.
+
+    If the node is aborted, e.g. by a timeout, the future is canceled. An
+    `execute` which is already running is not interrupted, but its result is
+    ignored.
+
+    Parameters
+    ----------
+    bt_runner: 'BehaviorTreeRunner'
+        The behavior tree runner which started the tree.
+    params: str
+        The input/Output parameters of the node
+        e.g. '?x ?y => ?z'
+
+    """
+
+    __slots__ = ('__future', '__future_lock', '__executor')
+
+    def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
+        """Init the `FutureActionNode` with bt_runner and params."""
+        super().__init__(bt_runner, params)
+        self.__future: Future = None
+        self.__future_lock = Lock()
+        self.__executor: Executor = None
+
+    # PRIVATE
+
+    def __on_future_done(self, future: Future) -> None:
+        # is called by the thread which completed the future
+        with self.__future_lock:
+            if(future is not self.__future or future.cancelled()):
+                return
+            if(self.get_status() == NodeStatus.SUSPENDED):
+                self.set_status(NodeStatus.RUNNING)
+        self.request_tick()
+
+    def __complete(self, future: Future) -> None:
+        # process the result of the completed future in the tick thread
+        self.__future = None
+        try:
+            result = future.result()
+        except Exception as e:
+            self.get_logger().error(f'{self.__class__.__name__}.execute raised '
+                                    + f'{e.__class__.__name__}: {e}')
+            self.set_status(NodeStatus.FAILURE)
+            self.set_contingency_message(e.__class__.__name__)
+            return
+        self.on_result(result)
+
+    def __cancel_future(self) -> None:
+        # abort might be called from another thread, e.g. by a result callback
+        with self.__future_lock:
+            future = self.__future
+            self.__future = None
+        if(future is not None):
+            future.cancel()
+
+    # PROTECTED
+
+    def _internal_get_default_executor(self) -> Executor:
+        return self.bt_runner.get_executor()
+
+    def _internal_submit(self, executor: Executor) -> Future:
+        return executor.submit(self.execute)
+
+    def _internal_on_tick(self) -> None:
+        current_ts = self.bt_runner.get_clock().now()
+        if(self._throttle_ms is None or
+                (current_ts - self._last_ts) * 1000 >= self._throttle_ms):
+            if(self.get_status() == NodeStatus.IDLE or
+                    self.get_status() == NodeStatus.RUNNING):
+                if(self.bt_runner.get_logger().is_enabled(LogLevel.TRACE)):
+                    self.bt_runner.get_logger().trace(f'ticking {self.__class__.__name__} - '
+                                                      + f'{self.get_status()}')
+                future = self.__future
+                if(future is not None and future.done()):
+                    self.__complete(future)
+                else:
+                    self.set_status(NodeStatus.SUSPENDED)
+                    executor = self.__executor or self._internal_get_default_executor()
+                    with self.__future_lock:
+                        self.__future = self._internal_submit(executor)
+                    self.__future.add_done_callback(self.__on_future_done)
+                self._last_ts = current_ts
+
+    def _internal_on_abort(self) -> None:
+        self.__cancel_future()
+        super()._internal_on_abort()
+
+    def _internal_on_delete(self) -> None:
+        self.__cancel_future()
+        super()._internal_on_delete()
+
+    def _internal_reset(self) -> None:
+        self.__cancel_future()
+        super()._internal_reset()
+
+    # PUBLIC
+
+    def set_executor(self, executor: Executor) -> None:
+        """Set the executor of this node.
+
+        By default, the work is submitted to the executor of the
+        `BehaviorTreeRunner`, see `AbstractRunner.get_executor`.
+
+        Parameters
+        ----------
+        executor: Executor
+            The executor, or None to use the executor of the runner
+
+        """
+        self.__executor = executor
+
+    @abstractmethod
+    def execute(self) -> Any:
+        """Execute the blocking work.
+
+        Is called by a thread of the executor. The input parameters can be
+        read, but the node should not be modified. The returned result is
+        passed to `on_result`.
+
+        Returns
+        -------
+        Any
+            The result of the work
+
+        """
+        raise NotImplementedError
+
+    def on_result(self, result: Any) -> None:
+        """Is called with the result of `execute`.
+
+        Is called in the tick thread when `execute` returned. Override this
+        function to set the output parameters. By default, the node completes
+        with `SUCCESS`.
+
+        Parameters
+        ----------
+        result: Any
+            The result returned by `execute`
+
+        """
+        self.set_status(NodeStatus.SUCCESS)
@@ -0,0 +1,140 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC
+from abc import abstractmethod
+from typing import Generator
+from typing import TYPE_CHECKING
+
+from carebt.abstractLogger import LogLevel
+from carebt.actionNode import ActionNode
+from carebt.nodeStatus import NodeStatus
+
+if TYPE_CHECKING:
+    from carebt.behaviorTreeRunner import BehaviorTreeRunner  # pragma: no cover
+
+
+class GeneratorActionNode(ActionNode, ABC):
+    """The careBT `GeneratorActionNode` class.
+
+    `GeneratorActionNodes` are `ActionNodes` whose `on_tick` callback is a
+    generator which gives up the tick with `yield` and resumes where it left
+    off with the next tick. Thus, an action which requires more ticks to
+    complete can be written as a sequence of steps without keeping track of
+    its progress in attributes. If the generator yields, the node is
+    `RUNNING`. If the generator returns, the node completes with `SUCCESS`.
+    If the generator raises an exception, the node completes with `FAILURE`
+    and the name of the exception as contingency-message. A status which is
+    set by the generator itself, e.g. `SUSPENDED` or `FAILURE`, is kept.
+
+    If the node is aborted or deleted before the generator returned, the
+    generator is closed, so that `finally` blocks are executed.
+
+    Parameters
+    ----------
+    bt_runner: 'BehaviorTreeRunner'
+        The behavior tree runner which started the tree.
+    params: str
+        The input/Output parameters of the node
+        e.g. '?x ?y => ?z'
+
+    """
+
+    __slots__ = ('__generator',)
+
+    def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
+        """Init the `GeneratorActionNode` with bt_runner and params."""
+        super().__init__(bt_runner, params)
+        self.__generator: Generator[None, None, None] = None
+
+    # PRIVATE
+
+    def __close_generator(self) -> None:
+        generator = self.__generator
+        self.__generator = None
+        # a generator which aborts its own node is closed after it yielded
+        if(generator is not None and not generator.gi_running):
+            generator.close()
+
+    def __resume_generator(self) -> None:
+        if(self.__generator is None):
+            self.__generator = self.on_tick()
+        generator = self.__generator
+        try:
+            next(generator)
+        except StopIteration:
+            self.__generator = None
+            if(self.get_status() == NodeStatus.IDLE or
+                    self.get_status() == NodeStatus.RUNNING):
+                self.set_status(NodeStatus.SUCCESS)
+        except Exception as e:
+            self.__generator = None
+            self.get_logger().error(f'{self.__class__.__name__}.on_tick raised '
+                                    + f'{e.__class__.__name__}: {e}')
+            self.set_status(NodeStatus.FAILURE)
+            self.set_contingency_message(e.__class__.__name__)
+        else:
+            if(self.get_status() == NodeStatus.IDLE):
+                self.set_status(NodeStatus.RUNNING)
+            elif(self.get_status() != NodeStatus.RUNNING and
+                    self.get_status() != NodeStatus.SUSPENDED):
+                # the generator set a final status before it yielded
+                if(self.__generator is generator):
+                    self.__generator = None
+                generator.close()
+
+    # PROTECTED
+
+    def _internal_on_tick(self) -> None:
+        current_ts = self.bt_runner.get_clock().now()
+        if(self._throttle_ms is None or
+                (current_ts - self._last_ts) * 1000 >= self._throttle_ms):
+            if(self.get_status() == NodeStatus.IDLE or
+                    self.get_status() == NodeStatus.RUNNING):
+                if(self.bt_runner.get_logger().is_enabled(LogLevel.TRACE)):
+                    self.bt_runner.get_logger().trace(f'ticking {self.__class__.__name__} - '
+                                                      + f'{self.get_status()}')
+                self.__resume_generator()
+                self._last_ts = current_ts
+
+    def _internal_on_abort(self) -> None:
+        self.__close_generator()
+        super()._internal_on_abort()
+
+    def _internal_on_delete(self) -> None:
+        self.__close_generator()
+        super()._internal_on_delete()
+
+    def _internal_reset(self) -> None:
+        self.__close_generator()
+        super()._internal_reset()
+
+    # PUBLIC
+
+    @abstractmethod
+    def on_tick(self) -> Generator[None, None, None]:
+        """Is called on the first tick and resumed on each further tick.
+
+        The `on_tick` generator is created when the `Node` is ticked the first
+        time. Each further tick, considering the optional throttle rate,
+        resumes the generator after the `yield` which gave up the previous
+        tick.
+
+        Yields
+        ------
+        None
+            Gives up the current tick
+
+        """
+        raise NotImplementedError
@@ -0,0 +1,258 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import Executor
+from threading import Lock
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from carebt.abstractLogger import AbstractLogger
+from carebt.abstractLogger import LogLevel
+from carebt.abstractRunner import AbstractRunner
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.blackboard import Blackboard
+from carebt.clock import AbstractClock
+from carebt.timerService import TimerService
+from carebt.treeNode import TreeNode
+
+
+class _HostedBehaviorTreeRunner(BehaviorTreeRunner):
+
+    def __init__(self, host: 'MultiTreeRunner'):
+        # `super().__init__` is not called, the logger, the clock, the timer
+        # service and the executors are provided by the host, thus only the
+        # state of the tree is kept per tree
+        self.__host = host
+        self._instance = None
+        self._tick_count = 0
+        self._overrun_count = 0
+        self._blackboard = None
+        self._node_pool = {}
+
+    def _internal_reset_wakeup(self) -> None:
+        # the wakeup is handled by the host
+        pass
+
+    def get_blackboard(self) -> Blackboard:
+        # the blackboard is created on first use
+        if(self._blackboard is None):
+            self._blackboard = Blackboard()
+        return self._blackboard
+
+    def get_logger(self) -> AbstractLogger:
+        return self.__host.get_logger()
+
+    def get_clock(self) -> AbstractClock:
+        return self.__host.get_clock()
+
+    def get_timer_service(self) -> TimerService:
+        return self.__host.get_timer_service()
+
+    def get_prebuild_next_child(self) -> bool:
+        return self.__host.get_prebuild_next_child()
+
+    def get_executor(self) -> Executor:
+        return self.__host.get_executor()
+
+    def get_process_executor(self) -> Executor:
+        return self.__host.get_process_executor()
+
+    def notify(self) -> None:
+        self.__host.notify()
+
+    def shutdown(self) -> None:
+        # the executors are owned by the host
+        pass
+
+
+class MultiTreeRunner(AbstractRunner):
+    """The careBT `MultiTreeRunner` class.
+
+    The `MultiTreeRunner` executes many independent careBT behavior trees
+    within a single thread. All trees are ticked one after another in the same
+    loop with a shared tick rate. Trees can be added and removed at runtime,
+    also from other threads. Each tree is represented by a `BehaviorTreeRunner`
+    handle which provides its status, contingency-message and tick count. When
+    a tree completes, it is removed and the callback provided to `add_tree`
+    is called.
+    """
+
+    def __init__(self):
+        """Init the `MultiTreeRunner`."""
+        super().__init__()
+        self._run_forever = False
+        self._stop_requested = False
+        self.__trees: Dict[BehaviorTreeRunner, Callable] = {}
+        self.__pending_lock = Lock()
+        self.__pending_add: List[Tuple[BehaviorTreeRunner, Callable]] = []
+        self.__pending_remove: List[BehaviorTreeRunner] = []
+
+    # PRIVATE
+
+    def __apply_pending(self) -> None:
+        # add and remove the trees requested since the last tick
+        with self.__pending_lock:
+            pending_add = self.__pending_add
+            pending_remove = self.__pending_remove
+            self.__pending_add = []
+            self.__pending_remove = []
+        for tree, on_done in pending_add:
+            self.__trees[tree] = on_done
+        for tree in pending_remove:
+            self.__trees.pop(tree, None)
+            tree.abort()
+
+    # PROTECTED
+
+    def _internal_tick_tree(self, tree: BehaviorTreeRunner) -> None:
+        # the timers of all trees are fired once per tick by `tick_once`
+        tree._internal_tick_tree_only()
+
+    # PUBLIC
+
+    def add_tree(self, node: TreeNode, params: str = None,
+                 on_done: Callable[[BehaviorTreeRunner], None] = None) -> BehaviorTreeRunner:
+        """Add a behavior tree.
+
+        Adds the provided node, respectively behavior tree, which is ticked
+        starting with the next tick. `add_tree` can be called from any thread.
+
+        Parameters
+        ----------
+        node: TreeNode
+            The node which should be executed
+
+        params: str, optional
+            The parameters for the node which should be executed
+
+        on_done: Callable[[BehaviorTreeRunner], None], optional
+            Is called with the handle of the tree when the tree completes
+
+        Returns
+        -------
+        `BehaviorTreeRunner`
+            The handle of the added tree
+
+        """
+        tree = _HostedBehaviorTreeRunner(self)
+        tree.start(node, params)
+        with self.__pending_lock:
+            self.__pending_add.append((tree, on_done))
+        self.notify()
+        return tree
+
+    def remove_tree(self, tree: BehaviorTreeRunner) -> None:
+        """Remove a behavior tree.
+
+        Removes the tree with the provided handle. In case the tree is not
+        done yet, it is aborted with the next tick. `remove_tree` can be called
+        from any thread.
+
+        Parameters
+        ----------
+        tree: BehaviorTreeRunner
+            The handle of the tree to remove
+
+        """
+        with self.__pending_lock:
+            self.__pending_remove.append(tree)
+        self.notify()
+
+    def get_tree_count(self) -> int:
+        """Return the number of trees which are currently executed.
+
+        Returns
+        -------
+        int
+            The number of trees
+
+        """
+        return len(self.__trees)
+
+    def tick_once(self) -> None:
+        """Execute one tick of all behavior trees.
+
+        Ticks all trees which are not done yet exactly once in the order
+        they were added. Expired timers of all trees are fired before. Trees
+        which complete are removed and their `on_done` callback is called.
+
+        """
+        self.__apply_pending()
+        self.get_timer_service().fire_due()
+        self._tick_count += 1
+        if(self.get_logger().is_enabled(LogLevel.TRACE)):
+            self.get_logger().trace('---------------------------------- '
+                                    + f'multi-tree tick-count: {self._tick_count} '
+                                    + f'({len(self.__trees)} trees)')
+        done = []
+        for tree in self.__trees:
+            self._internal_tick_tree(tree)
+            if(tree.is_done()):
+                done.append(tree)
+        for tree in done:
+            on_done = self.__trees.pop(tree)
+            if(on_done is not None):
+                on_done(tree)
+
+    def is_done(self) -> bool:
+        """Return whether the execution is done.
+
+        The execution is done if `stop` was called, or if all trees are done
+        and the `MultiTreeRunner` is not running forever.
+
+        Returns
+        -------
+        bool
+            True, if the execution is done
+
+        """
+        if(self._stop_requested):
+            return True
+        if(self._run_forever):
+            return False
+        with self.__pending_lock:
+            return len(self.__trees) == 0 and len(self.__pending_add) == 0
+
+    def stop(self) -> None:
+        """Stop the execution.
+
+        Requests `run` to return after the current tick. The remaining trees
+        are not aborted and can be continued by calling `run` again.
+        `stop` can be called from any thread.
+
+        """
+        self._stop_requested = True
+        self.notify()
+
+    def run(self, run_forever: bool = False) -> None:
+        """Execute all behavior trees.
+
+        Ticks all added trees at the tick rate until they are done. If
+        `run_forever` is True, `run` does not return when all trees are
+        done, but waits for further trees until `stop` is called.
+
+        Parameters
+        ----------
+        run_forever: bool, optional
+            Keep running when all trees are done
+
+        """
+        self._run_forever = run_forever
+        self._stop_requested = False
+        self._tick_count = 0
+        self._overrun_count = 0
+        self._internal_reset_wakeup()
+        self._internal_run_loop()
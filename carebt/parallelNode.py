@@ -13,14 +13,22 @@
 # limitations under the License.
 
 from abc import ABC
+from concurrent.futures import Executor
+from concurrent.futures import wait
+from threading import local
+from typing import Dict
 from typing import List
 
+from carebt.abstractLogger import LogLevel
 from carebt.behaviorTreeRunner import BehaviorTreeRunner
 from carebt.controlNode import ControlNode
 from carebt.executionContext import ExecutionContext
 from carebt.nodeStatus import NodeStatus
 from carebt.treeNode import TreeNode
 
+# marks the threads which are ticking a child of a `ParallelNode` for a pool
+_pool_thread = local()
+
 
 class ParallelNode(ControlNode, ABC):
     """The careBT `ParallelNode` class.
@@ -51,11 +59,17 @@ class ParallelNode(ControlNode, ABC):
 
     """
 
+    __slots__ = ('__last_child_contingency_msg', '_created_child_size',
+                 '_success_threshold', '_success_count', '_fail_count',
+                 '_active_children', '_suspended_children', '_next_child_seq',
+                 '_executor')
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner',
                  success_threshold: int, params: str = None):
         """Init the `ParallelNode` with bt_runner, success_threshold and params."""
         super().__init__(bt_runner, params)
-        self.get_logger().info(f'creating {self.__class__.__name__}')
+        if(self.get_logger().is_enabled(LogLevel.INFO)):
+            self.get_logger().info(f'creating {self.__class__.__name__}')
 
         self.__last_child_contingency_msg = ''
 
@@ -63,12 +77,84 @@ class ParallelNode(ControlNode, ABC):
         self._child_ec_list: List[ExecutionContext] = []
         self._created_child_size = 0
 
+        # the created children which are not completed, mapped to a sequence
+        # number which keeps the order they were added; the children which
+        # are `SUSPENDED` are not ticked, thus they are kept separately
+        self._active_children: Dict[ExecutionContext, int] = {}
+        self._suspended_children: Dict[ExecutionContext, int] = {}
+        self._next_child_seq = 0
+
+        # the thread pool to tick the children concurrently, if set
+        self._executor: Executor = None
+
         self._success_threshold = success_threshold
         self._success_count = 0
         self._fail_count = 0
 
+    # PRIVATE
+
+    def __internal_complete_tick(self, child_ec: ExecutionContext) -> None:
+        # apply the contingencies of the ticked child and count its completion
+        self._internal_apply_contingencies(child_ec)
+        if(child_ec.instance is not None):
+            self._internal_bind_out_params(child_ec)
+            cur_child_state = child_ec.instance.get_status()
+            if(cur_child_state == NodeStatus.SUCCESS
+               or cur_child_state == NodeStatus.FIXED):
+                self._internal_drop_child(child_ec)
+                self._success_count += 1
+            elif(cur_child_state == NodeStatus.FAILURE
+                 or cur_child_state == NodeStatus.ABORTED):
+                self.__last_child_contingency_msg = child_ec.instance\
+                                                    .get_contingency_message()
+                self._internal_drop_child(child_ec)
+                self._fail_count += 1
+            elif(cur_child_state == NodeStatus.SUSPENDED):
+                if(child_ec in self._active_children):
+                    self._suspended_children[child_ec] = \
+                        self._active_children.pop(child_ec)
+            elif(child_ec in self._suspended_children):
+                # resumed by a contingency-handler
+                self._active_children[child_ec] = \
+                    self._suspended_children.pop(child_ec)
+                self._internal_sort_active_children()
+
+    def __tick_child_in_pool(self, child_ec: ExecutionContext) -> None:
+        # a nested `ParallelNode` ticks its children inline on this thread, it
+        # must not wait for a pool thread which might be occupied by its parent
+        _pool_thread.active = True
+        try:
+            self._internal_tick_child(child_ec)
+        finally:
+            _pool_thread.active = False
+
     # PROTECTED
 
+    def _internal_reset(self) -> None:
+        super()._internal_reset()
+        self.__last_child_contingency_msg = ''
+        self._created_child_size = 0
+        self._success_count = 0
+        self._fail_count = 0
+        self._active_children = {}
+        self._suspended_children = {}
+
+    def _internal_set_current_child(self, child_ec: ExecutionContext) -> None:
+        # the position is only looked up if a contingency-handler is executed
+        self._child_ptr = self._child_ec_list.index(child_ec)
+
+    def _internal_sort_active_children(self) -> None:
+        # keep the active children in the order they were added
+        self._active_children = dict(sorted(self._active_children.items(),
+                                            key=lambda item: item[1]))
+
+    def _internal_drop_child(self, child_ec: ExecutionContext) -> None:
+        # delete the instance of the child and remove it from the active children
+        child_ec.instance._internal_on_delete()
+        self._internal_release_child(child_ec)
+        self._active_children.pop(child_ec, None)
+        self._suspended_children.pop(child_ec, None)
+
     def _internal_create_child_nodes(self) -> None:
         if((self.get_status() == NodeStatus.IDLE
             or self.get_status() == NodeStatus.RUNNING
@@ -77,77 +163,105 @@ class ParallelNode(ControlNode, ABC):
             for _ in range(len(self._child_ec_list) - self._created_child_size):
                 child_ec = self._child_ec_list[self._created_child_size]
                 # create node instance
-                child_ec.instance = child_ec.node(self._internal_get_bt_runner())
+                self._internal_create_child(child_ec)
                 self._internal_bind_out_params(child_ec)
                 self._internal_bind_in_params(child_ec)
                 child_ec.instance.on_init()
                 self._created_child_size += 1
+                self._active_children[child_ec] = self._next_child_seq
+                self._next_child_seq += 1
 
     def _internal_tick_child_nodes(self, tick: bool) -> None:
         if(tick is True):
-            for self._child_ptr, child_ec in enumerate(self._child_ec_list[:]):
-                if(child_ec.instance is not None):
+            # the children which are no longer `SUSPENDED` become active again
+            if(self._suspended_children):
+                resumed = [(child_ec, seq) for child_ec, seq in self._suspended_children.items()
+                           if child_ec.instance.get_status() != NodeStatus.SUSPENDED]
+                if(resumed):
+                    for child_ec, _ in resumed:
+                        del self._suspended_children[child_ec]
+                    self._active_children.update(resumed)
+                    self._internal_sort_active_children()
+
+            active_children = list(self._active_children)
+            # the `SUSPENDED` children are not ticked, but their contingencies
+            # and out-params are applied in the order the children were added
+            if(self._suspended_children):
+                children = [child_ec for child_ec, _ in
+                            sorted([*self._active_children.items(),
+                                    *self._suspended_children.items()],
+                                   key=lambda item: item[1])]
+            else:
+                children = active_children
+            if(self._executor is not None and len(active_children) > 1
+               and not getattr(_pool_thread, 'active', False)):
+                # tick the children concurrently and wait until all ticks are
+                # done, the contingencies are applied afterwards in the tick thread
+                for child_ec in children:
                     self._internal_bind_in_params(child_ec)
-                    self._internal_tick_child(child_ec)
-                    self._internal_apply_contingencies(child_ec)
+                futures = [self._executor.submit(self.__tick_child_in_pool, child_ec)
+                           for child_ec in active_children]
+                wait(futures)
+                for future in futures:
+                    future.result()
+                for child_ec in children:
+                    if(child_ec.instance is not None):
+                        self.__internal_complete_tick(child_ec)
+            else:
+                for child_ec in children:
                     if(child_ec.instance is not None):
-                        self._internal_bind_out_params(child_ec)
-                        cur_child_state = child_ec.instance.get_status()
-                        if(cur_child_state == NodeStatus.SUCCESS
-                           or cur_child_state == NodeStatus.FIXED):
-                            child_ec.instance._internal_on_delete()
-                            child_ec.instance = None
-                            self._success_count += 1
-                        elif(cur_child_state == NodeStatus.FAILURE
-                             or cur_child_state == NodeStatus.ABORTED):
-                            self.__last_child_contingency_msg = child_ec.instance\
-                                                                .get_contingency_message()
-                            child_ec.instance._internal_on_delete()
-                            child_ec.instance = None
-                            self._fail_count += 1
+                        self._internal_bind_in_params(child_ec)
+                        self._internal_tick_child(child_ec)
+                        self.__internal_complete_tick(child_ec)
+            # the last child is the current one after the tick
+            if(self._child_ec_list):
+                self._child_ptr = len(self._child_ec_list) - 1
 
     def _internal_prepare_next_tick(self) -> None:
         if(self.get_status() != NodeStatus.ABORTED):
             if(self._success_count >= self._success_threshold):
-                self.get_logger().debug('_success_count >= _success_threshold -- '
-                                        + f'{self._success_count} >= {self._success_threshold}')
+                if(self.get_logger().is_enabled(LogLevel.DEBUG)):
+                    self.get_logger().debug('_success_count >= _success_threshold -- '
+                                            + f'{self._success_count} >= '
+                                            + f'{self._success_threshold}')
                 self.set_status(NodeStatus.SUCCESS)
             elif(self._fail_count >
                  len(self._child_ec_list) - self._success_threshold):
-                self.get_logger().debug('_fail_count > len(_current_children) - '
-                                        + f'_success_threshold -- {self._fail_count} > '
-                                        + f'{len(self._child_ec_list)} - '
-                                        + f'{self._success_threshold}')
+                if(self.get_logger().is_enabled(LogLevel.DEBUG)):
+                    self.get_logger().debug('_fail_count > len(_current_children) - '
+                                            + f'_success_threshold -- {self._fail_count} > '
+                                            + f'{len(self._child_ec_list)} - '
+                                            + f'{self._success_threshold}')
                 self.set_status(NodeStatus.FAILURE)
                 self.set_contingency_message(self.__last_child_contingency_msg)
 
             if(self.get_status() == NodeStatus.SUCCESS
                or self.get_status() == NodeStatus.FAILURE):
                 # abort children if RUNNING or SUSPENDED
-                for child_ec in self._child_ec_list:
-                    if(child_ec.instance is not None and
-                       (child_ec.instance.get_status() == NodeStatus.RUNNING or
-                            child_ec.instance.get_status() == NodeStatus.SUSPENDED)):
-                        child_ec.instance._internal_on_abort()
-                        child_ec.instance._internal_on_delete()
-                        child_ec.instance = None
+                self._internal_abort_children()
 
     def _internal_on_abort(self) -> None:
         super()._internal_on_abort()
-        self.get_logger().info(f'aborting {self.__class__.__name__}')
+        if(self.get_logger().is_enabled(LogLevel.INFO)):
+            self.get_logger().info(f'aborting {self.__class__.__name__}')
         if(self._child_ec_list[self._child_ptr].instance is not None):
             self.set_status(NodeStatus.ABORTED)
             self.set_contingency_message(self._child_ec_list[self._child_ptr]
                                          .instance.get_contingency_message())
         # abort children if RUNNING or SUSPENDED
-        for child_ec in self._child_ec_list:
+        self._internal_abort_children()
+        self.on_abort()
+
+    def _internal_abort_children(self) -> None:
+        # abort the active and suspended children in the order they were added
+        children = sorted([*self._active_children.items(), *self._suspended_children.items()],
+                          key=lambda item: item[1])
+        for child_ec, _ in children:
             if(child_ec.instance is not None and
                (child_ec.instance.get_status() == NodeStatus.RUNNING or
                     child_ec.instance.get_status() == NodeStatus.SUSPENDED)):
                 child_ec.instance._internal_on_abort()
-                child_ec.instance._internal_on_delete()
-                child_ec.instance = None
-        self.on_abort()
+                self._internal_drop_child(child_ec)
 
     # PUBLIC
 
@@ -174,6 +288,46 @@ class ParallelNode(ControlNode, ABC):
         """
         return self._success_threshold
 
+    def set_executor(self, executor: Executor) -> None:
+        """Set the thread pool to tick the children concurrently.
+
+        By default, the children are ticked one after another in the tick
+        thread. If a thread pool, e.g. a `concurrent.futures.ThreadPoolExecutor`,
+        is set, the children are ticked concurrently by the threads of the pool
+        and the `ParallelNode` waits until all ticks are done. This is useful
+        if the `on_tick` callbacks block or call code which releases the GIL.
+        Afterwards, the contingency-handlers are executed and the success
+        threshold is evaluated in the tick thread in the order the children
+        were added. Thus, a contingency-handler is executed after all
+        children are ticked. The pool is not shut down by the `ParallelNode`.
+        The children create their own children in the threads of the pool,
+        thus pooled nodes and `Blackboard` variables are acquired and
+        declared concurrently.
+
+        A `ParallelNode` which is ticked by a thread of a pool, e.g. because it
+        is the child of another `ParallelNode` with a thread pool, ticks its
+        children inline. Otherwise, nested `ParallelNodes` sharing a bounded
+        pool could wait for each other and deadlock.
+
+        Parameters
+        ----------
+        executor: Executor
+            The thread pool, or None to tick the children in the tick thread
+
+        """
+        self._executor = executor
+
+    def get_executor(self) -> Executor:
+        """Return the thread pool to tick the children concurrently.
+
+        Returns
+        -------
+        Executor
+            The thread pool, or None if not set
+
+        """
+        return self._executor
+
     def add_child(self, node: TreeNode, params: str = None) -> None:
         """Add a child node.
 
@@ -203,8 +357,7 @@ class ParallelNode(ControlNode, ABC):
         self._created_child_size -= 1
         if(self._child_ec_list[pos].instance is not None):
             self._child_ec_list[pos].instance._internal_on_abort()
-            self._child_ec_list[pos].instance._internal_on_delete()
-            self._child_ec_list[pos].instance = None
+            self._internal_drop_child(self._child_ec_list[pos])
         del self._child_ec_list[pos]
 
     def remove_all_children(self) -> None:
@@ -0,0 +1,149 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC
+from abc import abstractmethod
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from typing import Any
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from carebt.futureActionNode import FutureActionNode
+from carebt.nodeStatus import NodeStatus
+
+if TYPE_CHECKING:
+    from carebt.behaviorTreeRunner import BehaviorTreeRunner  # pragma: no cover
+
+
+class ProcessActionNode(FutureActionNode, ABC):
+    """The careBT `ProcessActionNode` class.
+
+    `ProcessActionNodes` are `ActionNodes` which run CPU-bound work, like path
+    planning or optimization, in another process. Thus, the work is not
+    limited by the GIL and does not block the tick thread. When the node is
+    ticked, the static method `compute` is submitted to the process executor
+    of the `BehaviorTreeRunner` with the values of the input parameters as
+    arguments. The node is `SUSPENDED` until the result is available. Then,
+    the result is assigned to the output parameters and the node completes
+    with `SUCCESS`. If `compute` raises an exception, the node completes with
+    `FAILURE` and the name of the exception as contingency-message.
+
+    The input parameters and the result are pickled, thus they should be
+    small or cheap to copy. `compute` has no access to the node and the
+    `ProcessActionNode` class has to be importable by the worker processes,
+    i.e. it has to be defined at the top level of a module.
+
+    If the node is aborted, e.g. by a timeout, the pending work is canceled.
+    A `compute` which is already running is not interrupted, but its result
+    is ignored.
+
+    Parameters
+    ----------
+    bt_runner: 'BehaviorTreeRunner'
+        The behavior tree runner which started the tree.
+    params: str
+        The input/Output parameters of the node
+        e.g. '?x ?y => ?z'
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
+        """Init the `ProcessActionNode` with bt_runner and params."""
+        super().__init__(bt_runner, params)
+
+    # PROTECTED
+
+    def _internal_get_in_args(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, p.replace('?', '_', 1))
+                     for p in self._internal_get_in_params())
+
+    def _internal_get_default_executor(self) -> Executor:
+        return self.bt_runner.get_process_executor()
+
+    def _internal_submit(self, executor: Executor) -> Future:
+        # the static method is pickled by reference, the node itself is not
+        # sent to the worker process
+        return executor.submit(self.__class__.compute, *self._internal_get_in_args())
+
+    # PUBLIC
+
+    @staticmethod
+    @abstractmethod
+    def compute(*args: Any) -> Any:
+        """Compute the result.
+
+        Is called in a worker process with the values of the input parameters
+        in the order of the signature. In case the node has more than one
+        output parameter, a tuple with one value per output parameter has to
+        be returned.
+
+        Parameters
+        ----------
+        args: Any
+            The values of the input parameters
+
+        Returns
+        -------
+        Any
+            The value of the output parameter, or a tuple of values
+
+        """
+        raise NotImplementedError
+
+    def execute(self) -> Any:
+        """Compute the result in the calling thread.
+
+        Calls `compute` with the values of the input parameters. It is not
+        used if the node is ticked, but can be used to test `compute`.
+
+        Returns
+        -------
+        Any
+            The result of `compute`
+
+        """
+        return self.compute(*self._internal_get_in_args())
+
+    def on_result(self, result: Any) -> None:
+        """Is called with the result of `compute`.
+
+        Is called in the tick thread. By default, the result is assigned to
+        the output parameters and the node completes with `SUCCESS`. If the
+        node has more than one output parameter and the result is not a tuple
+        or list with one value per output parameter, the node completes with
+        `FAILURE` and the contingency-message `INVALID_RESULT`.
+
+        Parameters
+        ----------
+        result: Any
+            The result returned by `compute`
+
+        """
+        out_params = self._internal_get_out_params()
+        if(len(out_params) == 1):
+            result = (result,)
+        elif(len(out_params) > 1 and
+                (not isinstance(result, (tuple, list)) or len(result) != len(out_params))):
+            self.get_logger().error(f'{self.__class__.__name__}.compute returned '
+                                    + f'{result!r}, but {len(out_params)} values are '
+                                    + 'required for the output parameters')
+            self.set_status(NodeStatus.FAILURE)
+            self.set_contingency_message('INVALID_RESULT')
+            return
+        for p, value in zip(out_params, result):
+            setattr(self, p.replace('?', '_', 1), value)
+        self.set_status(NodeStatus.SUCCESS)
@@ -15,6 +15,7 @@
 from abc import ABC
 from typing import TYPE_CHECKING
 
+from carebt.abstractLogger import LogLevel
 from carebt.controlNode import ControlNode
 from carebt.executionContext import ExecutionContext
 from carebt.nodeStatus import NodeStatus
@@ -47,10 +48,13 @@ class RateControlNode(ControlNode, ABC):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', throttle_ms: int, params: str = None):
         """Init the `ActionNode` with bt_runner,rate_ms and params."""
         super().__init__(bt_runner, params)
-        self.get_logger().info(f'creating {self.__class__.__name__}')
+        if(self.get_logger().is_enabled(LogLevel.INFO)):
+            self.get_logger().info(f'creating {self.__class__.__name__}')
 
         self._throttle_ms = throttle_ms
         self.set_status(NodeStatus.IDLE)
@@ -60,8 +64,7 @@ class RateControlNode(ControlNode, ABC):
     def _internal_create_child_nodes(self) -> None:
         if(self._child_ec_list[0].instance is None):
             # create node instance
-            self._child_ec_list[0].instance = \
-                self._child_ec_list[0].node(self._internal_get_bt_runner())
+            self._internal_create_child(self._child_ec_list[0])
             self._internal_bind_in_params(self._child_ec_list[self._child_ptr])
             self._child_ec_list[0].instance.on_init()
 
@@ -98,13 +101,15 @@ class RateControlNode(ControlNode, ABC):
            or self.get_status() == NodeStatus.FAILURE
            or self.get_status() == NodeStatus.ABORTED
            or self.get_status() == NodeStatus.FIXED):
-            self.get_logger().info(f'finished {self.__class__.__name__}')
+            if(self.get_logger().is_enabled(LogLevel.INFO)):
+                self.get_logger().info(f'finished {self.__class__.__name__}')
             self._child_ec_list[0].instance._internal_on_delete()
-            self._child_ec_list[0].instance = None
+            self._internal_release_child(self._child_ec_list[0])
 
     def _internal_on_abort(self) -> None:
         super()._internal_on_abort()
-        self.get_logger().info(f'aborting {self.__class__.__name__}')
+        if(self.get_logger().is_enabled(LogLevel.INFO)):
+            self.get_logger().info(f'aborting {self.__class__.__name__}')
         if(self._child_ec_list[self._child_ptr].instance is not None):
             self.set_status(NodeStatus.ABORTED)
             self.set_contingency_message(self._child_ec_list[self._child_ptr]
@@ -116,7 +121,7 @@ class RateControlNode(ControlNode, ABC):
 
         if(self._child_ec_list[0].instance is not None):
             self._child_ec_list[0].instance._internal_on_delete()
-            self._child_ec_list[0].instance = None
+            self._internal_release_child(self._child_ec_list[0])
         self.on_abort()
 
     # PUBLIC
@@ -27,6 +27,8 @@ if TYPE_CHECKING:
 
 class RootNode(ControlNode, ABC):
 
+    __slots__ = ()
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
         super().__init__(bt_runner, params)
 
@@ -39,8 +41,7 @@ class RootNode(ControlNode, ABC):
         # create instance
         if(self._child_ec_list[0].instance is None):
             # create node instance
-            self._child_ec_list[0].instance = \
-                self._child_ec_list[0].node(self._internal_get_bt_runner())
+            self._internal_create_child(self._child_ec_list[0])
             self._internal_bind_in_params(self._child_ec_list[self._child_ptr])
             self._child_ec_list[0].instance.on_init()
 
@@ -81,7 +82,23 @@ class RootNode(ControlNode, ABC):
             # forward contingency-history to RootNode
             for entry in self._child_ec_list[0].instance.get_contingency_history():
                 self._internal_append_to_contingency_history(entry)
-            self._child_ec_list[0].instance = None
+            self._internal_release_child(self._child_ec_list[0])
+
+    def _internal_on_abort(self) -> None:
+        super()._internal_on_abort()
+        if(self._child_ec_list[0].instance is not None):
+            # abort child if RUNNING or SUSPENDED
+            if(self._child_ec_list[0].instance.get_status() == NodeStatus.RUNNING or
+               self._child_ec_list[0].instance.get_status() == NodeStatus.SUSPENDED):
+                self._child_ec_list[0].instance._internal_on_abort()
+            self.set_contingency_message(self._child_ec_list[0]
+                                         .instance.get_contingency_message())
+            # forward contingency-history to RootNode
+            for entry in self._child_ec_list[0].instance.get_contingency_history():
+                self._internal_append_to_contingency_history(entry)
+            self._child_ec_list[0].instance._internal_on_delete()
+            self._internal_release_child(self._child_ec_list[0])
+        self.set_status(NodeStatus.ABORTED)
 
     # PUBLIC
 
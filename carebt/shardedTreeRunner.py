@@ -0,0 +1,478 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.connection import wait
+from os import cpu_count
+from threading import Event
+from threading import Lock
+from threading import Thread
+from time import monotonic
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from carebt.abstractLogger import LogLevel
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.contingencyHistoryEntry import ContingencyHistoryEntry
+from carebt.multiTreeRunner import MultiTreeRunner
+from carebt.nodeStatus import NodeStatus
+from carebt.tickPolicy import TickPolicy
+from carebt.treeNode import TreeNode
+
+
+def _exception_text(exception: Exception) -> str:
+    return f'{exception.__class__.__name__}: {exception}'
+
+
+class _WorkerTreeRunner(MultiTreeRunner):
+
+    def __init__(self):
+        super().__init__()
+        self.__abort_lock = Lock()
+        self.__pending_abort: List[BehaviorTreeRunner] = []
+
+    def abort_tree(self, tree: BehaviorTreeRunner) -> None:
+        # in contrast to `remove_tree` the tree is aborted in the tick thread
+        # and reported as done, thus its result reaches the parent process
+        with self.__abort_lock:
+            self.__pending_abort.append(tree)
+        self.notify()
+
+    def tick_once(self) -> None:
+        with self.__abort_lock:
+            pending_abort = self.__pending_abort
+            self.__pending_abort = []
+        for tree in pending_abort:
+            tree.abort()
+        super().tick_once()
+
+    def _internal_tick_tree(self, tree: BehaviorTreeRunner) -> None:
+        # a tree which raises an exception fails, the other trees of the
+        # worker continue
+        try:
+            super()._internal_tick_tree(tree)
+        except Exception as e:
+            message = _exception_text(e)
+            self.get_logger().error(f'tree raised an exception: {message}')
+            tree._instance.set_status(NodeStatus.FAILURE)
+            tree._instance.set_contingency_message(message)
+
+
+def _worker_main(command_queue: multiprocessing.Queue,
+                 result_connection: Connection,
+                 tick_rate_ms: int,
+                 tick_policy: TickPolicy,
+                 log_level: LogLevel) -> None:
+    # runs in the worker process: a `MultiTreeRunner` ticks the trees in the
+    # main thread, the commands of the parent are received in a second thread
+    runner = _WorkerTreeRunner()
+    runner.set_tick_rate_ms(tick_rate_ms)
+    runner.set_tick_policy(tick_policy)
+    runner.get_logger().set_log_level(log_level)
+    trees: Dict[int, BehaviorTreeRunner] = {}
+    trees_lock = Lock()
+    send_lock = Lock()
+
+    def send_result(result: Tuple) -> None:
+        # the results are sent from the tick thread and the receiving thread
+        with send_lock:
+            result_connection.send(result)
+
+    def on_done(tree_id: int, tree: BehaviorTreeRunner) -> None:
+        with trees_lock:
+            trees.pop(tree_id, None)
+        send_result((tree_id,
+                     tree.get_status(),
+                     tree.get_contingency_message(),
+                     tree._instance.get_contingency_history(),
+                     tree.get_tick_count()))
+
+    def receive_commands() -> None:
+        while(True):
+            command = command_queue.get()
+            if(command[0] == 'add'):
+                _, tree_id, node, params = command
+                # the tree is registered before it can be ticked and complete
+                with trees_lock:
+                    try:
+                        trees[tree_id] = runner.add_tree(node, params,
+                                                         lambda tree, tree_id=tree_id:
+                                                         on_done(tree_id, tree))
+                    except Exception as e:
+                        send_result((tree_id, NodeStatus.FAILURE, _exception_text(e), [], 0))
+                        continue
+                    send_result((tree_id, NodeStatus.RUNNING, '', [], 0))
+            elif(command[0] == 'remove'):
+                with trees_lock:
+                    tree = trees.get(command[1])
+                if(tree is not None):
+                    runner.abort_tree(tree)
+            else:
+                runner.stop()
+                return
+
+    receiver = Thread(target=receive_commands, daemon=True)
+    receiver.start()
+    runner.run(run_forever=True)
+    receiver.join()
+    # report the trees which are aborted because of the shutdown
+    with trees_lock:
+        remaining = list(trees.items())
+    for tree_id, tree in remaining:
+        tree.abort()
+        on_done(tree_id, tree)
+
+
+class ShardedTreeHandle:
+    """The careBT `ShardedTreeHandle` class.
+
+    The `ShardedTreeHandle` represents a behavior tree which is executed by a
+    worker process of the `ShardedTreeRunner`. It provides the same methods
+    to query the result of the execution as the `BehaviorTreeRunner`.
+    """
+
+    def __init__(self, tree_id: int, on_done: Callable[['ShardedTreeHandle'], None]):
+        """Init the `ShardedTreeHandle`."""
+        self._tree_id = tree_id
+        self._shard = None
+        self._on_done = on_done
+        self._status = NodeStatus.IDLE
+        self._contingency_message = ''
+        self._contingency_history: List[ContingencyHistoryEntry] = []
+        self._tick_count = 0
+        self._done = Event()
+
+    # PROTECTED
+
+    def _internal_update(self, status: NodeStatus, contingency_message: str,
+                         contingency_history: List[ContingencyHistoryEntry],
+                         tick_count: int) -> None:
+        self._status = status
+        self._contingency_message = contingency_message
+        self._contingency_history = contingency_history
+        self._tick_count = tick_count
+        if(self.is_done()):
+            self._done.set()
+            if(self._on_done is not None):
+                self._on_done(self)
+
+    # PUBLIC
+
+    def get_status(self) -> NodeStatus:
+        """Return the status of the tree.
+
+        Returns
+        -------
+        `NodeStatus`
+            Current status of the tree
+
+        """
+        return self._status
+
+    def get_contingency_message(self) -> str:
+        """Return the contincency message of the tree.
+
+        Returns
+        -------
+        str
+            The contingency message
+
+        """
+        return self._contingency_message
+
+    def get_contingency_history(self) -> List[ContingencyHistoryEntry]:
+        """Return the contincency-history of the tree.
+
+        Returns
+        -------
+        list
+            The contingency history
+
+        """
+        return self._contingency_history
+
+    def get_tick_count(self) -> int:
+        """Return the ticks the tree has taken to complete.
+
+        Returns
+        -------
+        int
+            Ticks taken for the behavior tree execution
+
+        """
+        return self._tick_count
+
+    def is_done(self) -> bool:
+        """Return whether the execution of the tree is done.
+
+        Returns
+        -------
+        bool
+            True, if the behavior tree completed its execution
+
+        """
+        return (self._status != NodeStatus.IDLE
+                and self._status != NodeStatus.RUNNING)
+
+    def wait(self, timeout: float = None) -> bool:
+        """Wait until the execution of the tree is done.
+
+        Parameters
+        ----------
+        timeout: float, optional
+            The timeout in seconds
+
+        Returns
+        -------
+        bool
+            True, if the behavior tree completed its execution
+
+        """
+        return self._done.wait(timeout)
+
+
+class ShardedTreeRunner:
+    """The careBT `ShardedTreeRunner` class.
+
+    The `ShardedTreeRunner` distributes behavior trees across a pool of worker
+    processes, each running a `MultiTreeRunner`. Thus, CPU-heavy trees are not
+    limited to one CPU core by the GIL. A new tree is assigned to the worker
+    process which currently executes the fewest trees. The nodes of the trees
+    have to be importable by the worker processes and their parameters have to
+    be picklable.
+
+    A tree which raises an exception completes with `FAILURE` and the
+    exception text as contingency message, the other trees of its worker
+    process continue. If a worker process dies, all its trees which are not
+    done yet complete with `FAILURE`.
+
+    Parameters
+    ----------
+    processes: int, optional
+        The number of worker processes, default is the number of CPU cores
+    tick_rate_ms: int, optional
+        The tick rate of the workers in milliseconds, default is 50 ms
+    tick_policy: TickPolicy, optional
+        The tick policy of the workers, default is `TickPolicy.FIXED_DELAY`
+    log_level: LogLevel, optional
+        The log level of the workers, default is `LogLevel.WARN`
+    mp_context: str, optional
+        The multiprocessing start method, default is 'spawn'
+
+    """
+
+    def __init__(self, processes: int = None, tick_rate_ms: int = 50,
+                 tick_policy: TickPolicy = TickPolicy.FIXED_DELAY,
+                 log_level: LogLevel = LogLevel.WARN, mp_context: str = 'spawn'):
+        """Init the `ShardedTreeRunner` and start the worker processes."""
+        context = multiprocessing.get_context(mp_context)
+        self.__lock = Lock()
+        self.__next_tree_id = 0
+        self.__handles: Dict[int, ShardedTreeHandle] = {}
+        self.__command_queues = []
+        # each worker process sends its results through its own pipe, thus a
+        # worker process which dies while sending does not block the others
+        self.__result_connections: List[Connection] = []
+        self.__workers = []
+        self.__load: List[int] = []
+        self.__alive: List[bool] = []
+        for _ in range(processes or cpu_count() or 1):
+            command_queue = context.Queue()
+            result_reader, result_writer = context.Pipe(duplex=False)
+            worker = context.Process(target=_worker_main,
+                                     args=(command_queue, result_writer,
+                                           tick_rate_ms, tick_policy, log_level),
+                                     daemon=True)
+            worker.start()
+            result_writer.close()
+            self.__command_queues.append(command_queue)
+            self.__result_connections.append(result_reader)
+            self.__workers.append(worker)
+            self.__load.append(0)
+            self.__alive.append(True)
+        self.__receiver = Thread(target=self.__receive_results, daemon=True)
+        self.__receiver.start()
+
+    # PRIVATE
+
+    def __fail_shard(self, shard: int) -> None:
+        # fail the outstanding trees of a worker process which died
+        worker = self.__workers[shard]
+        worker.join()
+        with self.__lock:
+            self.__alive[shard] = False
+            handles = [handle for handle in self.__handles.values() if handle._shard == shard]
+            for handle in handles:
+                del self.__handles[handle._tree_id]
+            self.__load[shard] = 0
+        for handle in handles:
+            handle._internal_update(NodeStatus.FAILURE,
+                                    f'worker process exited with code {worker.exitcode}',
+                                    handle.get_contingency_history(),
+                                    handle.get_tick_count())
+
+    def __receive_results(self) -> None:
+        # receive the results of all worker processes until they have exited
+        connections = {connection: shard
+                       for shard, connection in enumerate(self.__result_connections)}
+        sentinels = {worker.sentinel: shard for shard, worker in enumerate(self.__workers)}
+        while(len(sentinels) > 0):
+            for ready in wait(list(connections) + list(sentinels)):
+                if(ready in connections):
+                    # a closed pipe is not waited for anymore
+                    if(not self.__receive_result(ready)):
+                        connections.pop(ready)
+                elif(ready in sentinels):
+                    # the results sent before the worker process exited are
+                    # received first, the remaining trees fail
+                    shard = sentinels.pop(ready)
+                    connection = self.__result_connections[shard]
+                    connections.pop(connection, None)
+                    while(self.__receive_result(connection)):
+                        pass
+                    self.__fail_shard(shard)
+
+    def __receive_result(self, connection: Connection) -> bool:
+        try:
+            if(not connection.poll()):
+                return False
+            result = connection.recv()
+        except (EOFError, OSError):
+            return False
+        tree_id, status, contingency_message, contingency_history, tick_count = result
+        with self.__lock:
+            handle = self.__handles.get(tree_id)
+            if(handle is None):
+                return True
+            if(status != NodeStatus.IDLE and status != NodeStatus.RUNNING):
+                del self.__handles[tree_id]
+                self.__load[handle._shard] -= 1
+        handle._internal_update(status, contingency_message,
+                                contingency_history, tick_count)
+        return True
+
+    # PUBLIC
+
+    def add_tree(self, node: TreeNode, params: str = None,
+                 on_done: Callable[[ShardedTreeHandle], None] = None) -> ShardedTreeHandle:
+        """Add a behavior tree.
+
+        Adds the provided node, respectively behavior tree, to the worker
+        process which currently executes the fewest trees.
+
+        Parameters
+        ----------
+        node: TreeNode
+            The node which should be executed
+
+        params: str, optional
+            The parameters for the node which should be executed
+
+        on_done: Callable[[ShardedTreeHandle], None], optional
+            Is called with the handle of the tree when the tree completes.
+            The callback is called from the thread receiving the results.
+
+        Returns
+        -------
+        `ShardedTreeHandle`
+            The handle of the added tree
+
+        """
+        with self.__lock:
+            tree_id = self.__next_tree_id
+            self.__next_tree_id += 1
+            handle = ShardedTreeHandle(tree_id, on_done)
+            alive = [shard for shard, is_alive in enumerate(self.__alive) if is_alive]
+            if(len(alive) > 0):
+                handle._shard = min(alive, key=lambda shard: self.__load[shard])
+                self.__load[handle._shard] += 1
+                self.__handles[tree_id] = handle
+        if(handle._shard is None):
+            handle._internal_update(NodeStatus.FAILURE, 'no worker process alive', [], 0)
+        else:
+            self.__command_queues[handle._shard].put(('add', tree_id, node, params))
+        return handle
+
+    def remove_tree(self, handle: ShardedTreeHandle) -> None:
+        """Remove a behavior tree.
+
+        Removes the tree with the provided handle. In case the tree is not
+        done yet, it is aborted.
+
+        Parameters
+        ----------
+        handle: ShardedTreeHandle
+            The handle of the tree to remove
+
+        """
+        with self.__lock:
+            if(handle._shard is None or not self.__alive[handle._shard]):
+                return
+        self.__command_queues[handle._shard].put(('remove', handle._tree_id))
+
+    def get_tree_count(self) -> int:
+        """Return the number of trees which are currently executed.
+
+        Returns
+        -------
+        int
+            The number of trees
+
+        """
+        with self.__lock:
+            return len(self.__handles)
+
+    def wait(self, timeout: float = None) -> bool:
+        """Wait until all trees added so far are done.
+
+        Parameters
+        ----------
+        timeout: float, optional
+            The timeout in seconds
+
+        Returns
+        -------
+        bool
+            True, if all behavior trees completed their execution
+
+        """
+        with self.__lock:
+            handles = list(self.__handles.values())
+        deadline = None if timeout is None else monotonic() + timeout
+        for handle in handles:
+            if(not handle.wait(None if deadline is None else max(0, deadline - monotonic()))):
+                return False
+        return True
+
+    def shutdown(self) -> None:
+        """Shutdown the worker processes.
+
+        The trees which are not done yet are aborted.
+        """
+        with self.__lock:
+            alive = [shard for shard, is_alive in enumerate(self.__alive) if is_alive]
+        for shard in alive:
+            self.__command_queues[shard].put(('stop',))
+        for worker in self.__workers:
+            worker.join()
+        self.__receiver.join()
+
+    def __enter__(self) -> 'ShardedTreeRunner':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
@@ -0,0 +1,54 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from enum import Enum
+from math import ceil
+
+
+class TickPolicy(Enum):
+    """An Enum representing how the `BehaviorTreeRunner` schedules the ticks."""
+
+    FIXED_DELAY = 0
+    """Wait the full tick rate after each tick (default)"""
+
+    FIXED_RATE_SKIP = 1
+    """Tick at a fixed rate, ticks missed due to an overrun are skipped"""
+
+    FIXED_RATE_CATCH_UP = 2
+    """Tick at a fixed rate, ticks missed due to an overrun are executed back-to-back"""
+
+    def next_deadline(self, deadline: float, now: float, period: float) -> float:
+        """Return the deadline of the next tick.
+
+        Parameters
+        ----------
+        deadline: float
+            The deadline of the current tick in seconds
+        now: float
+            The time the current tick completed in seconds
+        period: float
+            The tick rate in seconds
+
+        Returns
+        -------
+        float
+            The deadline of the next tick in seconds
+
+        """
+        if(self == TickPolicy.FIXED_DELAY):
+            return now + period
+        next_deadline = deadline + period
+        if(self == TickPolicy.FIXED_RATE_SKIP and now > next_deadline):
+            next_deadline += ceil((now - next_deadline) / period) * period
+        return next_deadline
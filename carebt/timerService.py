@@ -0,0 +1,205 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+from threading import Lock
+from typing import Callable
+from typing import List
+
+from carebt.clock import AbstractClock
+from carebt.clock import RealTimeClock
+
+
+class TimerHandle:
+    """The careBT `TimerHandle` class.
+
+    The `TimerHandle` represents a timer scheduled with the `TimerService`.
+    It can be used to cancel the timer.
+    """
+
+    def __init__(self, deadline: float, seq: int, callback: Callable[[], None]):
+        """Init the `TimerHandle`."""
+        self._deadline = deadline
+        self._seq = seq
+        self._callback = callback
+
+    def __lt__(self, other: 'TimerHandle') -> bool:
+        # timers with the same deadline fire in the order they were scheduled
+        return (self._deadline, self._seq) < (other._deadline, other._seq)
+
+    # PUBLIC
+
+    def is_active(self) -> bool:
+        """Return whether the timer neither fired nor was canceled.
+
+        Returns
+        -------
+        bool
+            True, if the timer is active
+
+        """
+        return self._callback is not None
+
+
+class TimerService:
+    """The careBT `TimerService` class.
+
+    The `TimerService` manages the timers of a careBT runner, e.g. the timeouts
+    set with `TreeNode.set_timeout`. The timers are kept in a heap ordered by
+    their deadlines, which are based on the time of the provided clock. They
+    do not run in threads of their own, instead the runner fires the expired
+    timers in the thread which ticks the behavior tree. Thus, timer callbacks
+    do not run concurrently with the tick.
+
+    Parameters
+    ----------
+    on_schedule: Callable[[], None], optional
+        Is called when a timer is scheduled which expires before all other
+        timers, to let the runner shorten its wait
+    clock: AbstractClock, optional
+        The clock which provides the time, default is a `RealTimeClock`
+
+    """
+
+    def __init__(self, on_schedule: Callable[[], None] = None, clock: AbstractClock = None):
+        """Init the `TimerService`."""
+        self.__on_schedule = on_schedule
+        self.__clock = clock or RealTimeClock()
+        self.__lock = Lock()
+        self.__heap: List[TimerHandle] = []
+        self.__seq = 0
+        self.__canceled = 0
+
+    # PRIVATE
+
+    def __drop_canceled(self) -> None:
+        # remove canceled timers from the top of the heap and compact the heap
+        # if most of the timers are canceled, e.g. timeouts of completed nodes
+        while(self.__heap and self.__heap[0]._callback is None):
+            heappop(self.__heap)
+            self.__canceled -= 1
+        if(self.__canceled > 64 and self.__canceled * 2 > len(self.__heap)):
+            self.__heap = [timer for timer in self.__heap if timer._callback is not None]
+            heapify(self.__heap)
+            self.__canceled = 0
+
+    # PUBLIC
+
+    def set_clock(self, clock: AbstractClock) -> None:
+        """Set the clock.
+
+        Sets the clock which provides the time for the deadlines. The clock
+        should only be changed while no timer is active.
+
+        Parameters
+        ----------
+        clock: AbstractClock
+            The clock
+
+        """
+        self.__clock = clock
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        """Schedule a timer.
+
+        Schedules the callback to be called once the delay has expired.
+        `schedule` can be called from any thread.
+
+        Parameters
+        ----------
+        delay: float
+            The delay in seconds
+
+        callback: Callable[[], None]
+            Is called in the tick thread when the timer expires
+
+        Returns
+        -------
+        `TimerHandle`
+            The handle of the timer
+
+        """
+        with self.__lock:
+            timer = TimerHandle(self.__clock.now() + delay, self.__seq, callback)
+            self.__seq += 1
+            heappush(self.__heap, timer)
+            earliest = self.__heap[0] is timer
+        if(earliest and self.__on_schedule is not None):
+            self.__on_schedule()
+        return timer
+
+    def cancel(self, timer: TimerHandle) -> None:
+        """Cancel a timer.
+
+        Cancels the timer if it is still active. The reference to the callback
+        is released immediately. `cancel` can be called from any thread.
+
+        Parameters
+        ----------
+        timer: TimerHandle
+            The handle of the timer
+
+        """
+        with self.__lock:
+            if(timer._callback is not None):
+                timer._callback = None
+                self.__canceled += 1
+                self.__drop_canceled()
+
+    def get_next_deadline(self) -> float:
+        """Return the deadline of the timer which expires next.
+
+        Returns
+        -------
+        float
+            The deadline in seconds, or None if no timer is active
+
+        """
+        with self.__lock:
+            self.__drop_canceled()
+            if(self.__heap):
+                return self.__heap[0]._deadline
+            return None
+
+    def get_timer_count(self) -> int:
+        """Return the number of active timers.
+
+        Returns
+        -------
+        int
+            The number of active timers
+
+        """
+        with self.__lock:
+            return len(self.__heap) - self.__canceled
+
+    def fire_due(self) -> None:
+        """Fire all expired timers.
+
+        Calls the callbacks of all timers whose deadline has passed in the order
+        of their deadlines. Is called by the runner in the tick thread.
+
+        """
+        now = self.__clock.now()
+        while(True):
+            with self.__lock:
+                self.__drop_canceled()
+                if(not self.__heap or self.__heap[0]._deadline > now):
+                    return
+                timer = heappop(self.__heap)
+                callback = timer._callback
+                timer._callback = None
+            callback()
@@ -14,12 +14,14 @@
 
 from abc import ABC
 from abc import abstractmethod
-from datetime import datetime
-from threading import Timer
+from typing import Dict
 from typing import final
 from typing import List
+from typing import Tuple
 from typing import TYPE_CHECKING
 
+from carebt.abstractLogger import LogLevel
+from carebt.blackboard import Blackboard
 from carebt.contingencyHistoryEntry import ContingencyHistoryEntry
 from carebt.nodeStatus import NodeStatus
 
@@ -28,50 +30,179 @@ if TYPE_CHECKING:
     from carebt.abstractLogger import AbstractLogger  # pragma: no cover
 
 
+class _ParamSignature:
+    # the parsed parameter signature of a node, e.g. '?x ?y => ?z'
+
+    def __init__(self, params: str):
+        self.in_params: Tuple[str, ...] = ()
+        self.out_params: Tuple[str, ...] = ()
+        _params = params.split('=>')
+        if(len(_params[0]) > 0):
+            self.in_params = tuple(_params[0].strip().split(' '))
+        if len(_params) == 2:
+            self.out_params = tuple(_params[1].strip().split(' '))
+        # the attribute names of the parameters, e.g. '_x' for '?x'
+        self.in_attrs = tuple(p.replace('?', '_', 1) for p in self.in_params)
+        self.out_attrs = tuple(p.replace('?', '_', 1) for p in self.out_params)
+        self.attrs = tuple(p for p in self.in_attrs + self.out_attrs if p)
+
+
+# the parsed signatures, the signature of a node class is always the same,
+# thus it is parsed only once
+_param_signatures: Dict[str, _ParamSignature] = {}
+
+
+class _TrackedParam:
+    # data descriptor which replaces a parameter attribute of a node class with
+    # `track_param_changes` enabled, the value is kept in the instance __dict__
+    # and each write increments the version of the parameter
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if(obj is None):
+            return self
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, obj, value) -> None:
+        d = obj.__dict__
+        d[self.name] = value
+        versions = d.get('_TreeNode__param_versions')
+        if(versions is None):
+            versions = d['_TreeNode__param_versions'] = {}
+            d['_TreeNode__changed_params'] = set()
+        versions[self.name] = versions.get(self.name, 0) + 1
+        d['_TreeNode__changed_params'].add(self.name)
+
+
+class _BlackboardParam(_TrackedParam):
+    # data descriptor which replaces a parameter attribute in the blackboard
+    # class of a node class in case the parameter is remapped to a blackboard
+    # variable, the value of a remapped parameter is kept in the slot of the
+    # blackboard variable
+
+    def __get__(self, obj, objtype=None):
+        if(obj is None):
+            return self
+        refs = obj.__dict__.get('_TreeNode__blackboard_refs')
+        if(refs is not None):
+            ref = refs.get(self.name)
+            if(ref is not None):
+                return ref[0]._slots[ref[1]]
+        return super().__get__(obj, objtype)
+
+    def __set__(self, obj, value) -> None:
+        refs = obj.__dict__.get('_TreeNode__blackboard_refs')
+        if(refs is not None):
+            ref = refs.get(self.name)
+            if(ref is not None):
+                ref[0]._slots[ref[1]] = value
+                return
+        if(obj.track_param_changes):
+            super().__set__(obj, value)
+        else:
+            obj.__dict__[self.name] = value
+
+
+# the blackboard classes of the node classes, an instance is switched to the
+# blackboard class of its node class while its parameters are remapped to
+# blackboard variables, thus the other instances are not affected by the
+# `_BlackboardParam` descriptors
+_blackboard_classes: Dict[type, type] = {}
+
+
+def _blackboard_class(cls: type) -> type:
+    # return the blackboard class of the node class, it has the same name
+    # and only adds the `_BlackboardParam` descriptors
+    bb_cls = _blackboard_classes.get(cls)
+    if(bb_cls is None):
+        bb_cls = type(cls.__name__, (cls,), {'__module__': cls.__module__,
+                                             '__qualname__': cls.__qualname__,
+                                             '_blackboard_base': cls})
+        bb_cls = _blackboard_classes.setdefault(cls, bb_cls)
+    return bb_cls
+
+
+def _track_params(cls: type, attrs: List[str]) -> None:
+    # install a `_TrackedParam` for each attribute which is not yet tracked
+    # and not otherwise defined by the class
+    for name in attrs:
+        if(not hasattr(cls, name)):
+            setattr(cls, name, _TrackedParam(name))
+
+
 class TreeNode(ABC):
     """The careBT `TreeNode` class.
 
     `TreeNode` is the basic class which provides the common implementation
     for all careBT nodes.
+
+    If the class attribute `track_param_changes` of a node class is set to
+    True, the writes of its parameters are tracked. Thus, a `ControlNode`
+    only binds the parameters which changed since the last tick, and
+    `pop_changed_params` returns the parameters which were written.
+
+    If the class attribute `pool_instances` of a node class is set to True,
+    the instances of the class are not dropped when they complete. Instead,
+    they are reset and kept in a pool of the `BehaviorTreeRunner`, and the
+    next time the node is executed, a pooled instance is reused. The class
+    has to restore the attributes it sets in `__init__` in `reset`.
     """
 
+    track_param_changes: bool = False
+    pool_instances: bool = False
+
+    # the framework-owned attributes are kept in slots, the parameters and the
+    # attributes of the node implementations are kept in the instance __dict__
+    __slots__ = ('bt_runner', '_throttle_ms', '_last_ts',
+                 '_bound_in_versions', '_bound_out_versions',
+                 '_parent_blackboard', '_blackboard',
+                 '__node_status', '__contingency_message', '__contingency_history',
+                 '__signature', '__timeout_timer')
+
     def __init__(self, bt_runner: 'BehaviorTreeRunner', params: str = None):
         self.bt_runner = bt_runner
         # PROTECTED
         self._throttle_ms = None
-        self._last_ts = datetime.min
+        self._last_ts = float('-inf')
+        # the versions of the parameters bound by the parent, in case the
+        # parent respectively this node tracks the changes of its parameters
+        self._bound_in_versions: list = None
+        self._bound_out_versions: list = None
+        # the blackboard scope of the parent and the own scope, if created
+        self._parent_blackboard: Blackboard = None
+        self._blackboard: Blackboard = None
 
         # PRIVATE
         self.__node_status = NodeStatus.IDLE
         self.__contingency_message = ''
-        self.__contingency_history: List[ContingencyHistoryEntry] = []
-        self.__params = params
-        self.__in_params: List[str] = []
-        self.__out_params: List[str] = []
+        # allocated when the first entry is appended
+        self.__contingency_history: List[ContingencyHistoryEntry] = None
+        self.__signature: _ParamSignature = None
         self.__timeout_timer = None
 
         # create local variables
-        if(self.__params is not None):
-            _params = self.__params.split('=>')
-            if(len(_params[0]) > 0):
-                self.__in_params = _params[0].strip().split(' ')
-            if len(_params) == 2:
-                self.__out_params = _params[1].strip().split(' ')
-
-            self.get_logger().trace(f'{self.__class__.__name__} in_params:  {self.__in_params}')
-            self.get_logger().trace(f'{self.__class__.__name__} out_params: {self.__out_params}')
-
-            # create in params
-            for p in filter(None, self.__in_params):
-                p = p.replace('?', '_', 1)
-                self.get_logger().trace(f'in: {p}')
-                exec(f'self.{p} = None')
-
-            # create out params
-            for p in filter(None, self.__out_params):
-                p = p.replace('?', '_', 1)
-                self.get_logger().trace(f'out: {p}')
-                exec(f'self.{p} = None')
+        if(params is not None):
+            self.__signature = _param_signatures.get(params)
+            if(self.__signature is None):
+                self.__signature = _ParamSignature(params)
+                _param_signatures[params] = self.__signature
+
+            if(self.get_logger().is_enabled(LogLevel.TRACE)):
+                self.get_logger().trace(f'{self.__class__.__name__} in_params:  '
+                                        + f'{self.__signature.in_params}')
+                self.get_logger().trace(f'{self.__class__.__name__} out_params: '
+                                        + f'{self.__signature.out_params}')
+
+            # create in and out params
+            if(self.track_param_changes):
+                _track_params(self.__class__, self.__signature.attrs)
+            for p in self.__signature.attrs:
+                setattr(self, p, None)
 
     # PRIVATE
 
@@ -96,20 +227,75 @@ class TreeNode(ABC):
     def _internal_on_delete(self) -> None:
         self.on_delete()
 
+    def _internal_save_init_state(self) -> None:
+        # is called when a pooled instance was created, before `on_init`
+        pass
+
+    def _internal_reset(self) -> None:
+        # restore the state of a new instance before the instance is pooled,
+        # the configuration set in __init__, e.g. the throttle of a
+        # `RateControlNode`, is kept
+        self.cancel_timeout_timer()
+        self._last_ts = float('-inf')
+        self._bound_in_versions = None
+        self._bound_out_versions = None
+        self._parent_blackboard = None
+        self._blackboard = None
+        self.__node_status = NodeStatus.IDLE
+        self.__contingency_message = ''
+        self.__contingency_history = None
+        if(self.__dict__.pop('_TreeNode__blackboard_refs', None) is not None):
+            self.__class__ = self.__class__._blackboard_base
+        self.__dict__.pop('_TreeNode__param_versions', None)
+        self.__dict__.pop('_TreeNode__changed_params', None)
+        if(self.__signature is not None):
+            for p in self.__signature.attrs:
+                setattr(self, p, None)
+
     @final
     def _internal_get_bt_runner(self) -> 'BehaviorTreeRunner':
         return self.bt_runner
 
     @final
-    def _internal_get_in_params(self) -> list:
-        return self.__in_params
+    def _internal_get_in_params(self) -> Tuple[str, ...]:
+        if(self.__signature is None):
+            return ()
+        return self.__signature.in_params
 
     @final
-    def _internal_get_out_params(self) -> list:
-        return self.__out_params
+    def _internal_get_out_params(self) -> Tuple[str, ...]:
+        if(self.__signature is None):
+            return ()
+        return self.__signature.out_params
+
+    @final
+    def _internal_map_to_blackboard(self, refs: Dict[str, Tuple[Blackboard, int]]) -> None:
+        # remap the parameter attributes to the (scope, slot) references of the
+        # blackboard variables, the references are shared and must not be modified
+        if('_TreeNode__blackboard_refs' in self.__dict__):
+            bb_cls = self.__class__
+            cls = bb_cls._blackboard_base
+        else:
+            cls = self.__class__
+            bb_cls = _blackboard_class(cls)
+        for attr in refs:
+            if(not isinstance(bb_cls.__dict__.get(attr), _BlackboardParam)):
+                if(attr in cls.__dict__ and not isinstance(cls.__dict__[attr], _TrackedParam)):
+                    raise AttributeError(f'{cls.__name__}.{attr} can not be remapped to '
+                                         + 'a blackboard variable')
+                setattr(bb_cls, attr, _BlackboardParam(attr))
+        self.__dict__['_TreeNode__blackboard_refs'] = refs
+        self.__class__ = bb_cls
+
+    @final
+    def _internal_get_param_versions(self) -> Dict[str, int]:
+        # the versions of the tracked parameters, or None if not tracked
+        return self.__dict__.get('_TreeNode__param_versions')
 
     @final
     def _internal_append_to_contingency_history(self, entry: ContingencyHistoryEntry):
+        if(self.__contingency_history is None):
+            self.__contingency_history = []
         self.__contingency_history.append(entry)
 
     # PUBLIC
@@ -188,7 +374,9 @@ class TreeNode(ABC):
         """Set the timeout.
 
         Set a timeout and starts the timer. In case a timeout occures,
-        the `on_timeout` callback is called.
+        the `on_timeout` callback is called. The timer is managed by the timer
+        service of the runner, thus `on_timeout` is called in the tick thread.
+        A previously set timeout of the node is canceled.
 
         Parameters
         ----------
@@ -196,15 +384,17 @@ class TreeNode(ABC):
             The timeout in milliseconds
 
         """
-        self.__timeout_timer = Timer(timeout_ms/1000, self.__internal_on_timeout)
-        self.__timeout_timer.start()
+        self.cancel_timeout_timer()
+        self.__timeout_timer = self.bt_runner.get_timer_service().schedule(
+            timeout_ms / 1000, self.__internal_on_timeout)
 
     @final
     def cancel_timeout_timer(self) -> None:
         """Cancel the timeout timer of the node."""
         if(self.__timeout_timer is not None):
-            self.get_logger().trace(f'{self.__class__.__name__} -> cancel timeout timer')
-            self.__timeout_timer.cancel()
+            if(self.get_logger().is_enabled(LogLevel.TRACE)):
+                self.get_logger().trace(f'{self.__class__.__name__} -> cancel timeout timer')
+            self.bt_runner.get_timer_service().cancel(self.__timeout_timer)
             # set the timer to None to make sure that all references (bound method)
             # are released and the object gets destroyed by gc
             self.__timeout_timer = None
@@ -241,6 +431,8 @@ class TreeNode(ABC):
             The contingency history
 
         """
+        if(self.__contingency_history is None):
+            return []
         return self.__contingency_history
 
     @final
@@ -275,11 +467,89 @@ class TreeNode(ABC):
         """
         self.__contingency_message = contingency_message
 
+    @final
+    def request_tick(self) -> None:
+        """Request an immediate tick.
+
+        Wakes up the `BehaviorTreeRunner` so that the next tick is executed right
+        away instead of waiting for the tick rate to expire. This is typically called
+        from the result callback of an asynchronous action right after the status of
+        the node was changed. `request_tick` can be called from any thread.
+        """
+        self.bt_runner.notify()
+
     @final
     def abort(self) -> None:
         """Abort the current node."""
         self._internal_on_abort()
 
+    @final
+    def get_blackboard(self) -> Blackboard:
+        """Return the blackboard scope of the node.
+
+        Returns the scope created with `create_blackboard_scope`, otherwise the
+        scope of the parent node. The scope of the root is the blackboard of
+        the `BehaviorTreeRunner`.
+
+        Returns
+        -------
+        `Blackboard`
+            The blackboard scope
+
+        """
+        if(self._blackboard is not None):
+            return self._blackboard
+        if(self._parent_blackboard is not None):
+            return self._parent_blackboard
+        return self.bt_runner.get_blackboard()
+
+    @final
+    def create_blackboard_scope(self) -> Blackboard:
+        """Create an own blackboard scope for the node.
+
+        Creates a child scope of the current scope. Blackboard variables
+        remapped by the child nodes are created in this scope, in case they
+        do not exist in a parent scope. Should be called in `on_init`.
+
+        Returns
+        -------
+        `Blackboard`
+            The new blackboard scope
+
+        """
+        self._blackboard = self.get_blackboard().create_scope()
+        return self._blackboard
+
+    def reset(self) -> None:
+        """Reset the node to be reused.
+
+        Is called when the instance of a node class with `pool_instances`
+        enabled completed and is put into the pool. The framework already
+        restored its own state and set the parameters to None. Override this
+        function to restore the attributes the node sets in `__init__`.
+        """
+        pass
+
+    @final
+    def pop_changed_params(self) -> List[str]:
+        """Return the parameters which were written since the last call.
+
+        Requires that `track_param_changes` is enabled for the class of the
+        node, otherwise an empty list is returned. This allows to monitor which
+        parameters, respectively variables, changed during a tick.
+
+        Returns
+        -------
+        list
+            The names of the changed parameters, e.g. ['?x', '?z']
+
+        """
+        changed = self.__dict__.get('_TreeNode__changed_params')
+        if(not changed):
+            return []
+        self.__dict__['_TreeNode__changed_params'] = set()
+        return sorted(name.replace('_', '?', 1) for name in changed)
+
     def set_throttle_ms(self, throttle_ms: int) -> None:
         """Set the throttle rate in milliseconds.
 
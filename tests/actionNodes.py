@@ -12,7 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+from threading import current_thread
 from threading import Timer
+from time import monotonic
+from time import sleep
+from typing import List
+from typing import Tuple
 
 from carebt.actionNode import ActionNode
 from carebt.nodeStatus import NodeStatus
@@ -455,6 +461,8 @@ class AddTwoNumbersLongRunningAction(ActionNode):
     def on_abort(self) -> None:
         mock('on_abort AddTwoNumbersLongRunningAction')
         self.__done_timer.cancel()
+        # wait until the timer thread has released its reference to the node
+        self.__done_timer.join()
 
     def on_delete(self) -> None:
         mock('on_delete AddTwoNumbersLongRunningAction')
@@ -468,6 +476,58 @@ class AddTwoNumbersLongRunningAction(ActionNode):
 ########################################################################
 
 
+class AddTwoNumbersLongRunningActionWithRequestTick(ActionNode):
+    """The `AddTwoNumbersLongRunningActionWithRequestTick` example node.
+
+    The `AddTwoNumbersLongRunningActionWithRequestTick` is a variation of the
+    `AddTwoNumbersLongRunningAction` which requests an immediate tick in the
+    `done_callback`. Thus, the behavior tree reacts to the completion of the
+    asynchronous function without waiting for the tick rate to expire.
+
+    Input Parameters
+    ----------------
+    ?calctime : int (ms)
+        Milliseconds requiered to complete
+    ?x : int
+        The first value
+    ?y : int
+        The second value
+
+    Output Parameters
+    -----------------
+    ?z : int
+        The sum of ?x and ?y
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?calctime ?x ?y => ?z')
+        mock('__init__ AddTwoNumbersLongRunningActionWithRequestTick')
+
+    def on_tick(self) -> None:
+        mock('AddTwoNumbersLongRunningActionWithRequestTick: '
+             + f'calculating {self._calctime} ms ...')
+        self.set_status(NodeStatus.SUSPENDED)
+        self.__done_timer = Timer(self._calctime / 1000, self.done_callback)
+        self.__done_timer.start()
+
+    def done_callback(self) -> None:
+        self._z = self._x + self._y
+        mock('AddTwoNumbersLongRunningActionWithRequestTick: done: '
+             + f'{self._x} + {self._y} = {self._z}')
+        self.set_status(NodeStatus.SUCCESS)
+        self.request_tick()
+
+    def on_delete(self) -> None:
+        mock('on_delete AddTwoNumbersLongRunningActionWithRequestTick')
+        self.__done_timer = None
+
+    def __del__(self):
+        mock('__del__ AddTwoNumbersLongRunningActionWithRequestTick')
+
+########################################################################
+
+
 class AddTwoNumbersLongRunningActionWithAbort(ActionNode):
     """The `AddTwoNumbersLongRunningActionWithAbort` example node.
 
@@ -550,6 +610,8 @@ class AddTwoNumbersLongRunningActionWithAbort(ActionNode):
         mock('on_abort AddTwoNumbersLongRunningActionWithAbort')
         print('on_abort AddTwoNumbersLongRunningActionWithAbort')
         self.__done_timer.cancel()
+        # wait until the timer thread has released its reference to the node
+        self.__done_timer.join()
 
     def on_delete(self) -> None:
         mock('on_delete AddTwoNumbersLongRunningActionWithAbort')
@@ -628,6 +690,8 @@ class AddTwoNumbersLongRunningActionMissingCallback(ActionNode):
         mock('on_abort AddTwoNumbersLongRunningActionMissingCallback')
         print('on_abort AddTwoNumbersLongRunningActionMissingCallback')
         self.__done_timer.cancel()
+        # wait until the timer thread has released its reference to the node
+        self.__done_timer.join()
 
     def on_delete(self) -> None:
         mock('on_delete AddTwoNumbersLongRunningActionMissingCallback')
@@ -705,6 +769,8 @@ class AddTwoNumbersLongRunningActionMissingCallback2(ActionNode):
     def on_delete(self) -> None:
         mock('on_delete AddTwoNumbersLongRunningActionMissingCallback2')
         self.__done_timer.cancel()
+        # wait until the timer thread has released its reference to the node
+        self.__done_timer.join()
         # set the timer to None to make sure that all references (bound method)
         # are released and the object gets destroyed by gc
         self.__done_timer = None
@@ -936,3 +1002,299 @@ class FailOnCountAction(ActionNode):
 
     def __del__(self):
         mock('__del__ FailOnCountAction')
+
+########################################################################
+
+
+class BusyMultiTickAction(ActionNode):
+    """The `BusyMultiTickAction` example node.
+
+    The `BusyMultiTickAction` requires `?ticks` ticks to complete. In each
+    tick it blocks for `?busy_ms` milliseconds to simulate a computationally
+    expensive `on_tick` callback.
+
+    Input Parameters
+    ----------------
+    ?ticks : int
+        Number of ticks requiered to complete
+    ?busy_ms : int (ms)
+        Milliseconds each tick blocks
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?ticks ?busy_ms')
+
+    def on_init(self) -> None:
+        self.tick_count = 0
+
+    def on_tick(self) -> None:
+        sleep(self._busy_ms / 1000)
+        self.tick_count += 1
+        if(self.tick_count >= self._ticks):
+            self.set_status(NodeStatus.SUCCESS)
+        else:
+            self.set_status(NodeStatus.RUNNING)
+
+########################################################################
+
+
+class TimeoutThreadAction(ActionNode):
+    """The `TimeoutThreadAction` example node.
+
+    The `TimeoutThreadAction` never completes by itself. It sets a timeout
+    of `?timeout_ms` milliseconds and in `on_timeout` sets the name of the
+    thread which calls `on_timeout` as contingency-message.
+
+    Input Parameters
+    ----------------
+    ?timeout_ms : int (ms)
+        The timeout in milliseconds
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?timeout_ms')
+
+    def on_init(self) -> None:
+        self.set_timeout(self._timeout_ms)
+
+    def on_tick(self) -> None:
+        self.set_status(NodeStatus.RUNNING)
+
+    def on_timeout(self) -> None:
+        self.abort()
+        self.set_contingency_message(current_thread().name)
+
+########################################################################
+
+
+class TrackedCounterAction(ActionNode):
+    """The `TrackedCounterAction` example node.
+
+    The `TrackedCounterAction` tracks the changes of its parameters. It
+    counts its ticks, but only writes the ?count every ?every ticks. It
+    completes with `SUCCESS` after ?goal ticks.
+
+    Input Parameters
+    ----------------
+    ?every : int
+        Write the ?count every ?every ticks
+    ?goal : int
+        The goal tick count
+
+    Output Parameters
+    -----------------
+    ?count : int
+        The current tick count
+
+    """
+
+    track_param_changes = True
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?every ?goal => ?count')
+
+    def on_init(self) -> None:
+        self.__ticks = 0
+
+    def on_tick(self) -> None:
+        self.__ticks += 1
+        if(self.__ticks % self._every == 0):
+            self._count = self.__ticks
+        if(self.__ticks >= self._goal):
+            self.set_status(NodeStatus.SUCCESS)
+
+########################################################################
+
+
+class TrackedEchoAction(ActionNode):
+    """The `TrackedEchoAction` example node.
+
+    The `TrackedEchoAction` tracks the changes of its parameters. It reports
+    the ?value on each tick and completes with `SUCCESS` if the ?value is
+    equal to the ?goal.
+
+    Input Parameters
+    ----------------
+    ?value : int
+        The value to report
+    ?goal : int
+        The value to complete on
+
+    """
+
+    track_param_changes = True
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?value ?goal')
+
+    def on_tick(self) -> None:
+        mock(f'TrackedEchoAction {self._value}')
+        if(self._value == self._goal):
+            self.set_status(NodeStatus.SUCCESS)
+
+
+########################################################################
+
+
+class PooledAddTwoNumbersAction(ActionNode):
+    """The `PooledAddTwoNumbersAction` example node.
+
+    The `PooledAddTwoNumbersAction` adds the two numbers ?x and ?y. Its
+    instances are pooled and reused. If one of the numbers is missing, it
+    completes with `FAILURE` and the contingency-message
+    'NOT_TWO_NUMBERS_PROVIDED'.
+
+    Input Parameters
+    ----------------
+    ?x : int
+        The first value
+    ?y : int
+        The second value
+
+    Output Parameters
+    -----------------
+    ?z : int
+        The sum of ?x and ?y
+
+    """
+
+    pool_instances = True
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?x ?y => ?z')
+        mock('__init__ PooledAddTwoNumbersAction')
+
+    def on_init(self) -> None:
+        mock('on_init PooledAddTwoNumbersAction')
+
+    def on_tick(self) -> None:
+        if(self._x is None or self._y is None):
+            mock('PooledAddTwoNumbersAction: NOT_TWO_NUMBERS_PROVIDED')
+            self.set_status(NodeStatus.FAILURE)
+            self.set_contingency_message('NOT_TWO_NUMBERS_PROVIDED')
+            return
+        self._z = self._x + self._y
+        mock(f'PooledAddTwoNumbersAction: calculating: {self._x} + {self._y} = {self._z}')
+        self.set_status(NodeStatus.SUCCESS)
+
+    def on_delete(self) -> None:
+        mock('on_delete PooledAddTwoNumbersAction')
+
+    def reset(self) -> None:
+        mock('reset PooledAddTwoNumbersAction')
+
+########################################################################
+
+
+class BlockingAction(ActionNode):
+    """The `BlockingAction` example node.
+
+    The `BlockingAction` blocks in `on_tick` for the provided time and
+    completes with `SUCCESS`, or with `FAILURE` and the contingency-message
+    'FAILED_<id>'. The name of the thread which ticked the node is provided
+    as ?thread. The id, the thread and the start and end time of each tick
+    are appended to `BlockingAction.ticks`.
+
+    Input Parameters
+    ----------------
+    ?id : int
+        The id to identify the node.
+    ?block_ms : int
+        The time to block in milliseconds.
+    ?success : bool
+        Wether the node should succeed or fail.
+
+    Output Parameters
+    -----------------
+    ?thread : str
+        The name of the thread which ticked the node
+
+    """
+
+    ticks: List[Tuple[int, str, float, float]] = []
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?id ?block_ms ?success => ?thread')
+
+    def on_init(self) -> None:
+        mock(f'on_init BlockingAction id = {self._id}')
+
+    def on_tick(self) -> None:
+        start = monotonic()
+        sleep(self._block_ms / 1000)
+        self._thread = current_thread().name
+        BlockingAction.ticks.append((self._id, self._thread, start, monotonic()))
+        if(self._success):
+            self.set_status(NodeStatus.SUCCESS)
+        else:
+            self.set_status(NodeStatus.FAILURE)
+            self.set_contingency_message(f'FAILED_{self._id}')
+
+    def on_delete(self) -> None:
+        mock(f'on_delete BlockingAction id = {self._id} thread = {self._thread}')
+
+########################################################################
+
+
+class SuspendedWaitAction(ActionNode):
+    """The `SuspendedWaitAction` example node.
+
+    The `SuspendedWaitAction` suspends itself with the first tick. It stays
+    `SUSPENDED` until its parent changes its status. Each call of `wait`
+    increments ?waits.
+
+    Output Parameters
+    -----------------
+    ?waits : int
+        The number of calls of `wait`.
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '=> ?waits')
+
+    def on_init(self) -> None:
+        self._waits = 0
+
+    def on_tick(self) -> None:
+        mock('SuspendedWaitAction: suspend')
+        self.set_status(NodeStatus.SUSPENDED)
+
+    def wait(self) -> None:
+        self._waits += 1
+
+    def on_delete(self) -> None:
+        mock(f'on_delete SuspendedWaitAction waits = {self._waits}')
+
+########################################################################
+
+
+class RaisingAction(ActionNode):
+    """The `RaisingAction` example node.
+
+    The `RaisingAction` raises a `RuntimeError` in its `on_tick` callback.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+
+    def on_tick(self) -> None:
+        raise RuntimeError('tick failed')
+
+########################################################################
+
+
+class ExitProcessAction(ActionNode):
+    """The `ExitProcessAction` example node.
+
+    The `ExitProcessAction` terminates the process which executes it in its
+    `on_tick` callback, e.g. to simulate a crashing worker process.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+
+    def on_tick(self) -> None:
+        os._exit(3)
@@ -0,0 +1,156 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from carebt.asyncActionNode import AsyncActionNode
+from carebt.nodeStatus import NodeStatus
+from carebt.parallelNode import ParallelNode
+from tests.global_mock import mock
+
+########################################################################
+
+
+class AsyncAddTwoNumbersAction(AsyncActionNode):
+    """The `AsyncAddTwoNumbersAction` example node.
+
+    The `AsyncAddTwoNumbersAction` awaits `?delay_ms` milliseconds before
+    it adds the two numbers.
+
+    Input Parameters
+    ----------------
+    ?delay_ms : int (ms)
+        Milliseconds to await
+    ?x : int
+        The first value
+    ?y : int
+        The second value
+
+    Output Parameters
+    -----------------
+    ?z : int
+        The sum of ?x and ?y
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?delay_ms ?x ?y => ?z')
+
+    async def on_tick(self) -> None:
+        mock(f'AsyncAddTwoNumbersAction: awaiting {self._delay_ms} ms ...')
+        await asyncio.sleep(self._delay_ms / 1000)
+        self._z = self._x + self._y
+        mock(f'AsyncAddTwoNumbersAction: {self._x} + {self._y} = {self._z}')
+        self.set_status(NodeStatus.SUCCESS)
+
+    def on_delete(self) -> None:
+        mock('on_delete AsyncAddTwoNumbersAction')
+
+########################################################################
+
+
+class AsyncMultiTickAction(AsyncActionNode):
+    """The `AsyncMultiTickAction` example node.
+
+    The `AsyncMultiTickAction` returns from its `on_tick` coroutine without
+    setting a final status until it was ticked `?ticks` times.
+
+    Input Parameters
+    ----------------
+    ?ticks : int
+        Number of ticks requiered to complete
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?ticks')
+
+    def on_init(self) -> None:
+        self.tick_count = 0
+
+    async def on_tick(self) -> None:
+        await asyncio.sleep(0)
+        self.tick_count += 1
+        mock(f'AsyncMultiTickAction: {self.get_status()} {self.tick_count}/{self._ticks}')
+        if(self.tick_count >= self._ticks):
+            self.set_status(NodeStatus.SUCCESS)
+
+########################################################################
+
+
+class AsyncRaisingAction(AsyncActionNode):
+    """The `AsyncRaisingAction` example node.
+
+    The `AsyncRaisingAction` raises a `ConnectionError` in its `on_tick`
+    coroutine.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+
+    async def on_tick(self) -> None:
+        await asyncio.sleep(0)
+        raise ConnectionError('host not reachable')
+
+########################################################################
+
+
+class AsyncTimeoutAction(AsyncActionNode):
+    """The `AsyncTimeoutAction` example node.
+
+    The `AsyncTimeoutAction` awaits longer than its timeout of 100 ms.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+
+    def on_init(self) -> None:
+        self.set_timeout(100)
+
+    async def on_tick(self) -> None:
+        try:
+            await asyncio.sleep(10)
+            self.set_status(NodeStatus.SUCCESS)
+        except asyncio.CancelledError:
+            mock('AsyncTimeoutAction: cancelled')
+            raise
+
+    def on_timeout(self) -> None:
+        mock('on_timeout AsyncTimeoutAction')
+        self.abort()
+        self.set_contingency_message('TIMEOUT')
+
+########################################################################
+
+
+class AsyncAddTwoNumbersParallel(ParallelNode):
+    """The `AsyncAddTwoNumbersParallel` example node.
+
+    The `AsyncAddTwoNumbersParallel` runs `?count` `AsyncAddTwoNumbersAction`
+    which await 100 ms each in parallel.
+
+    Input Parameters
+    ----------------
+    ?count : int
+        Number of children
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, 0, '?count')
+
+    def on_init(self) -> None:
+        self.set_success_threshold(self._count)
+        for _ in range(self._count):
+            self.add_child(AsyncAddTwoNumbersAction, '100 1 2 => ?z')
@@ -0,0 +1,160 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+from carebt.futureActionNode import FutureActionNode
+from carebt.nodeStatus import NodeStatus
+from carebt.parallelNode import ParallelNode
+from tests.global_mock import mock
+
+########################################################################
+
+
+class FutureAddTwoNumbersAction(FutureActionNode):
+    """The `FutureAddTwoNumbersAction` example node.
+
+    The `FutureAddTwoNumbersAction` blocks `?delay_ms` milliseconds in a
+    thread of the executor before it adds the two numbers.
+
+    Input Parameters
+    ----------------
+    ?delay_ms : int (ms)
+        Milliseconds to block
+    ?x : int
+        The first value
+    ?y : int
+        The second value
+
+    Output Parameters
+    -----------------
+    ?z : int
+        The sum of ?x and ?y
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?delay_ms ?x ?y => ?z')
+
+    def execute(self) -> int:
+        mock(f'FutureAddTwoNumbersAction: {threading.current_thread().name[:6]} '
+             + f'blocking {self._delay_ms} ms ...')
+        time.sleep(self._delay_ms / 1000)
+        return self._x + self._y
+
+    def on_result(self, result: int) -> None:
+        self._z = result
+        mock(f'FutureAddTwoNumbersAction: {self._x} + {self._y} = {self._z}')
+        self.set_status(NodeStatus.SUCCESS)
+
+    def on_delete(self) -> None:
+        mock('on_delete FutureAddTwoNumbersAction')
+
+########################################################################
+
+
+class FutureMultiTickAction(FutureActionNode):
+    """The `FutureMultiTickAction` example node.
+
+    The `FutureMultiTickAction` does not set a final status in `on_result`
+    until `execute` was called `?ticks` times.
+
+    Input Parameters
+    ----------------
+    ?ticks : int
+        Number of ticks requiered to complete
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?ticks')
+
+    def on_init(self) -> None:
+        self.tick_count = 0
+
+    def execute(self) -> int:
+        return self.tick_count + 1
+
+    def on_result(self, result: int) -> None:
+        self.tick_count = result
+        mock(f'FutureMultiTickAction: {self.get_status()} {self.tick_count}/{self._ticks}')
+        if(self.tick_count >= self._ticks):
+            self.set_status(NodeStatus.SUCCESS)
+
+########################################################################
+
+
+class FutureRaisingAction(FutureActionNode):
+    """The `FutureRaisingAction` example node.
+
+    The `FutureRaisingAction` raises a `ConnectionError` in `execute`.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+
+    def execute(self) -> None:
+        raise ConnectionError('host not reachable')
+
+########################################################################
+
+
+class FutureTimeoutAction(FutureActionNode):
+    """The `FutureTimeoutAction` example node.
+
+    The `FutureTimeoutAction` blocks longer than its timeout of 100 ms.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+
+    def on_init(self) -> None:
+        self.set_timeout(100)
+
+    def execute(self) -> None:
+        time.sleep(0.3)
+
+    def on_result(self, result: None) -> None:
+        mock('FutureTimeoutAction: on_result')
+        self.set_status(NodeStatus.SUCCESS)
+
+    def on_timeout(self) -> None:
+        mock('on_timeout FutureTimeoutAction')
+        self.abort()
+        self.set_contingency_message('TIMEOUT')
+
+########################################################################
+
+
+class FutureAddTwoNumbersParallel(ParallelNode):
+    """The `FutureAddTwoNumbersParallel` example node.
+
+    The `FutureAddTwoNumbersParallel` runs `?count` `FutureAddTwoNumbersAction`
+    which block 100 ms each in parallel.
+
+    Input Parameters
+    ----------------
+    ?count : int
+        Number of children
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, 0, '?count')
+
+    def on_init(self) -> None:
+        self.set_success_threshold(self._count)
+        for _ in range(self._count):
+            self.add_child(FutureAddTwoNumbersAction, '100 1 2 => ?z')
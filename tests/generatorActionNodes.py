@@ -0,0 +1,129 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from carebt.generatorActionNode import GeneratorActionNode
+from carebt.nodeStatus import NodeStatus
+from tests.global_mock import mock
+
+########################################################################
+
+
+class GeneratorAddTwoNumbersMultiTickAction(GeneratorActionNode):
+    """The `GeneratorAddTwoNumbersMultiTickAction` example node.
+
+    The `GeneratorAddTwoNumbersMultiTickAction` is a variation of the
+    `AddTwoNumbersMultiTickAction` which gives up the tick with `yield`
+    instead of counting the ticks in an attribute.
+
+    Input Parameters
+    ----------------
+    ?ticks : int
+        Number of ticks requiered to complete
+    ?x : int
+        The first value
+    ?y : int
+        The second value
+
+    Output Parameters
+    -----------------
+    ?z : int
+        The sum of ?x and ?y
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?ticks ?x ?y => ?z')
+
+    def on_tick(self):
+        for tick_count in range(1, self._ticks + 1):
+            mock('GeneratorAddTwoNumbersMultiTickAction: (tick_count = '
+                 + f'{tick_count}/{self._ticks}) {self.get_status()}')
+            yield
+        self._z = self._x + self._y
+        mock('GeneratorAddTwoNumbersMultiTickAction: DONE '
+             + f'{self._x} + {self._y} = {self._z}')
+
+    def on_delete(self) -> None:
+        mock('on_delete GeneratorAddTwoNumbersMultiTickAction')
+
+########################################################################
+
+
+class GeneratorCheckValueAction(GeneratorActionNode):
+    """The `GeneratorCheckValueAction` example node.
+
+    The `GeneratorCheckValueAction` waits one tick and completes with
+    `FAILURE` and the contingency-message `NEGATIVE` if `?value` is
+    negative. Otherwise, it completes with `SUCCESS`.
+
+    Input Parameters
+    ----------------
+    ?value : int
+        The value to check
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?value')
+
+    def on_tick(self):
+        yield
+        if(self._value < 0):
+            self.set_status(NodeStatus.FAILURE)
+            self.set_contingency_message('NEGATIVE')
+
+########################################################################
+
+
+class GeneratorRaisingAction(GeneratorActionNode):
+    """The `GeneratorRaisingAction` example node.
+
+    The `GeneratorRaisingAction` raises a `ConnectionError` in the second
+    tick.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+
+    def on_tick(self):
+        yield
+        raise ConnectionError('host not reachable')
+
+########################################################################
+
+
+class GeneratorTimeoutAction(GeneratorActionNode):
+    """The `GeneratorTimeoutAction` example node.
+
+    The `GeneratorTimeoutAction` yields forever and is aborted by its
+    timeout of 100 ms.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+
+    def on_init(self) -> None:
+        self.set_timeout(100)
+
+    def on_tick(self):
+        try:
+            while True:
+                yield
+        finally:
+            mock('GeneratorTimeoutAction: closed')
+
+    def on_timeout(self) -> None:
+        mock('on_timeout GeneratorTimeoutAction')
+        self.abort()
+        self.set_contingency_message('TIMEOUT')
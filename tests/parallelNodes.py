@@ -12,15 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 from threading import Timer
 
 from carebt.nodeStatus import NodeStatus
 from carebt.parallelNode import ParallelNode
 from tests.actionNodes import AddTwoNumbersAction
+from tests.actionNodes import BlockingAction
 from tests.actionNodes import FailOnCountAction
 from tests.actionNodes import HelloWorldAction
+from tests.actionNodes import SuspendedWaitAction
 from tests.actionNodes import TickCountingAction
+from tests.actionNodes import TrackedCounterAction
+from tests.actionNodes import TrackedEchoAction
 from tests.global_mock import mock
+from tests.sequenceNodes import PooledAddTwoNumbersSequence
 
 ########################################################################
 
@@ -484,3 +490,161 @@ class AsyncAddChildParallel(ParallelNode):
         self.set_status(NodeStatus.RUNNING)
         self.add_child(HelloWorldAction)
         self.add_child(HelloWorldAction)
+
+########################################################################
+
+
+class TrackedCounterParallel(ParallelNode):
+    """The `TrackedCounterParallel` example node.
+
+    The `TrackedCounterParallel` tracks the changes of its parameters. The
+    ?count of the `TrackedCounterAction` is passed to the `TrackedEchoAction`.
+    In `on_tick` the changed parameters are reported.
+    """
+
+    track_param_changes = True
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, 2, '')
+
+    def on_init(self) -> None:
+        self.add_child(TrackedCounterAction, '2 6 => ?count')
+        self.add_child(TrackedEchoAction, '?count 6')
+
+    def on_tick(self) -> None:
+        mock(f'TrackedCounterParallel changed {self.pop_changed_params()}')
+
+
+########################################################################
+
+
+class ThreadPoolParallel(ParallelNode):
+    """The `ThreadPoolParallel` example node.
+
+    The `ThreadPoolParallel` ticks three `BlockingAction` nodes, which block
+    for 200 ms, concurrently with a thread pool. Two of them have to
+    complete with `SUCCESS`.
+
+    Input Parameters
+    ----------------
+    ?s1: bool
+        Wether child 1 should succeed or fail
+    ?s2: bool
+        Wether child 2 should succeed or fail
+    ?s3: bool
+        Wether child 3 should succeed or fail
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, 2, '?s1 ?s2 ?s3')
+        self.set_executor(ThreadPoolExecutor(max_workers=3, thread_name_prefix='pool'))
+
+    def on_init(self) -> None:
+        self.add_child(BlockingAction, '1 200 ?s1 => ?t1')
+        self.add_child(BlockingAction, '2 200 ?s2 => ?t2')
+        self.add_child(BlockingAction, '3 200 ?s3 => ?t3')
+        self.register_contingency_handler(BlockingAction,
+                                          [NodeStatus.FAILURE],
+                                          'FAILED_.*',
+                                          self.failed_handler)
+
+    def failed_handler(self) -> None:
+        mock(f'ThreadPoolParallel: failed_handler child = {self._child_ptr}')
+
+    def on_delete(self) -> None:
+        self.get_executor().shutdown()
+
+########################################################################
+
+
+class SuspendedHandlerParallel(ParallelNode):
+    """The `SuspendedHandlerParallel` example node.
+
+    The `SuspendedHandlerParallel` runs a `TickCountingAction` and a
+    `SuspendedWaitAction` in parallel. The contingency-handler for the
+    `SUSPENDED` child is executed with each tick and fixes the child with
+    the third tick.
+
+    Output Parameters
+    -----------------
+    ?waits : int
+        The number of ticks the `SuspendedWaitAction` was suspended.
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, 2, '=> ?waits')
+
+    def on_init(self) -> None:
+        self.add_child(TickCountingAction, '1 3 True => ?cnt')
+        self.add_child(SuspendedWaitAction, '=> ?waits')
+        self.register_contingency_handler(SuspendedWaitAction,
+                                          [NodeStatus.SUSPENDED],
+                                          '.*',
+                                          self.suspended_handler)
+
+    def suspended_handler(self) -> None:
+        mock(f'SuspendedHandlerParallel: suspended_handler waits = {self._waits}')
+        child = self._child_ec_list[self._child_ptr].instance
+        child.wait()
+        if(child._waits == 3):
+            self.fix_current_child()
+
+########################################################################
+
+
+class SharedPoolParallel(ParallelNode):
+    """The `SharedPoolParallel` example node.
+
+    The `SharedPoolParallel` ticks two `BlockingAction` nodes, which block
+    for 100 ms, with the thread pool of the `BehaviorTreeRunner`.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, 2)
+        self.set_executor(bt_runner.get_executor())
+
+    def on_init(self) -> None:
+        self.add_child(BlockingAction, '1 100 True => ?t1')
+        self.add_child(BlockingAction, '2 100 True => ?t2')
+
+########################################################################
+
+
+class NestedSharedPoolParallel(ParallelNode):
+    """The `NestedSharedPoolParallel` example node.
+
+    The `NestedSharedPoolParallel` ticks two `SharedPoolParallel` nodes with
+    the thread pool of the `BehaviorTreeRunner`. Thus, the nested nodes
+    share the same pool.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, 2)
+        self.set_executor(bt_runner.get_executor())
+
+    def on_init(self) -> None:
+        self.add_child(SharedPoolParallel)
+        self.add_child(SharedPoolParallel)
+
+########################################################################
+
+
+class PooledChildrenParallel(ParallelNode):
+    """The `PooledChildrenParallel` example node.
+
+    The `PooledChildrenParallel` ticks eight `PooledAddTwoNumbersSequence`
+    nodes with the thread pool of the `BehaviorTreeRunner`. Thus, the pooled
+    `PooledAddTwoNumbersAction` grandchildren are acquired and released
+    concurrently. The results are written to the blackboard variables
+    `c0` to `c7`.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, 8)
+        self.set_executor(bt_runner.get_executor())
+
+    def on_init(self) -> None:
+        for i in range(8):
+            self.add_child(PooledAddTwoNumbersSequence, f'{i} {i} => @c{i}')
@@ -0,0 +1,142 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+from carebt.nodeStatus import NodeStatus
+from carebt.processActionNode import ProcessActionNode
+from tests.global_mock import mock
+
+########################################################################
+
+
+class ProcessFibonacciAction(ProcessActionNode):
+    """The `ProcessFibonacciAction` example node.
+
+    The `ProcessFibonacciAction` calculates the Fibonacci number of `?n`
+    recursively in a worker process.
+
+    Input Parameters
+    ----------------
+    ?n : int
+        The index of the Fibonacci number
+
+    Output Parameters
+    -----------------
+    ?fib : int
+        The Fibonacci number
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?n => ?fib')
+
+    @staticmethod
+    def compute(n: int) -> int:
+        def fib(n: int) -> int:
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+        return fib(n)
+
+    def on_delete(self) -> None:
+        mock(f'on_delete ProcessFibonacciAction: {self._n} -> {self._fib}')
+
+########################################################################
+
+
+class ProcessDivModAction(ProcessActionNode):
+    """The `ProcessDivModAction` example node.
+
+    The `ProcessDivModAction` divides `?a` by `?b` in a worker process. If
+    `?b` is zero, the `ZeroDivisionError` is raised in the worker process.
+
+    Input Parameters
+    ----------------
+    ?a : int
+        The dividend
+    ?b : int
+        The divisor
+
+    Output Parameters
+    -----------------
+    ?q : int
+        The quotient
+    ?r : int
+        The remainder
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?a ?b => ?q ?r')
+
+    @staticmethod
+    def compute(a: int, b: int) -> tuple:
+        return divmod(a, b)
+
+########################################################################
+
+
+class ProcessTimeoutAction(ProcessActionNode):
+    """The `ProcessTimeoutAction` example node.
+
+    The `ProcessTimeoutAction` computes longer than its timeout of 100 ms.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+
+    def on_init(self) -> None:
+        self.set_timeout(100)
+
+    @staticmethod
+    def compute() -> None:
+        time.sleep(0.5)
+
+    def on_result(self, result: None) -> None:
+        mock('ProcessTimeoutAction: on_result')
+        self.set_status(NodeStatus.SUCCESS)
+
+    def on_timeout(self) -> None:
+        mock('on_timeout ProcessTimeoutAction')
+        self.abort()
+        self.set_contingency_message('TIMEOUT')
+
+########################################################################
+
+
+class ProcessInvalidResultAction(ProcessActionNode):
+    """The `ProcessInvalidResultAction` example node.
+
+    The `ProcessInvalidResultAction` returns `?result` from `compute`,
+    although two values are required for its output parameters.
+
+    Input Parameters
+    ----------------
+    ?result : Any
+        The result to return
+
+    Output Parameters
+    -----------------
+    ?a : Any
+        The first value
+    ?b : Any
+        The second value
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?result => ?a ?b')
+
+    @staticmethod
+    def compute(result):
+        return result
@@ -20,9 +20,11 @@ from carebt.sequenceNode import SequenceNode
 from tests.actionNodes import AddTwoNumbersAction
 from tests.actionNodes import AddTwoNumbersActionWithFailure
 from tests.actionNodes import AddTwoNumbersLongRunningActionWithAbort
+from tests.actionNodes import AddTwoNumbersMultiTickAction
 from tests.actionNodes import FixMissingNumbersAction
 from tests.actionNodes import HelloWorldAction
 from tests.actionNodes import HelloWorldActionWithMessage
+from tests.actionNodes import PooledAddTwoNumbersAction
 from tests.actionNodes import ProvideMissingNumbersAction
 from tests.actionNodes import ShowNumberAction
 from tests.global_mock import mock
@@ -628,3 +630,194 @@ class AddTwoNumbersDynamic(SequenceNode):
         for self.v in values:
             self.append_child(AddTwoNumbersAction, 'v[0] 5 => ?result')
             self.append_child(ShowNumberAction, '?result')
+
+########################################################################
+
+
+class AddTwoNumbersBlackboard(SequenceNode):
+    """The `AddTwoNumbersBlackboard` example node.
+
+    The `AddTwoNumbersBlackboard` adds the blackboard variables @a and @b and
+    adds 10 to the @sum. The @sum is created in the own blackboard scope of the
+    sequence, the @total in the scope of the `BehaviorTreeRunner`, where @a and
+    @b are provided. The @sum is also forwarded to the careBT variable ?sum.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+        mock('__init__ AddTwoNumbersBlackboard')
+
+    def on_init(self) -> None:
+        mock('on_init AddTwoNumbersBlackboard')
+        self.get_blackboard().declare('total')
+        self.create_blackboard_scope()
+        self.append_child(AddTwoNumbersAction, '@a @b => @sum')
+        self.append_child(AddTwoNumbersAction, '@sum 10 => @total')
+        self.append_child(ShowNumberAction, '@sum')
+
+    def on_delete(self) -> None:
+        mock(f'on_delete AddTwoNumbersBlackboard sum = {self.get_blackboard().get("sum")}')
+
+
+########################################################################
+
+
+class PooledAddTwoNumbersSequence(SequenceNode):
+    """The `PooledAddTwoNumbersSequence` example node.
+
+    The `PooledAddTwoNumbersSequence` adds ?a and ?b and increments the sum
+    by one. Its instances are pooled and reused. The first child is added in
+    `__init__`, the second in `on_init`.
+
+    Input Parameters
+    ----------------
+    ?a : int
+        The first value
+    ?b : int
+        The second value
+
+    Output Parameters
+    -----------------
+    ?c : int
+        The sum of ?a and ?b plus one
+
+    """
+
+    pool_instances = True
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?a ?b => ?c')
+        self.append_child(PooledAddTwoNumbersAction, '?a ?b => ?c')
+        mock('__init__ PooledAddTwoNumbersSequence')
+
+    def on_init(self) -> None:
+        mock('on_init PooledAddTwoNumbersSequence')
+        self.append_child(PooledAddTwoNumbersAction, '?c 1 => ?c')
+
+    def on_delete(self) -> None:
+        mock('on_delete PooledAddTwoNumbersSequence')
+
+    def reset(self) -> None:
+        mock('reset PooledAddTwoNumbersSequence')
+
+########################################################################
+
+
+class PooledRetrySequence(SequenceNode):
+    """The `PooledRetrySequence` example node.
+
+    The `PooledRetrySequence` executes the `PooledAddTwoNumbersSequence`
+    with a missing number. The contingency-handler retries it with two
+    numbers. The pooled instances are reused for the retry.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+        mock('__init__ PooledRetrySequence')
+
+    def on_init(self) -> None:
+        mock('on_init PooledRetrySequence')
+        self.append_child(PooledAddTwoNumbersSequence, '1 => ?c')
+        self.register_contingency_handler(PooledAddTwoNumbersSequence,
+                                          [NodeStatus.FAILURE],
+                                          'NOT_TWO_NUMBERS_PROVIDED',
+                                          self.retry_handler)
+
+    def retry_handler(self) -> None:
+        mock('PooledRetrySequence: retry_handler')
+        self.fix_current_child()
+        self.remove_all_children()
+        self.append_child(PooledAddTwoNumbersSequence, '1 2 => ?c')
+        self.append_child(PooledAddTwoNumbersSequence, '?c 3 => ?c')
+        self.append_child(ShowNumberAction, '?c')
+
+    def __del__(self):
+        mock('__del__ PooledRetrySequence')
+
+########################################################################
+
+
+class AddTwoNumbersMultiTickSequence(SequenceNode):
+    """The `AddTwoNumbersMultiTickSequence` example node.
+
+    The `AddTwoNumbersMultiTickSequence` executes two
+    `AddTwoNumbersMultiTickAction` nodes which take two ticks to complete
+    and shows the result.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+        mock('__init__ AddTwoNumbersMultiTickSequence')
+
+    def on_init(self) -> None:
+        mock('on_init AddTwoNumbersMultiTickSequence')
+        self.append_child(AddTwoNumbersMultiTickAction, '2 1 2 => ?sum')
+        self.append_child(AddTwoNumbersMultiTickAction, '2 ?sum 5 => ?sum')
+        self.append_child(ShowNumberAction, '?sum')
+
+    def __del__(self):
+        mock('__del__ AddTwoNumbersMultiTickSequence')
+
+########################################################################
+
+
+class PrebuiltPooledSequence(SequenceNode):
+    """The `PrebuiltPooledSequence` example node.
+
+    The `PrebuiltPooledSequence` executes an `AddTwoNumbersMultiTickAction`
+    which takes two ticks to complete, followed by a pooled
+    `PooledAddTwoNumbersAction`.
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner)
+
+    def on_init(self) -> None:
+        self.append_child(AddTwoNumbersMultiTickAction, '2 1 2 => ?sum')
+        self.append_child(PooledAddTwoNumbersAction, '?sum 5 => ?sum')
+
+########################################################################
+
+
+class ForeignHandler():
+    """The `ForeignHandler` class.
+
+    Provides a `fix_missing_numbers_handler` which is not a method of a
+    careBT node.
+    """
+
+    def fix_missing_numbers_handler(self):
+        mock('ForeignHandler: fix_missing_numbers_handler')
+
+
+class ForeignHandlerSequence(SequenceNode):
+    """The `ForeignHandlerSequence` example node.
+
+    The `ForeignHandlerSequence` registers the `fix_missing_numbers_handler`
+    of a `ForeignHandler` as contingency-handler. As the function is not a
+    method of the `ForeignHandlerSequence`, the method with the same name of
+    the `ForeignHandlerSequence` is called.
+
+    Input Parameters
+    ----------------
+    ?a : int
+        The first number
+    ?b : int
+        The second number
+
+    """
+
+    def __init__(self, bt_runner):
+        super().__init__(bt_runner, '?a ?b')
+
+    def on_init(self) -> None:
+        self.append_child(AddTwoNumbersActionWithFailure, '?a ?b => ?result')
+
+        self.register_contingency_handler(AddTwoNumbersActionWithFailure,
+                                          [NodeStatus.FAILURE],
+                                          'NOT_TWO_NUMBERS_PROVIDED',
+                                          ForeignHandler().fix_missing_numbers_handler)
+
+    def fix_missing_numbers_handler(self):
+        mock('ForeignHandlerSequence: fix_missing_numbers_handler')
+        self.fix_current_child()
@@ -25,6 +25,7 @@ from tests.actionNodes import AddTwoNumbersLongRunningAction
 from tests.actionNodes import AddTwoNumbersLongRunningActionMissingCallback
 from tests.actionNodes import AddTwoNumbersLongRunningActionMissingCallback2
 from tests.actionNodes import AddTwoNumbersLongRunningActionWithAbort
+from tests.actionNodes import AddTwoNumbersLongRunningActionWithRequestTick
 from tests.actionNodes import AddTwoNumbersMultiTickActionWithTimeout
 from tests.actionNodes import AddTwoNumbersThrottledMultiTickAction
 from tests.actionNodes import HelloWorldAction
@@ -220,7 +221,7 @@ class TestActionNode:
         bt_runner.run(AddTwoNumbersMultiTickActionWithTimeout, '5 3 5 => ?result')
         end = datetime.now()
         delta = end - start
-        assert int(delta.total_seconds() * 1000) > 55
+        assert int(delta.total_seconds() * 1000) >= 50
         assert int(delta.total_seconds() * 1000) < 70
         print(mock.call_args_list)
         assert mock.call_args_list == [call('__init__ AddTwoNumbersMultiTickActionWithTimeout'),
@@ -307,6 +308,27 @@ class TestActionNode:
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
 
+    def test_AddTwoNumbersLongRunningActionWithRequestTick_100_3_5(self):
+        """Test that request_tick wakes up the runner before the tick rate expires."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_tick_rate_ms(2000)
+        start = datetime.now()
+        bt_runner.run(AddTwoNumbersLongRunningActionWithRequestTick, '100 3 5 => ?result')
+        end = datetime.now()
+        delta = end - start
+        assert int(delta.total_seconds() * 1000) >= 100
+        assert int(delta.total_seconds() * 1000) < 200
+        print(mock.call_args_list)
+        assert mock.call_args_list == [call('__init__ AddTwoNumbersLongRunningActionWithRequestTick'),  # noqa: E501
+                                       call('AddTwoNumbersLongRunningActionWithRequestTick: calculating 100 ms ...'),  # noqa: E501
+                                       call('AddTwoNumbersLongRunningActionWithRequestTick: done: 3 + 5 = 8'),  # noqa: E501
+                                       call('on_delete AddTwoNumbersLongRunningActionWithRequestTick'),  # noqa: E501
+                                       call('__del__ AddTwoNumbersLongRunningActionWithRequestTick')]  # noqa: E501
+        assert bt_runner._instance._result == 8
+        assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 2
+
     ########################################################################
 
     def test_AddTwoNumbersLongRunningActionWithAbort_100_3_5(self):
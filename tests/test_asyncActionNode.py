@@ -0,0 +1,103 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from datetime import datetime
+from unittest.mock import call
+
+from carebt.abstractLogger import LogLevel
+from carebt.asyncBehaviorTreeRunner import AsyncBehaviorTreeRunner
+from carebt.nodeStatus import NodeStatus
+from tests.asyncActionNodes import AsyncAddTwoNumbersAction
+from tests.asyncActionNodes import AsyncAddTwoNumbersParallel
+from tests.asyncActionNodes import AsyncMultiTickAction
+from tests.asyncActionNodes import AsyncRaisingAction
+from tests.asyncActionNodes import AsyncTimeoutAction
+from tests.global_mock import mock
+
+
+class TestAsyncActionNode:
+    """Tests the `AsyncActionNode` and the `AsyncBehaviorTreeRunner`."""
+
+    ########################################################################
+
+    def test_AsyncAddTwoNumbersAction(self):
+        """Test that the tree reacts immediately when the coroutine completes."""
+        mock.reset_mock()
+        bt_runner = AsyncBehaviorTreeRunner()
+        bt_runner.set_tick_rate_ms(1000)
+        start = datetime.now()
+        bt_runner.run(AsyncAddTwoNumbersAction, '100 3 5 => ?result')
+        end = datetime.now()
+        delta = end - start
+        assert int(delta.total_seconds() * 1000) >= 100
+        assert int(delta.total_seconds() * 1000) < 150
+        print(mock.call_args_list)
+        assert mock.call_args_list == [call('AsyncAddTwoNumbersAction: awaiting 100 ms ...'),
+                                       call('AsyncAddTwoNumbersAction: 3 + 5 = 8'),
+                                       call('on_delete AsyncAddTwoNumbersAction')]
+        assert bt_runner._instance._result == 8
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 2
+
+    def test_AsyncAddTwoNumbersAction_run_async(self):
+        """Test running the tree on an existing event loop."""
+        mock.reset_mock()
+        bt_runner = AsyncBehaviorTreeRunner()
+        asyncio.run(bt_runner.run_async(AsyncAddTwoNumbersAction, '10 1 2 => ?result'))
+        assert bt_runner._instance._result == 3
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+
+    def test_AsyncMultiTickAction(self):
+        """Test that the coroutine is scheduled again if no final status is set."""
+        mock.reset_mock()
+        bt_runner = AsyncBehaviorTreeRunner()
+        bt_runner.run(AsyncMultiTickAction, '3')
+        print(mock.call_args_list)
+        assert mock.call_args_list == [call('AsyncMultiTickAction: NodeStatus.SUSPENDED 1/3'),
+                                       call('AsyncMultiTickAction: NodeStatus.SUSPENDED 2/3'),
+                                       call('AsyncMultiTickAction: NodeStatus.SUSPENDED 3/3')]
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 4
+
+    def test_AsyncRaisingAction(self):
+        """Test that an exception raised in the coroutine results in FAILURE."""
+        bt_runner = AsyncBehaviorTreeRunner()
+        bt_runner.get_logger().set_log_level(LogLevel.OFF)
+        bt_runner.run(AsyncRaisingAction)
+        assert bt_runner.get_status() == NodeStatus.FAILURE
+        assert bt_runner.get_contingency_message() == 'ConnectionError'
+
+    def test_AsyncTimeoutAction(self):
+        """Test that the coroutine is cancelled on timeout."""
+        mock.reset_mock()
+        bt_runner = AsyncBehaviorTreeRunner()
+        bt_runner.get_logger().set_log_level(LogLevel.OFF)
+        bt_runner.run(AsyncTimeoutAction)
+        print(mock.call_args_list)
+        assert mock.call_args_list == [call('on_timeout AsyncTimeoutAction'),
+                                       call('AsyncTimeoutAction: cancelled')]
+        assert bt_runner.get_status() == NodeStatus.ABORTED
+        assert bt_runner.get_contingency_message() == 'TIMEOUT'
+
+    def test_AsyncAddTwoNumbersParallel(self):
+        """Test that 200 children await concurrently within the same thread."""
+        bt_runner = AsyncBehaviorTreeRunner()
+        start = datetime.now()
+        bt_runner.run(AsyncAddTwoNumbersParallel, '200')
+        end = datetime.now()
+        delta = end - start
+        assert int(delta.total_seconds() * 1000) >= 100
+        assert int(delta.total_seconds() * 1000) < 300
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
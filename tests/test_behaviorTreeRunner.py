@@ -0,0 +1,102 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.nodeStatus import NodeStatus
+from carebt.tickPolicy import TickPolicy
+from tests.actionNodes import BusyMultiTickAction
+
+
+class TestBehaviorTreeRunner:
+    """Tests the `BehaviorTreeRunner`."""
+
+    ########################################################################
+
+    def test_tick_policy_fixed_delay(self):
+        """Test that the tick rate is waited after each tick (10 x (20ms + 50ms))."""
+        bt_runner = BehaviorTreeRunner()
+        start = datetime.now()
+        bt_runner.run(BusyMultiTickAction, '10 20')
+        end = datetime.now()
+        delta = end - start
+        assert int(delta.total_seconds() * 1000) > 650
+        assert int(delta.total_seconds() * 1000) < 750
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 10
+        assert bt_runner.get_overrun_count() == 0
+
+    def test_tick_policy_fixed_rate(self):
+        """Test that only the remainder of the tick rate is waited (9 x 50ms + 20ms)."""
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_tick_policy(TickPolicy.FIXED_RATE_SKIP)
+        start = datetime.now()
+        bt_runner.run(BusyMultiTickAction, '10 20')
+        end = datetime.now()
+        delta = end - start
+        assert int(delta.total_seconds() * 1000) >= 470
+        assert int(delta.total_seconds() * 1000) < 520
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 10
+        assert bt_runner.get_overrun_count() == 0
+
+    def test_tick_policy_fixed_rate_skip_overrun(self):
+        """Test that ticks missed due to an overrun (80ms > 50ms) are skipped."""
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_tick_policy(TickPolicy.FIXED_RATE_SKIP)
+        start = datetime.now()
+        bt_runner.run(BusyMultiTickAction, '5 80')
+        end = datetime.now()
+        delta = end - start
+        # ticks start at 0, 100, 200, 300 and 400ms
+        assert int(delta.total_seconds() * 1000) >= 480
+        assert int(delta.total_seconds() * 1000) < 530
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 5
+        assert bt_runner.get_overrun_count() == 4
+
+    def test_tick_policy_fixed_rate_catch_up_overrun(self):
+        """Test that ticks missed due to an overrun (80ms > 50ms) run back-to-back."""
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_tick_policy(TickPolicy.FIXED_RATE_CATCH_UP)
+        start = datetime.now()
+        bt_runner.run(BusyMultiTickAction, '5 80')
+        end = datetime.now()
+        delta = end - start
+        # all ticks run back-to-back
+        assert int(delta.total_seconds() * 1000) >= 400
+        assert int(delta.total_seconds() * 1000) < 450
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 5
+        assert bt_runner.get_overrun_count() == 4
+
+    ########################################################################
+
+    def test_tick_once(self):
+        """Test executing the behavior tree step by step."""
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.start(BusyMultiTickAction, '3 0')
+        assert bt_runner.is_done() is False
+        assert bt_runner.get_status() == NodeStatus.IDLE
+        assert bt_runner.tick_once() == NodeStatus.RUNNING
+        assert bt_runner.is_done() is False
+        assert bt_runner.tick_once() == NodeStatus.RUNNING
+        assert bt_runner.tick_once() == NodeStatus.SUCCESS
+        assert bt_runner.is_done() is True
+        assert bt_runner.get_tick_count() == 3
+        # ticking a completed tree does nothing
+        assert bt_runner.tick_once() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 3
+        assert bt_runner.get_contingency_message() == ''
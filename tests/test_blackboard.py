@@ -0,0 +1,104 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import call
+
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.blackboard import Blackboard
+from carebt.nodeStatus import NodeStatus
+from tests.actionNodes import AddTwoNumbersAction
+from tests.actionNodes import PooledAddTwoNumbersAction
+from tests.global_mock import mock
+from tests.sequenceNodes import AddTwoNumbersBlackboard
+from tests.sequenceNodes import PooledAddTwoNumbersSequence
+
+
+class TestBlackboard:
+    """Tests the `Blackboard`."""
+
+    ########################################################################
+
+    def test_scopes(self):
+        """Test the lookup of variables in hierarchical scopes."""
+        root = Blackboard()
+        root.set('a', 1)
+        scope = root.create_scope()
+        assert scope.get_parent() is root
+        assert scope.contains('a')
+        assert scope.get('a') == 1
+        scope.set('a', 2)
+        assert root.get('a') == 2
+        scope.declare('a', 3)
+        assert scope.get('a') == 3
+        assert root.get('a') == 2
+        scope.set('b', 4)
+        assert scope.get('b') == 4
+        assert not root.contains('b')
+        assert root.get('b', -1) == -1
+
+    def test_AddTwoNumbersBlackboard(self):
+        """Test the `AddTwoNumbersBlackboard` node.
+
+        The children read and write the variables of the blackboard. The @sum
+        is created in the scope of the sequence, the @total in the scope of
+        the `BehaviorTreeRunner`.
+
+        """
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.get_blackboard().set('a', 1)
+        bt_runner.get_blackboard().set('b', 2)
+        bt_runner.run(AddTwoNumbersBlackboard)
+        assert mock.called
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_blackboard().get('total') == 13
+        assert not bt_runner.get_blackboard().contains('sum')
+        assert mock.call_args_list == [call('__init__ AddTwoNumbersBlackboard'),
+                                       call('on_init AddTwoNumbersBlackboard'),
+                                       call('__init__ AddTwoNumbersAction'),
+                                       call('on_init AddTwoNumbersAction'),
+                                       call('AddTwoNumbersAction: calculating: 1 + 2 = 3'),
+                                       call('on_delete AddTwoNumbersAction'),
+                                       call('__del__ AddTwoNumbersAction'),
+                                       call('__init__ AddTwoNumbersAction'),
+                                       call('on_init AddTwoNumbersAction'),
+                                       call('AddTwoNumbersAction: calculating: 3 + 10 = 13'),
+                                       call('on_delete AddTwoNumbersAction'),
+                                       call('__del__ AddTwoNumbersAction'),
+                                       call('__init__ ShowNumberAction'),
+                                       call('on_init ShowNumberAction'),
+                                       call('ShowNumberAction: The numer is: 3!'),
+                                       call('on_delete ShowNumberAction'),
+                                       call('__del__ ShowNumberAction'),
+                                       call('on_delete AddTwoNumbersBlackboard sum = 3')]
+
+    def test_remapping_per_instance(self):
+        """Test that the remapping does not change the node class.
+
+        Only the remapped instances use the descriptors of the blackboard
+        class. A pooled instance is restored to its node class.
+
+        """
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.get_blackboard().set('a', 1)
+        bt_runner.get_blackboard().set('b', 2)
+        bt_runner.run(AddTwoNumbersBlackboard)
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        for attr in ('_x', '_y', '_z'):
+            assert attr not in AddTwoNumbersAction.__dict__
+        bt_runner.run(PooledAddTwoNumbersSequence, '1 2 => @c')
+        assert bt_runner.get_blackboard().get('c') == 4
+        for pool in bt_runner._node_pool.values():
+            for instance in pool:
+                assert type(instance) in (PooledAddTwoNumbersSequence, PooledAddTwoNumbersAction)
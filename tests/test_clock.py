@@ -0,0 +1,112 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+from unittest.mock import call
+
+from carebt.abstractLogger import LogLevel
+from carebt.asyncBehaviorTreeRunner import AsyncBehaviorTreeRunner
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.clock import VirtualClock
+from carebt.multiTreeRunner import MultiTreeRunner
+from carebt.nodeStatus import NodeStatus
+from tests.actionNodes import AddTwoNumbersMultiTickActionWithTimeout
+from tests.actionNodes import AddTwoNumbersThrottledMultiTickAction
+from tests.actionNodes import TimeoutThreadAction
+from tests.global_mock import mock
+
+
+class TestClock:
+    """Tests the `VirtualClock`."""
+
+    ########################################################################
+
+    def test_virtual_clock(self):
+        """Test that the `VirtualClock` only advances when advanced."""
+        clock = VirtualClock(10)
+        assert clock.now() == 10
+        clock.advance(0.5)
+        assert clock.now() == 10.5
+        clock.advance(-1)
+        assert clock.now() == 10.5
+
+    def test_timeout(self):
+        """Test that a timeout behaves the same with the `VirtualClock`."""
+        mock.reset_mock()
+        clock = VirtualClock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_clock(clock)
+        bt_runner.set_tick_rate_ms(500)
+        start = datetime.now()
+        bt_runner.run(AddTwoNumbersMultiTickActionWithTimeout, '5 3 5 => ?result')
+        end = datetime.now()
+        assert int((end - start).total_seconds() * 1000) < 50
+        assert clock.now() == 1.0
+        assert mock.call_args_list == [call('__init__ AddTwoNumbersMultiTickActionWithTimeout'),
+                                       call('on_init AddTwoNumbersMultiTickActionWithTimeout'),
+                                       call('AddTwoNumbersMultiTickActionWithTimeout: (tick_count = 1/5)'),  # noqa: E501
+                                       call('AddTwoNumbersMultiTickActionWithTimeout: (tick_count = 2/5)'),  # noqa: E501
+                                       call('on_timeout AddTwoNumbersMultiTickActionWithTimeout'),  # noqa: E501
+                                       call('on_delete AddTwoNumbersMultiTickActionWithTimeout'),
+                                       call('__del__ AddTwoNumbersMultiTickActionWithTimeout')]
+        assert bt_runner.get_status() == NodeStatus.ABORTED
+        assert bt_runner.get_contingency_message() == 'TIMEOUT'
+        assert bt_runner.get_tick_count() == 3
+
+    def test_throttle(self):
+        """Test that the throttling uses the `VirtualClock`."""
+        mock.reset_mock()
+        clock = VirtualClock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_clock(clock)
+        bt_runner.set_tick_rate_ms(10)
+        start = datetime.now()
+        bt_runner.run(AddTwoNumbersThrottledMultiTickAction, '5 3 5 => ?result')
+        end = datetime.now()
+        assert int((end - start).total_seconds() * 1000) < 500
+        assert clock.now() == 2.5
+        assert bt_runner.get_tick_count() == 251
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner._instance._result == 8
+
+    def test_multi_tree_runner(self):
+        """Test that the trees of a `MultiTreeRunner` use its `VirtualClock`."""
+        clock = VirtualClock()
+        runner = MultiTreeRunner()
+        runner.get_logger().set_log_level(LogLevel.OFF)
+        runner.set_clock(clock)
+        runner.set_tick_rate_ms(1000)
+        trees = [runner.add_tree(TimeoutThreadAction, f'{60000 * (i + 1)}') for i in range(10)]
+        start = datetime.now()
+        runner.run()
+        end = datetime.now()
+        assert int((end - start).total_seconds() * 1000) < 500
+        assert clock.now() == 600
+        for i, tree in enumerate(trees):
+            assert tree.get_status() == NodeStatus.ABORTED
+            assert tree.get_tick_count() == 60 * (i + 1) + 1
+
+    def test_async_runner(self):
+        """Test that the `AsyncBehaviorTreeRunner` uses the `VirtualClock`."""
+        clock = VirtualClock()
+        bt_runner = AsyncBehaviorTreeRunner()
+        bt_runner.get_logger().set_log_level(LogLevel.OFF)
+        bt_runner.set_clock(clock)
+        start = datetime.now()
+        bt_runner.run(TimeoutThreadAction, '3600000')
+        end = datetime.now()
+        assert int((end - start).total_seconds() * 1000) < 2000
+        assert 3600 <= clock.now() < 3600.05
+        assert bt_runner.get_status() == NodeStatus.ABORTED
+        assert bt_runner.get_tick_count() == 72001
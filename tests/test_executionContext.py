@@ -0,0 +1,50 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+from carebt.executionContext import ExecutionContext
+from tests.actionNodes import AddTwoNumbersAction
+
+
+class TestExecutionContext:
+    """Tests the `ExecutionContext`."""
+
+    ########################################################################
+
+    def test_call_params(self):
+        """Test the binding of the different kinds of call params."""
+        parent = SimpleNamespace(value=5, pose=SimpleNamespace(x=1.5), _y=2)
+        ec = ExecutionContext(parent, AddTwoNumbersAction,
+                              "?x  3 -1.5 'hi' None (1,2) value pose.x _y+1 => ?z")
+        assert ec.call_in_params == ('?x', 3, -1.5, 'hi', None, (1, 2), 5, 1.5, 3)
+        assert ec.call_out_params == ('?z',)
+        assert ec.node is AddTwoNumbersAction
+        assert ec.instance is None
+
+    def test_attributes_are_bound_on_creation(self):
+        """Test that the members of the parent are read when the context is created."""
+        parent = SimpleNamespace(value=1)
+        ec1 = ExecutionContext(parent, AddTwoNumbersAction, 'value [1] => ?z')
+        parent.value = 2
+        ec2 = ExecutionContext(parent, AddTwoNumbersAction, 'value [1] => ?z')
+        assert ec1.call_in_params == (1, [1])
+        assert ec2.call_in_params == (2, [1])
+        assert ec1.call_in_params[1] is not ec2.call_in_params[1]
+
+    def test_no_params(self):
+        """Test a context without params."""
+        ec = ExecutionContext(None, AddTwoNumbersAction, None)
+        assert ec.call_in_params == ()
+        assert ec.call_out_params == ()
@@ -0,0 +1,130 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import call
+
+from carebt.abstractLogger import LogLevel
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.nodeStatus import NodeStatus
+import pytest
+from tests.futureActionNodes import FutureAddTwoNumbersAction
+from tests.futureActionNodes import FutureAddTwoNumbersParallel
+from tests.futureActionNodes import FutureMultiTickAction
+from tests.futureActionNodes import FutureRaisingAction
+from tests.futureActionNodes import FutureTimeoutAction
+from tests.global_mock import mock
+
+
+class TestFutureActionNode:
+    """Tests the `FutureActionNode`."""
+
+    ########################################################################
+
+    def test_FutureAddTwoNumbersAction(self):
+        """Test that the tree reacts immediately when the future completes."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_tick_rate_ms(1000)
+        start = datetime.now()
+        bt_runner.run(FutureAddTwoNumbersAction, '100 3 5 => ?result')
+        end = datetime.now()
+        delta = end - start
+        assert int(delta.total_seconds() * 1000) >= 100
+        assert int(delta.total_seconds() * 1000) < 150
+        print(mock.call_args_list)
+        assert mock.call_args_list == [call('FutureAddTwoNumbersAction: carebt '
+                                            + 'blocking 100 ms ...'),
+                                       call('FutureAddTwoNumbersAction: 3 + 5 = 8'),
+                                       call('on_delete FutureAddTwoNumbersAction')]
+        assert bt_runner._instance._result == 8
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 2
+        bt_runner.shutdown()
+
+    def test_FutureAddTwoNumbersAction_set_executor(self):
+        """Test that the work is submitted to the executor of the runner."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        with ThreadPoolExecutor(thread_name_prefix='custom') as executor:
+            bt_runner.set_executor(executor)
+            assert bt_runner.get_executor() is executor
+            bt_runner.run(FutureAddTwoNumbersAction, '10 1 2 => ?result')
+        assert mock.call_args_list[0] == call('FutureAddTwoNumbersAction: custom '
+                                              + 'blocking 10 ms ...')
+        assert bt_runner._instance._result == 3
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+
+    def test_FutureMultiTickAction(self):
+        """Test that execute is submitted again if no final status is set."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(FutureMultiTickAction, '3')
+        print(mock.call_args_list)
+        assert mock.call_args_list == [call('FutureMultiTickAction: NodeStatus.RUNNING 1/3'),
+                                       call('FutureMultiTickAction: NodeStatus.RUNNING 2/3'),
+                                       call('FutureMultiTickAction: NodeStatus.RUNNING 3/3')]
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 6
+        bt_runner.shutdown()
+
+    def test_FutureRaisingAction(self):
+        """Test that an exception raised in execute results in FAILURE."""
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.get_logger().set_log_level(LogLevel.OFF)
+        bt_runner.run(FutureRaisingAction)
+        assert bt_runner.get_status() == NodeStatus.FAILURE
+        assert bt_runner.get_contingency_message() == 'ConnectionError'
+        bt_runner.shutdown()
+
+    def test_FutureTimeoutAction(self):
+        """Test that the result is ignored after a timeout."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.get_logger().set_log_level(LogLevel.OFF)
+        bt_runner.run(FutureTimeoutAction)
+        assert bt_runner.get_status() == NodeStatus.ABORTED
+        assert bt_runner.get_contingency_message() == 'TIMEOUT'
+        # wait until the blocking execute returned
+        bt_runner.shutdown()
+        print(mock.call_args_list)
+        assert mock.call_args_list == [call('on_timeout FutureTimeoutAction')]
+
+    def test_FutureAddTwoNumbersParallel(self):
+        """Test that the children block concurrently in the thread pool."""
+        bt_runner = BehaviorTreeRunner()
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            bt_runner.set_executor(executor)
+            start = datetime.now()
+            bt_runner.run(FutureAddTwoNumbersParallel, '20')
+            end = datetime.now()
+        delta = end - start
+        assert int(delta.total_seconds() * 1000) >= 100
+        assert int(delta.total_seconds() * 1000) < 300
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+
+    def test_shutdown(self):
+        """Test that only the executor created by the runner is shut down."""
+        with BehaviorTreeRunner() as bt_runner:
+            executor = bt_runner.get_executor()
+            bt_runner.run(FutureAddTwoNumbersAction, '10 1 2 => ?result')
+        with pytest.raises(RuntimeError):
+            executor.submit(abs, -1)
+        assert bt_runner.get_executor() is not executor
+        bt_runner.shutdown()
+        with ThreadPoolExecutor() as executor:
+            bt_runner.set_executor(executor)
+            bt_runner.shutdown()
+            assert executor.submit(abs, -1).result() == 1
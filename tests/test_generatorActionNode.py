@@ -0,0 +1,78 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import call
+
+from carebt.abstractLogger import LogLevel
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.nodeStatus import NodeStatus
+from tests.generatorActionNodes import GeneratorAddTwoNumbersMultiTickAction
+from tests.generatorActionNodes import GeneratorCheckValueAction
+from tests.generatorActionNodes import GeneratorRaisingAction
+from tests.generatorActionNodes import GeneratorTimeoutAction
+from tests.global_mock import mock
+
+
+class TestGeneratorActionNode:
+    """Tests the `GeneratorActionNode`."""
+
+    ########################################################################
+
+    def test_GeneratorAddTwoNumbersMultiTickAction(self):
+        """Test that the generator is resumed with each tick until it returns."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(GeneratorAddTwoNumbersMultiTickAction, '3 3 5 => ?result')
+        print(mock.call_args_list)
+        assert mock.call_args_list == [call('GeneratorAddTwoNumbersMultiTickAction: (tick_count = 1/3) NodeStatus.IDLE'),  # noqa: E501
+                                       call('GeneratorAddTwoNumbersMultiTickAction: (tick_count = 2/3) NodeStatus.RUNNING'),  # noqa: E501
+                                       call('GeneratorAddTwoNumbersMultiTickAction: (tick_count = 3/3) NodeStatus.RUNNING'),  # noqa: E501
+                                       call('GeneratorAddTwoNumbersMultiTickAction: DONE 3 + 5 = 8'),  # noqa: E501
+                                       call('on_delete GeneratorAddTwoNumbersMultiTickAction')]
+        assert bt_runner._instance._result == 8
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 4
+
+    def test_GeneratorCheckValueAction(self):
+        """Test that the status set by the generator is kept."""
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(GeneratorCheckValueAction, '1')
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 2
+        bt_runner.get_logger().set_log_level(LogLevel.OFF)
+        bt_runner.run(GeneratorCheckValueAction, '-1')
+        assert bt_runner.get_status() == NodeStatus.FAILURE
+        assert bt_runner.get_contingency_message() == 'NEGATIVE'
+        assert bt_runner.get_tick_count() == 2
+
+    def test_GeneratorRaisingAction(self):
+        """Test that an exception raised in the generator results in FAILURE."""
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.get_logger().set_log_level(LogLevel.OFF)
+        bt_runner.run(GeneratorRaisingAction)
+        assert bt_runner.get_status() == NodeStatus.FAILURE
+        assert bt_runner.get_contingency_message() == 'ConnectionError'
+        assert bt_runner.get_tick_count() == 2
+
+    def test_GeneratorTimeoutAction(self):
+        """Test that the generator is closed on timeout."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.get_logger().set_log_level(LogLevel.OFF)
+        bt_runner.run(GeneratorTimeoutAction)
+        print(mock.call_args_list)
+        assert mock.call_args_list == [call('on_timeout GeneratorTimeoutAction'),
+                                       call('GeneratorTimeoutAction: closed')]
+        assert bt_runner.get_status() == NodeStatus.ABORTED
+        assert bt_runner.get_contingency_message() == 'TIMEOUT'
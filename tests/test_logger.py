@@ -13,13 +13,16 @@
 # limitations under the License.
 
 from io import StringIO
+import os
 import re
+from threading import Thread
 from unittest.mock import call
 from unittest.mock import patch
 
 from carebt.abstractLogger import AbstractLogger
 from carebt.abstractLogger import LogLevel
 from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.bufferedLogger import BufferedLogger
 from carebt.nodeStatus import NodeStatus
 from carebt.simplePrintLogger import SimplePrintLogger
 from tests.actionNodes import HelloWorldAction
@@ -54,8 +57,57 @@ class CustomLogger(AbstractLogger):
             mock(f'ERROR {msg}')
 
 
+class UnfilteredLogger(AbstractLogger):
+
+    def __init__(self):
+        super().__init__()
+
+    # PUBLIC
+
+    def trace(self, msg: str):
+        mock(f'TRACE {msg}')
+
+    def debug(self, msg: str):
+        mock(f'DEBUG {msg}')
+
+    def info(self, msg: str):
+        mock(f'INFO {msg}')
+
+    def warn(self, msg: str):
+        mock(f'WARN {msg}')
+
+    def error(self, msg: str):
+        mock(f'ERROR {msg}')
+
+
 class TestLogger:
 
+    def test_logger_is_enabled(self):
+        logger = SimplePrintLogger()
+        assert logger.get_log_level() == LogLevel.INFO
+        logger.set_log_level(LogLevel.WARN)
+        assert logger.get_log_level() == LogLevel.WARN
+        assert not logger.is_enabled(LogLevel.TRACE)
+        assert not logger.is_enabled(LogLevel.DEBUG)
+        assert not logger.is_enabled(LogLevel.INFO)
+        assert logger.is_enabled(LogLevel.WARN)
+        assert logger.is_enabled(LogLevel.ERROR)
+
+    def test_action_unfiltered_logger_level_warn(self):
+        """Test that disabled statements are not passed to the logger."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        logger = UnfilteredLogger()
+        logger.set_log_level(LogLevel.WARN)
+        bt_runner.set_logger(logger)
+        bt_runner.run(HelloWorldAction, '"Alice"')
+        print(mock.call_args_list)
+        assert mock.call_args_list[0] == call('__init__ HelloWorldAction')
+        assert mock.call_args_list[1] == call('HelloWorldAction: Hello Alice !!!')
+        assert mock.call_args_list[2] == call('__del__ HelloWorldAction')
+        assert all(not c.args[0].startswith(('TRACE', 'DEBUG'))
+                   for c in mock.call_args_list)
+
     @patch('sys.stdout', new_callable=StringIO)
     def test_simpleprintlogger_trace(self, mock_print):
         self.logger = SimplePrintLogger()
@@ -196,3 +248,95 @@ class TestLogger:
         assert bool(re.match(regex, mock_print.getvalue()))
         assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
         assert bt_runner._instance.get_contingency_message() == ''
+
+    def test_bufferedlogger_stream(self):
+        stream = StringIO()
+        logger = BufferedLogger(stream=stream, flush_interval_ms=10000)
+        logger.set_log_level(LogLevel.DEBUG)
+        logger.trace('trace test')
+        logger.debug('debug test')
+        logger.info('info test')
+        logger.warn('warn test')
+        logger.error('error test')
+        # the statements are written by the background thread
+        assert stream.getvalue() == ''
+        logger.flush()
+        regex = re.compile('....-..-.. ..:..:.. DEBUG debug test\n'
+                           '....-..-.. ..:..:.. INFO info test\n'
+                           '....-..-.. ..:..:.. WARN warn test\n'
+                           '....-..-.. ..:..:.. ERROR error test\n$')
+        assert bool(re.match(regex, stream.getvalue()))
+        logger.close()
+
+    def test_bufferedlogger_background_thread(self):
+        stream = StringIO()
+        logger = BufferedLogger(stream=stream, flush_interval_ms=10)
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_logger(logger)
+        bt_runner.run(HelloWorldAction, '"Alice"')
+        logger.close()
+        assert 'INFO creating HelloWorldAction\n' in stream.getvalue()
+        assert 'INFO bt execution finished\n' in stream.getvalue()
+        assert logger.get_dropped_count() == 0
+
+    def test_bufferedlogger_overflow(self):
+        stream = StringIO()
+        logger = BufferedLogger(stream=stream, queue_size=3, flush_interval_ms=10000)
+        for i in range(5):
+            logger.info(f'info {i}')
+        assert logger.get_dropped_count() == 2
+        logger.flush()
+        assert stream.getvalue().count('INFO') == 3
+        assert 'INFO info 2\n' in stream.getvalue()
+        assert 'INFO info 3\n' not in stream.getvalue()
+        logger.info('info 5')
+        logger.close()
+        assert 'INFO info 5\n' in stream.getvalue()
+
+    def test_bufferedlogger_rotating_file(self, tmp_path):
+        file_name = str(tmp_path / 'carebt.log')
+        logger = BufferedLogger(file_name=file_name, max_bytes=100, backup_count=2,
+                                flush_interval_ms=10000)
+        for i in range(10):
+            # each line has 40 characters
+            logger.info(f'info {i:09d}')
+            logger.flush()
+        logger.close()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['carebt.log',
+                                                              'carebt.log.1',
+                                                              'carebt.log.2']
+        with open(file_name) as f:
+            assert f.read().endswith('INFO info 000000009\n')
+        with open(f'{file_name}.2') as f:
+            assert 'INFO info 000000004\n' in f.read()
+
+    def test_bufferedlogger_overflow_threads(self):
+        stream = StringIO()
+        logger = BufferedLogger(stream=stream, queue_size=100, flush_interval_ms=10000)
+
+        def log() -> None:
+            for i in range(1000):
+                logger.info(f'info {i}')
+
+        threads = [Thread(target=log) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.close()
+        assert stream.getvalue().count('INFO') == 100
+        assert logger.get_dropped_count() == 7900
+
+    def test_bufferedlogger_rotating_file_non_ascii(self, tmp_path):
+        file_name = str(tmp_path / 'carebt.log')
+        logger = BufferedLogger(file_name=file_name, max_bytes=100, backup_count=5,
+                                flush_interval_ms=10000)
+        for _ in range(3):
+            # each line has 46 characters, but 66 bytes
+            logger.info('\u00e4' * 20)
+        logger.close()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['carebt.log',
+                                                              'carebt.log.1',
+                                                              'carebt.log.2']
+        for p in tmp_path.iterdir():
+            assert os.path.getsize(p) == 66
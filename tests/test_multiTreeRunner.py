@@ -0,0 +1,132 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+from threading import Thread
+from threading import Timer
+
+from carebt.abstractLogger import LogLevel
+from carebt.multiTreeRunner import MultiTreeRunner
+from carebt.nodeStatus import NodeStatus
+from tests.actionNodes import AddTwoNumbersLongRunningActionWithRequestTick
+from tests.actionNodes import BusyMultiTickAction
+from tests.sequenceNodes import AddTwoNumbersBlackboard
+
+
+class TestMultiTreeRunner:
+    """Tests the `MultiTreeRunner`."""
+
+    ########################################################################
+
+    def test_many_trees(self):
+        """Test that many trees are ticked in the same loop."""
+        runner = MultiTreeRunner()
+        runner.set_tick_rate_ms(1)
+        done = []
+        trees = [runner.add_tree(BusyMultiTickAction, f'{1 + i % 5} 0', done.append)
+                 for i in range(1000)]
+        runner.run()
+        assert runner.get_tick_count() == 5
+        assert runner.get_tree_count() == 0
+        assert len(done) == 1000
+        # trees complete in the order of their required ticks
+        assert done[:200] == trees[0::5]
+        for tree in trees:
+            assert tree.get_status() == NodeStatus.SUCCESS
+        assert [tree.get_tick_count() for tree in trees[:5]] == [1, 2, 3, 4, 5]
+
+    def test_remove_tree(self):
+        """Test that a removed tree is aborted."""
+        runner = MultiTreeRunner()
+        runner.set_tick_rate_ms(1)
+        runner.get_logger().set_log_level(LogLevel.OFF)
+        done = []
+        tree1 = runner.add_tree(BusyMultiTickAction, '3 0', done.append)
+        tree2 = runner.add_tree(BusyMultiTickAction, '1000 0', done.append)
+        runner.tick_once()
+        assert runner.get_tree_count() == 2
+        runner.remove_tree(tree2)
+        runner.run()
+        assert done == [tree1]
+        assert tree1.get_status() == NodeStatus.SUCCESS
+        assert tree2.get_status() == NodeStatus.ABORTED
+        assert tree2.get_tick_count() == 1
+
+    def test_request_tick(self):
+        """Test that a tree requesting a tick wakes up the runner."""
+        runner = MultiTreeRunner()
+        runner.set_tick_rate_ms(2000)
+        tree = runner.add_tree(AddTwoNumbersLongRunningActionWithRequestTick,
+                               '100 3 5 => ?result')
+        start = datetime.now()
+        runner.run()
+        end = datetime.now()
+        delta = end - start
+        assert int(delta.total_seconds() * 1000) >= 100
+        assert int(delta.total_seconds() * 1000) < 200
+        assert tree.get_status() == NodeStatus.SUCCESS
+        assert tree._instance._result == 8
+
+    def test_run_forever(self):
+        """Test adding trees from another thread while running forever."""
+        runner = MultiTreeRunner()
+        runner.set_tick_rate_ms(10)
+        done = []
+        thread = Thread(target=runner.run, args=(True,))
+        thread.start()
+        Timer(0.05, runner.add_tree, args=(BusyMultiTickAction, '2 0', done.append)).start()
+        Timer(0.10, runner.add_tree, args=(BusyMultiTickAction, '2 0', done.append)).start()
+        Timer(0.20, runner.stop).start()
+        thread.join(1)
+        assert not thread.is_alive()
+        assert len(done) == 2
+        assert done[0].get_status() == NodeStatus.SUCCESS
+        assert done[1].get_status() == NodeStatus.SUCCESS
+
+    def test_hosted_tree_state(self):
+        """Test that a tree uses the services of the runner and keeps only its state."""
+        runner = MultiTreeRunner()
+        runner.set_tick_rate_ms(1)
+        runner.get_logger().set_log_level(LogLevel.OFF)
+        tree = runner.add_tree(AddTwoNumbersBlackboard)
+        assert tree.get_logger() is runner.get_logger()
+        assert tree.get_clock() is runner.get_clock()
+        assert tree.get_timer_service() is runner.get_timer_service()
+        for name in ('_logger', '_clock', '_timer_service', '_wakeup', '_executor'):
+            assert name not in vars(tree)
+        tree.get_blackboard().set('a', 1)
+        tree.get_blackboard().set('b', 2)
+        runner.run()
+        assert tree.get_status() == NodeStatus.SUCCESS
+        assert tree.get_blackboard().get('total') == 13
+
+    def test_fire_timers_once_per_tick(self):
+        """Test that the timers of all trees are fired once per tick."""
+        runner = MultiTreeRunner()
+        runner.set_tick_rate_ms(1)
+        timer_service = runner.get_timer_service()
+        fire_due = timer_service.fire_due
+        sweeps = []
+
+        def count_fire_due():
+            sweeps.append(runner.get_tick_count())
+            fire_due()
+
+        timer_service.fire_due = count_fire_due
+        for _ in range(10):
+            runner.add_tree(BusyMultiTickAction, '3 0')
+        for _ in range(3):
+            runner.tick_once()
+        assert sweeps == [0, 1, 2]
+        assert runner.get_tree_count() == 0
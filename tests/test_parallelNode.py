@@ -12,24 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import call
 
 from carebt.abstractLogger import LogLevel
 from carebt.behaviorTreeRunner import BehaviorTreeRunner
 from carebt.nodeStatus import NodeStatus
+from tests.actionNodes import BlockingAction
+from tests.actionNodes import PooledAddTwoNumbersAction
 from tests.global_mock import mock
 from tests.parallelNodes import AddTwoNumbersParallel
 from tests.parallelNodes import AsyncAddChildParallel
 from tests.parallelNodes import CountAbortParallel
 from tests.parallelNodes import CountAbortParallelWithTick
+from tests.parallelNodes import NestedSharedPoolParallel
 from tests.parallelNodes import ParallelRemoveSuccess
+from tests.parallelNodes import PooledChildrenParallel
+from tests.parallelNodes import SuspendedHandlerParallel
+from tests.parallelNodes import ThreadPoolParallel
 from tests.parallelNodes import TickCountingParallel
 from tests.parallelNodes import TickCountingParallelDel
 from tests.parallelNodes import TickCountingParallelDelAdd1
 from tests.parallelNodes import TickCountingParallelDelAdd2
 from tests.parallelNodes import TickCountingParallelDelAllAdd
 from tests.parallelNodes import TickCountingParallelWithAbort
+from tests.parallelNodes import TrackedCounterParallel
+from tests.sequenceNodes import PooledAddTwoNumbersSequence
 
 ########################################################################
 
@@ -621,3 +630,157 @@ class TestParallelNode:
                                        call('__del__ HelloWorldAction'),
                                        call('HelloWorldAction: Hello World !!!'),
                                        call('__del__ HelloWorldAction')]
+
+    ########################################################################
+
+    def test_TrackedCounterParallel(self):
+        """Test that only changed parameters are bound with `track_param_changes`."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_tick_rate_ms(10)
+        bt_runner.run(TrackedCounterParallel)
+        assert mock.call_args_list == [call('TrackedEchoAction None'),
+                                       call("TrackedCounterParallel changed ['?count']"),
+                                       call('TrackedEchoAction 2'),
+                                       call("TrackedCounterParallel changed ['?count']"),
+                                       call('TrackedEchoAction 2'),
+                                       call('TrackedCounterParallel changed []'),
+                                       call('TrackedEchoAction 4'),
+                                       call("TrackedCounterParallel changed ['?count']"),
+                                       call('TrackedEchoAction 4'),
+                                       call('TrackedCounterParallel changed []'),
+                                       call('TrackedEchoAction 6'),
+                                       call("TrackedCounterParallel changed ['?count']")]
+        assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
+        assert bt_runner._instance.get_contingency_message() == ''
+
+    def test_TickCountingParallel_active_children(self):
+        """Test that only the active children are ticked.
+
+        The completed children are removed from the active children of the
+        `ParallelNode`, thus they are no longer visited in the following ticks.
+
+        """
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.start(TickCountingParallel, '3 1 True 3 True 2 True')
+        assert bt_runner.tick_once() == NodeStatus.RUNNING
+        parallel = bt_runner._instance._child_ec_list[0].instance
+        assert [child_ec.instance._id for child_ec in parallel._active_children] == [2, 3]
+        assert bt_runner.tick_once() == NodeStatus.RUNNING
+        assert [child_ec.instance._id for child_ec in parallel._active_children] == [2]
+        assert len(parallel._suspended_children) == 0
+        assert bt_runner.tick_once() == NodeStatus.SUCCESS
+        assert len(parallel._active_children) == 0
+
+    def test_ThreadPoolParallel(self):
+        """Test the `ThreadPoolParallel` node.
+
+        The three children block for 200 ms each, but are ticked concurrently
+        by the threads of the pool.
+
+        """
+        mock.reset_mock()
+        BlockingAction.ticks.clear()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(ThreadPoolParallel, 'True True True')
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        # all three ticks overlap
+        assert len(BlockingAction.ticks) == 3
+        assert max(start for _, _, start, _ in BlockingAction.ticks) \
+            < min(end for _, _, _, end in BlockingAction.ticks)
+        calls = [c.args[0] for c in mock.call_args_list]
+        assert calls[:3] == ['on_init BlockingAction id = 1',
+                             'on_init BlockingAction id = 2',
+                             'on_init BlockingAction id = 3']
+        for i, c in enumerate(calls[3:]):
+            assert c.startswith(f'on_delete BlockingAction id = {i + 1} thread = pool_')
+        assert len(calls) == 6
+
+    def test_ThreadPoolParallel_failure(self):
+        """Test the `ThreadPoolParallel` node with two failing children.
+
+        The contingency-handlers are executed in the order the children were
+        added, and the contingency-message of the latter failing child is used.
+
+        """
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.get_logger().set_log_level(LogLevel.ERROR)
+        bt_runner.run(ThreadPoolParallel, 'True False False')
+        assert bt_runner.get_status() == NodeStatus.FAILURE
+        assert bt_runner.get_contingency_message() == 'FAILED_3'
+        calls = [c.args[0] for c in mock.call_args_list]
+        assert calls[3].startswith('on_delete BlockingAction id = 1 thread = pool_')
+        assert calls[4] == 'ThreadPoolParallel: failed_handler child = 1'
+        assert calls[5].startswith('on_delete BlockingAction id = 2 thread = pool_')
+        assert calls[6] == 'ThreadPoolParallel: failed_handler child = 2'
+        assert calls[7].startswith('on_delete BlockingAction id = 3 thread = pool_')
+        assert len(calls) == 8
+
+    def test_SuspendedHandlerParallel(self):
+        """Test that the contingencies of a `SUSPENDED` child are applied with each tick."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(SuspendedHandlerParallel, '=> ?waits')
+        assert mock.call_args_list == [call('__init__ TickCountingAction'),
+                                       call('on_init TickCountingAction id = 1'),
+                                       call('TickCountingAction id = 1 tick: 1/3'),
+                                       call('SuspendedWaitAction: suspend'),
+                                       call('SuspendedHandlerParallel: suspended_handler waits = None'),  # noqa: E501
+                                       call('TickCountingAction id = 1 tick: 2/3'),
+                                       call('SuspendedHandlerParallel: suspended_handler waits = 1'),  # noqa: E501
+                                       call('TickCountingAction id = 1 DONE with SUCCESS'),
+                                       call('on_delete TickCountingAction id = 1'),
+                                       call('__del__ TickCountingAction id = 1'),
+                                       call('SuspendedHandlerParallel: suspended_handler waits = 2'),  # noqa: E501
+                                       call('on_delete SuspendedWaitAction waits = 3')]
+        assert bt_runner._instance._waits == 3
+        assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
+
+    def test_NestedSharedPoolParallel(self):
+        """Test nested `ParallelNodes` which share a pool with two threads.
+
+        The outer node occupies both threads, thus the nested nodes tick their
+        children inline instead of waiting for a free thread.
+
+        """
+        mock.reset_mock()
+        BlockingAction.ticks.clear()
+        bt_runner = BehaviorTreeRunner()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            bt_runner.set_executor(executor)
+            bt_runner.run(NestedSharedPoolParallel)
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        # each nested node ticks its two children inline in one of the two
+        # threads, the ticks of the two threads overlap
+        assert len(BlockingAction.ticks) == 4
+        threads = {thread for _, thread, _, _ in BlockingAction.ticks}
+        assert len(threads) == 2
+        first, second = ([tick for tick in BlockingAction.ticks if tick[1] == thread]
+                         for thread in threads)
+        assert len(first) == 2 and len(second) == 2
+        assert max(first[0][2], second[0][2]) < min(first[0][3], second[0][3])
+
+    def test_PooledChildrenParallel(self):
+        """Test pooled grandchildren of a `ParallelNode` ticked by a thread pool.
+
+        The pooled instances are acquired and released concurrently, but each
+        instance is used by one child at a time and is returned to the pool
+        exactly once.
+
+        """
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.get_logger().set_log_level(LogLevel.OFF)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            bt_runner.set_executor(executor)
+            for _ in range(20):
+                bt_runner.run(PooledChildrenParallel)
+                assert bt_runner.get_status() == NodeStatus.SUCCESS
+                for i in range(8):
+                    assert bt_runner.get_blackboard().get(f'c{i}') == 2 * i + 1
+                    bt_runner.get_blackboard().set(f'c{i}', None)
+        for pool in bt_runner._node_pool.values():
+            assert len({id(instance) for instance in pool}) == len(pool)
+        assert len(bt_runner._node_pool[PooledAddTwoNumbersSequence]) <= 8
+        assert len(bt_runner._node_pool[PooledAddTwoNumbersAction]) <= 16
@@ -0,0 +1,108 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import call
+
+from carebt.abstractLogger import LogLevel
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.nodeStatus import NodeStatus
+import pytest
+from tests.global_mock import mock
+from tests.processActionNodes import ProcessDivModAction
+from tests.processActionNodes import ProcessFibonacciAction
+from tests.processActionNodes import ProcessInvalidResultAction
+from tests.processActionNodes import ProcessTimeoutAction
+
+
+class TestProcessActionNode:
+    """Tests the `ProcessActionNode`."""
+
+    ########################################################################
+
+    def test_ProcessFibonacciAction(self):
+        """Test that the in-params are sent to and the result is received from the process."""
+        mock.reset_mock()
+        with BehaviorTreeRunner() as bt_runner:
+            bt_runner.run(ProcessFibonacciAction, '20 => ?fib')
+        print(mock.call_args_list)
+        assert mock.call_args_list == [call('on_delete ProcessFibonacciAction: 20 -> 6765')]
+        assert bt_runner._instance._fib == 6765
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+
+    def test_ProcessDivModAction(self):
+        """Test that a tuple result is assigned to the out-params."""
+        bt_runner = BehaviorTreeRunner()
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            bt_runner.set_process_executor(executor)
+            assert bt_runner.get_process_executor() is executor
+            bt_runner.run(ProcessDivModAction, '17 5 => ?q ?r')
+        assert bt_runner._instance._q == 3
+        assert bt_runner._instance._r == 2
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+
+    def test_ProcessDivModAction_failure(self):
+        """Test that an exception raised in the process results in FAILURE."""
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.get_logger().set_log_level(LogLevel.OFF)
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            bt_runner.set_process_executor(executor)
+            bt_runner.run(ProcessDivModAction, '17 0 => ?q ?r')
+        assert bt_runner.get_status() == NodeStatus.FAILURE
+        assert bt_runner.get_contingency_message() == 'ZeroDivisionError'
+
+    def test_ProcessTimeoutAction(self):
+        """Test that the result is ignored after a timeout."""
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.get_logger().set_log_level(LogLevel.OFF)
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            bt_runner.set_process_executor(executor)
+            bt_runner.run(ProcessTimeoutAction)
+            assert bt_runner.get_status() == NodeStatus.ABORTED
+            assert bt_runner.get_contingency_message() == 'TIMEOUT'
+        # the executor waited until the running compute returned
+        print(mock.call_args_list)
+        assert mock.call_args_list == [call('on_timeout ProcessTimeoutAction')]
+
+    def test_ProcessInvalidResultAction(self):
+        """Test that a result which does not match the out-params results in FAILURE."""
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.get_logger().set_log_level(LogLevel.OFF)
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            bt_runner.set_process_executor(executor)
+            for result in ['1', '(1,2,3)', '(1,)']:
+                bt_runner.run(ProcessInvalidResultAction, f'{result} => ?a ?b')
+                assert bt_runner.get_status() == NodeStatus.FAILURE
+                assert bt_runner.get_contingency_message() == 'INVALID_RESULT'
+            bt_runner.run(ProcessInvalidResultAction, '(1,2) => ?a ?b')
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner._instance._a == 1
+        assert bt_runner._instance._b == 2
+
+    def test_shutdown(self):
+        """Test that only the process executor created by the runner is shut down."""
+        bt_runner = BehaviorTreeRunner()
+        executor = bt_runner.get_process_executor()
+        assert executor._mp_context.get_start_method() == 'spawn'
+        bt_runner.run(ProcessFibonacciAction, '10 => ?fib')
+        bt_runner.shutdown()
+        with pytest.raises(RuntimeError):
+            executor.submit(abs, -1)
+        assert bt_runner.get_process_executor() is not executor
+        bt_runner.shutdown()
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            bt_runner.set_process_executor(executor)
+            bt_runner.shutdown()
+            assert executor.submit(abs, -1).result() == 1
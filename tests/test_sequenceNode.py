@@ -17,8 +17,10 @@ from unittest.mock import call
 
 from carebt.behaviorTreeRunner import BehaviorTreeRunner
 from carebt.nodeStatus import NodeStatus
+from tests.actionNodes import PooledAddTwoNumbersAction
 from tests.global_mock import mock
 from tests.sequenceNodes import AddTwoNumbersDynamic
+from tests.sequenceNodes import AddTwoNumbersMultiTickSequence
 from tests.sequenceNodes import AddTwoNumbersSequence1
 from tests.sequenceNodes import AddTwoNumbersSequence1a
 from tests.sequenceNodes import AddTwoNumbersSequence2
@@ -30,6 +32,10 @@ from tests.sequenceNodes import AddTwoNumbersSequence7
 from tests.sequenceNodes import AddTwoNumbersSequence8
 from tests.sequenceNodes import AddTwoNumbersSequence9
 from tests.sequenceNodes import AsyncAddChildSequence
+from tests.sequenceNodes import ForeignHandlerSequence
+from tests.sequenceNodes import PooledAddTwoNumbersSequence
+from tests.sequenceNodes import PooledRetrySequence
+from tests.sequenceNodes import PrebuiltPooledSequence
 from tests.sequenceNodes import RemoveAllChildrenSequence
 from tests.sequenceNodes import SequenceWithSuccessMessage_1
 from tests.sequenceNodes import SequenceWithSuccessMessage_2
@@ -559,8 +565,8 @@ class TestSequenceNode:
                                        call('AddTwoNumbersSequence8: on_timeout'),
                                        call('on_abort AddTwoNumbersLongRunningActionWithAbort'),
                                        call('on_delete AddTwoNumbersLongRunningActionWithAbort'),
-                                       call('on_abort AddTwoNumbersSequence8'),
                                        call('__del__ AddTwoNumbersLongRunningActionWithAbort'),
+                                       call('on_abort AddTwoNumbersSequence8'),
                                        call('on_delete AddTwoNumbersSequence8'),
                                        call('__del__ AddTwoNumbersSequence8')]
 
@@ -710,3 +716,148 @@ class TestSequenceNode:
                                        call('ShowNumberAction: The numer is: 14!'),
                                        call('on_delete ShowNumberAction'),
                                        call('__del__ ShowNumberAction')]
+
+    def test_PooledRetrySequence(self):
+        """Test the `PooledRetrySequence` node.
+
+        The completed instances of the `PooledAddTwoNumbersSequence` and the
+        `PooledAddTwoNumbersAction` are reset and reused for the retry and
+        the next run. The children added in `__init__` are kept, the ones
+        added in `on_init` are added again.
+
+        """
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(PooledRetrySequence)
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        expected = [call('__init__ PooledRetrySequence'),
+                    call('on_init PooledRetrySequence'),
+                    call('__init__ PooledAddTwoNumbersSequence'),
+                    call('on_init PooledAddTwoNumbersSequence'),
+                    call('__init__ PooledAddTwoNumbersAction'),
+                    call('on_init PooledAddTwoNumbersAction'),
+                    call('PooledAddTwoNumbersAction: NOT_TWO_NUMBERS_PROVIDED'),
+                    call('on_delete PooledAddTwoNumbersAction'),
+                    call('reset PooledAddTwoNumbersAction'),
+                    call('PooledRetrySequence: retry_handler'),
+                    call('on_delete PooledAddTwoNumbersSequence'),
+                    call('reset PooledAddTwoNumbersSequence'),
+                    call('on_init PooledAddTwoNumbersSequence'),
+                    call('on_init PooledAddTwoNumbersAction'),
+                    call('PooledAddTwoNumbersAction: calculating: 1 + 2 = 3'),
+                    call('on_delete PooledAddTwoNumbersAction'),
+                    call('reset PooledAddTwoNumbersAction'),
+                    call('on_init PooledAddTwoNumbersAction'),
+                    call('PooledAddTwoNumbersAction: calculating: 3 + 1 = 4'),
+                    call('on_delete PooledAddTwoNumbersAction'),
+                    call('reset PooledAddTwoNumbersAction'),
+                    call('on_delete PooledAddTwoNumbersSequence'),
+                    call('reset PooledAddTwoNumbersSequence'),
+                    call('on_init PooledAddTwoNumbersSequence'),
+                    call('on_init PooledAddTwoNumbersAction'),
+                    call('PooledAddTwoNumbersAction: calculating: 4 + 3 = 7'),
+                    call('on_delete PooledAddTwoNumbersAction'),
+                    call('reset PooledAddTwoNumbersAction'),
+                    call('on_init PooledAddTwoNumbersAction'),
+                    call('PooledAddTwoNumbersAction: calculating: 7 + 1 = 8'),
+                    call('on_delete PooledAddTwoNumbersAction'),
+                    call('reset PooledAddTwoNumbersAction'),
+                    call('on_delete PooledAddTwoNumbersSequence'),
+                    call('reset PooledAddTwoNumbersSequence'),
+                    call('__init__ ShowNumberAction'),
+                    call('on_init ShowNumberAction'),
+                    call('ShowNumberAction: The numer is: 8!'),
+                    call('on_delete ShowNumberAction'),
+                    call('__del__ ShowNumberAction'),
+                    call('__del__ PooledRetrySequence')]
+        assert mock.call_args_list == expected
+        assert len(bt_runner._node_pool[PooledAddTwoNumbersSequence]) == 1
+        assert len(bt_runner._node_pool[PooledAddTwoNumbersAction]) == 1
+
+        # the pooled instances are reused by the next run
+        mock.reset_mock()
+        bt_runner.run(PooledRetrySequence)
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert mock.call_args_list == [c for c in expected
+                                       if c not in (call('__init__ PooledAddTwoNumbersSequence'),
+                                                    call('__init__ PooledAddTwoNumbersAction'))]
+
+        bt_runner.clear_node_pool()
+        assert len(bt_runner._node_pool) == 0
+
+    def test_PrebuiltPooledSequence_abort(self):
+        """Test aborting a sequence with a prebuilt child.
+
+        The prebuilt child which is not reached is deleted and returned to
+        the pool.
+
+        """
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_prebuild_next_child(True)
+        bt_runner.start(PrebuiltPooledSequence)
+        bt_runner.tick_once()
+        bt_runner.abort()
+        print(mock.call_args_list)
+        assert bt_runner.get_status() == NodeStatus.ABORTED
+        assert mock.call_args_list == [call('__init__ AddTwoNumbersMultiTickAction'),
+                                       call('on_init AddTwoNumbersMultiTickAction'),
+                                       call('AddTwoNumbersMultiTickAction: (tick_count = 1/2)'),
+                                       call('__init__ PooledAddTwoNumbersAction'),
+                                       call('on_delete AddTwoNumbersMultiTickAction'),
+                                       call('__del__ AddTwoNumbersMultiTickAction'),
+                                       call('on_delete PooledAddTwoNumbersAction'),
+                                       call('reset PooledAddTwoNumbersAction')]
+        assert len(bt_runner._node_pool[PooledAddTwoNumbersAction]) == 1
+
+    def test_AddTwoNumbersMultiTickSequence_prebuild(self):
+        """Test the `AddTwoNumbersMultiTickSequence` node with prebuilt children.
+
+        The next child is created while the current child is running, but
+        `on_init` is called when the child is reached.
+
+        """
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.set_tick_rate_ms(10)
+        bt_runner.set_prebuild_next_child(True)
+        bt_runner.run(AddTwoNumbersMultiTickSequence)
+        assert bt_runner.get_status() == NodeStatus.SUCCESS
+        assert bt_runner.get_tick_count() == 7
+        assert mock.call_args_list == [call('__init__ AddTwoNumbersMultiTickSequence'),
+                                       call('on_init AddTwoNumbersMultiTickSequence'),
+                                       call('__init__ AddTwoNumbersMultiTickAction'),
+                                       call('on_init AddTwoNumbersMultiTickAction'),
+                                       call('AddTwoNumbersMultiTickAction: (tick_count = 1/2)'),
+                                       call('__init__ AddTwoNumbersMultiTickAction'),
+                                       call('AddTwoNumbersMultiTickAction: (tick_count = 2/2)'),
+                                       call('AddTwoNumbersMultiTickAction: DONE 1 + 2 = 3'),
+                                       call('on_delete AddTwoNumbersMultiTickAction'),
+                                       call('__del__ AddTwoNumbersMultiTickAction'),
+                                       call('on_init AddTwoNumbersMultiTickAction'),
+                                       call('AddTwoNumbersMultiTickAction: (tick_count = 1/2)'),
+                                       call('__init__ ShowNumberAction'),
+                                       call('AddTwoNumbersMultiTickAction: (tick_count = 2/2)'),
+                                       call('AddTwoNumbersMultiTickAction: DONE 3 + 5 = 8'),
+                                       call('on_delete AddTwoNumbersMultiTickAction'),
+                                       call('__del__ AddTwoNumbersMultiTickAction'),
+                                       call('on_init ShowNumberAction'),
+                                       call('ShowNumberAction: The numer is: 8!'),
+                                       call('on_delete ShowNumberAction'),
+                                       call('__del__ ShowNumberAction'),
+                                       call('__del__ AddTwoNumbersMultiTickSequence')]
+
+    def test_ForeignHandlerSequence(self):
+        """Test the `ForeignHandlerSequence` node.
+
+        A contingency-handler which is not a method of the node is looked up
+        by its name on the node.
+        """
+        mock.reset_mock()
+        bt_runner = BehaviorTreeRunner()
+        bt_runner.run(ForeignHandlerSequence, '1')
+        assert bt_runner._instance.get_status() == NodeStatus.SUCCESS
+        assert call('ForeignHandlerSequence: fix_missing_numbers_handler') \
+            in mock.call_args_list
+        assert call('ForeignHandler: fix_missing_numbers_handler') \
+            not in mock.call_args_list
@@ -0,0 +1,97 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from io import StringIO
+from unittest.mock import patch
+
+from carebt.abstractLogger import LogLevel
+from carebt.nodeStatus import NodeStatus
+from carebt.shardedTreeRunner import ShardedTreeRunner
+from tests.actionNodes import AddTwoNumbersActionWithFailure
+from tests.actionNodes import BusyMultiTickAction
+from tests.actionNodes import ExitProcessAction
+from tests.actionNodes import RaisingAction
+from tests.sequenceNodes import AddTwoNumbersSequence3
+
+
+class TestShardedTreeRunner:
+    """Tests the `ShardedTreeRunner`."""
+
+    ########################################################################
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_sharded_trees(self, mock_print):
+        """Test that the results of the trees are available in the parent process."""
+        with ShardedTreeRunner(processes=2, tick_rate_ms=10, log_level=LogLevel.OFF) as runner:
+            done = []
+            trees = [runner.add_tree(BusyMultiTickAction, '3 0', done.append)
+                     for _ in range(10)]
+            tree_failure = runner.add_tree(AddTwoNumbersActionWithFailure, '1')
+            tree_history = runner.add_tree(AddTwoNumbersSequence3, '1')
+            assert runner.wait(10)
+            assert runner.get_tree_count() == 0
+        assert sorted(done, key=lambda tree: tree._tree_id) == trees
+        for tree in trees:
+            assert tree.get_status() == NodeStatus.SUCCESS
+            assert tree.get_tick_count() == 3
+        assert tree_failure.get_status() == NodeStatus.FAILURE
+        assert tree_failure.get_contingency_message() == 'NOT_TWO_NUMBERS_PROVIDED'
+        assert tree_history.get_status() == NodeStatus.SUCCESS
+        assert tree_history.get_contingency_message() == 'MISSING_NUMBERS_FIXED'
+        assert len(tree_history.get_contingency_history()) == 1
+        entry = tree_history.get_contingency_history()[0]
+        assert entry.node_name == 'AddTwoNumbersActionWithFailure'
+        assert entry.status == NodeStatus.FAILURE
+        assert entry.function == 'fix_missing_numbers_handler'
+
+    def test_remove_and_shutdown(self):
+        """Test that removed trees and trees running at shutdown are aborted."""
+        with ShardedTreeRunner(processes=1, tick_rate_ms=10, log_level=LogLevel.OFF) as runner:
+            tree1 = runner.add_tree(BusyMultiTickAction, '100000 0')
+            tree2 = runner.add_tree(BusyMultiTickAction, '100000 0')
+            runner.remove_tree(tree1)
+            assert tree1.wait(10)
+        assert tree1.get_status() == NodeStatus.ABORTED
+        assert tree2.wait(10)
+        assert tree2.get_status() == NodeStatus.ABORTED
+
+    def test_raising_tree(self):
+        """Test that a tree raising an exception fails and the others continue."""
+        with ShardedTreeRunner(processes=1, tick_rate_ms=10, log_level=LogLevel.OFF) as runner:
+            tree1 = runner.add_tree(BusyMultiTickAction, '3 0')
+            tree2 = runner.add_tree(RaisingAction)
+            tree3 = runner.add_tree(BusyMultiTickAction, '5 0')
+            assert tree2.wait(3)
+            assert tree1.wait(3)
+            assert tree3.wait(3)
+        assert tree2.get_status() == NodeStatus.FAILURE
+        assert tree2.get_contingency_message() == 'RuntimeError: tick failed'
+        assert tree1.get_status() == NodeStatus.SUCCESS
+        assert tree3.get_status() == NodeStatus.SUCCESS
+
+    def test_dead_worker(self):
+        """Test that the trees of a worker process which dies fail."""
+        with ShardedTreeRunner(processes=1, tick_rate_ms=10, log_level=LogLevel.OFF) as runner:
+            tree1 = runner.add_tree(BusyMultiTickAction, '100000 0')
+            tree2 = runner.add_tree(ExitProcessAction)
+            assert tree1.wait(3)
+            assert tree2.wait(3)
+            assert runner.get_tree_count() == 0
+            tree3 = runner.add_tree(BusyMultiTickAction, '3 0')
+            assert tree3.wait(3)
+        assert tree1.get_status() == NodeStatus.FAILURE
+        assert tree1.get_contingency_message() == 'worker process exited with code 3'
+        assert tree2.get_status() == NodeStatus.FAILURE
+        assert tree3.get_status() == NodeStatus.FAILURE
+        assert tree3.get_contingency_message() == 'no worker process alive'
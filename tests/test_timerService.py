@@ -0,0 +1,111 @@
+# Copyright 2022 Andreas Steck (steck.andi@gmail.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+from threading import active_count
+from time import sleep
+
+from carebt.abstractLogger import LogLevel
+from carebt.behaviorTreeRunner import BehaviorTreeRunner
+from carebt.multiTreeRunner import MultiTreeRunner
+from carebt.nodeStatus import NodeStatus
+from carebt.timerService import TimerService
+from tests.actionNodes import TimeoutThreadAction
+
+
+class TestTimerService:
+    """Tests the `TimerService`."""
+
+    ########################################################################
+
+    def test_fire_due(self):
+        """Test that only expired timers are fired in the order of their deadlines."""
+        timer_service = TimerService()
+        fired = []
+        timer_service.schedule(0.02, lambda: fired.append('b'))
+        timer_service.schedule(0.01, lambda: fired.append('a'))
+        timer_service.schedule(0.01, lambda: fired.append('a2'))
+        timer_service.schedule(10, lambda: fired.append('c'))
+        assert timer_service.get_timer_count() == 4
+        timer_service.fire_due()
+        assert fired == []
+        sleep(0.03)
+        timer_service.fire_due()
+        assert fired == ['a', 'a2', 'b']
+        assert timer_service.get_timer_count() == 1
+
+    def test_cancel(self):
+        """Test that a canceled timer is not fired and its callback is released."""
+        timer_service = TimerService()
+        fired = []
+        timer1 = timer_service.schedule(0, lambda: fired.append(1))
+        timer2 = timer_service.schedule(0, lambda: fired.append(2))
+        assert timer1.is_active()
+        timer_service.cancel(timer1)
+        timer_service.cancel(timer1)
+        assert not timer1.is_active()
+        assert timer1._callback is None
+        timer_service.fire_due()
+        assert fired == [2]
+        assert not timer2.is_active()
+        assert timer_service.get_timer_count() == 0
+        assert timer_service.get_next_deadline() is None
+
+    def test_cancel_many(self):
+        """Test that canceled timers do not accumulate in the heap."""
+        timer_service = TimerService()
+        timers = [timer_service.schedule(10 + i, lambda: None) for i in range(1000)]
+        for timer in timers[1:]:
+            timer_service.cancel(timer)
+        assert timer_service.get_timer_count() == 1
+        assert len(timer_service._TimerService__heap) < 200
+
+    def test_on_schedule(self):
+        """Test that `on_schedule` is only called for a new earliest timer."""
+        calls = []
+        timer_service = TimerService(lambda: calls.append(1))
+        timer_service.schedule(1, lambda: None)
+        timer_service.schedule(2, lambda: None)
+        timer_service.schedule(0.5, lambda: None)
+        assert len(calls) == 2
+
+    def test_timeout_in_tick_thread(self):
+        """Test that `on_timeout` is called in the thread which ticks the tree."""
+        bt_runner = BehaviorTreeRunner()
+        start = datetime.now()
+        bt_runner.run(TimeoutThreadAction, '120')
+        end = datetime.now()
+        delta = end - start
+        assert int(delta.total_seconds() * 1000) >= 120
+        assert int(delta.total_seconds() * 1000) < 200
+        assert bt_runner.get_status() == NodeStatus.ABORTED
+        assert bt_runner.get_contingency_message() == 'MainThread'
+        assert bt_runner.get_timer_service().get_timer_count() == 0
+
+    def test_many_timeouts(self):
+        """Test that many timeouts do not create threads."""
+        runner = MultiTreeRunner()
+        runner.get_logger().set_log_level(LogLevel.OFF)
+        runner.set_tick_rate_ms(10)
+        threads = active_count()
+        thread_counts = []
+        trees = [runner.add_tree(TimeoutThreadAction, f'{50 + i % 50}',
+                                 lambda tree: thread_counts.append(active_count()))
+                 for i in range(2000)]
+        runner.run()
+        assert thread_counts == [threads] * 2000
+        for tree in trees:
+            assert tree.get_status() == NodeStatus.ABORTED
+            assert tree.get_contingency_message() == 'MainThread'
+        assert runner.get_timer_service().get_timer_count() == 0